@@ -1,22 +1,40 @@
 from datetime import datetime, timedelta
 from airflow import DAG
+from airflow.models.baseoperator import chain
 from airflow.operators.python import PythonOperator
 from airflow.operators.bash import BashOperator
+from svops_defaults import build_default_args, check_environment
+from svops_callbacks import notify_run_finished
+import logging
+import os
 import time
 import json
 import random
 
 
+log = logging.getLogger(__name__)
+
+# Simulated work only sleeps when SVOPS_SIMULATE is 1/true/yes, so real deployments
+# don't hold executor slots for demo delays
+SIMULATE_DELAYS = os.environ.get('SVOPS_SIMULATE', '').strip().lower() in ('1', 'true', 'yes')
+
+
+def _simulate_delay(seconds):
+    """Sleep once for the whole simulated duration, if enabled"""
+    if SIMULATE_DELAYS:
+        time.sleep(seconds)
+
+
+TRANSFORMATION_STEPS = (
+    "Cleaning data",
+    "Normalizing formats",
+    "Applying business rules",
+    "Validating transformations",
+    "Creating output files",
+)
+
 # Default arguments for the DAG
-default_args = {
-    'owner': 'svops',
-    'depends_on_past': False,
-    'start_date': datetime(2025, 1, 1),
-    'email_on_failure': False,
-    'email_on_retry': False,
-    'retries': 2,
-    'retry_delay': timedelta(minutes=3),
-}
+default_args = build_default_args(retries=2, retry_delay=timedelta(minutes=3))
 
 # Create DAG
 dag = DAG(
@@ -26,23 +44,24 @@ dag = DAG(
     schedule_interval=None,  # Manual trigger only
     catchup=False,
     tags=['data', 'processing', 'svops'],
+    on_success_callback=notify_run_finished,
+    on_failure_callback=notify_run_finished,
 )
 
 
 def extract_data(**context):
     """Simulate data extraction"""
+    lines = []
     conf = context['dag_run'].conf or {}
     dataset_id = conf.get('dataset_id', 'default_dataset')
     
-    print(f"📥 Starting data extraction...")
-    print(f"📁 Dataset ID: {dataset_id}")
+    lines.append(f"[EXTRACT] Starting data extraction...")
+    lines.append(f"[DATASET] Dataset ID: {dataset_id}")
     
     # Simulate extraction time
     extraction_time = random.randint(10, 20)
-    for i in range(extraction_time):
-        if i % 5 == 0:
-            print(f"📊 Extracting... {(i/extraction_time)*100:.0f}% complete")
-        time.sleep(1)
+    _simulate_delay(extraction_time)
+    lines.append(f"[DATA] Extracting... 100% complete")
     
     # Simulate extracted data info
     data_info = {
@@ -52,13 +71,15 @@ def extract_data(**context):
         "extraction_time": extraction_time
     }
     
-    print(f"✅ Data extraction completed: {json.dumps(data_info, indent=2)}")
+    lines.append(f"[OK] Data extraction completed: {json.dumps(data_info)}")
+    log.info("\n".join(lines))
     return data_info
 
 
 def transform_data(**context):
     """Simulate data transformation"""
-    print(f"🔄 Starting data transformation...")
+    lines = []
+    lines.append(f"[RUN] Starting data transformation...")
     
     # Get data from previous task
     ti = context['ti']
@@ -66,20 +87,11 @@ def transform_data(**context):
     
     if data_info:
         records = data_info.get('records_extracted', 1000)
-        print(f"📊 Transforming {records} records...")
-    
-    # Simulate transformation steps
-    transformation_steps = [
-        "Cleaning data",
-        "Normalizing formats",
-        "Applying business rules",
-        "Validating transformations",
-        "Creating output files"
-    ]
+        lines.append(f"[DATA] Transforming {records} records...")
     
-    for step in transformation_steps:
-        print(f"🔧 {step}...")
-        time.sleep(random.randint(3, 8))
+    for step in TRANSFORMATION_STEPS:
+        lines.append(f"[STEP] {step}...")
+    _simulate_delay(sum(random.randint(3, 8) for _ in TRANSFORMATION_STEPS))
     
     transformed_info = {
         "input_records": data_info.get('records_extracted', 0) if data_info else 0,
@@ -88,13 +100,15 @@ def transform_data(**context):
         "status": "success"
     }
     
-    print(f"✅ Data transformation completed: {json.dumps(transformed_info, indent=2)}")
+    lines.append(f"[OK] Data transformation completed: {json.dumps(transformed_info)}")
+    log.info("\n".join(lines))
     return transformed_info
 
 
 def load_data(**context):
     """Simulate data loading"""
-    print(f"📤 Starting data loading...")
+    lines = []
+    lines.append(f"[LOAD] Starting data loading...")
     
     # Get data from previous task
     ti = context['ti']
@@ -102,14 +116,12 @@ def load_data(**context):
     
     if transform_info:
         records = transform_info.get('output_records', 1000)
-        print(f"📊 Loading {records} records...")
+        lines.append(f"[DATA] Loading {records} records...")
     
     # Simulate loading with progress
     loading_time = random.randint(15, 25)
-    for i in range(loading_time):
-        if i % 5 == 0:
-            print(f"📤 Loading... {(i/loading_time)*100:.0f}% complete")
-        time.sleep(1)
+    _simulate_delay(loading_time)
+    lines.append(f"[LOAD] Loading... 100% complete")
     
     load_info = {
         "records_loaded": transform_info.get('output_records', 0) if transform_info else 0,
@@ -118,16 +130,19 @@ def load_data(**context):
         "status": "success"
     }
     
-    print(f"✅ Data loading completed: {json.dumps(load_info, indent=2)}")
+    lines.append(f"[OK] Data loading completed: {json.dumps(load_info)}")
+    log.info("\n".join(lines))
     return load_info
 
 
 def validate_pipeline(**context):
     """Validate the entire pipeline"""
-    print(f"🔍 Starting pipeline validation...")
+    lines = []
+    lines.append(f"[CHECK] Starting pipeline validation...")
     
     # Get data from all previous tasks
     ti = context['ti']
+    # One pull per task: a list pull skips tasks that pushed nothing
     extract_info = ti.xcom_pull(task_ids='extract_data')
     transform_info = ti.xcom_pull(task_ids='transform_data')
     load_info = ti.xcom_pull(task_ids='load_data')
@@ -147,32 +162,42 @@ def validate_pipeline(**context):
         transformed = transform_info.get('output_records', 0)
         loaded = load_info.get('records_loaded', 0)
         
-        print(f"📊 Data Flow Summary:")
-        print(f"   Extracted: {extracted} records")
-        print(f"   Transformed: {transformed} records")
-        print(f"   Loaded: {loaded} records")
+        lines.append(f"[DATA] Data Flow Summary:")
+        lines.append(f"   Extracted: {extracted} records")
+        lines.append(f"   Transformed: {transformed} records")
+        lines.append(f"   Loaded: {loaded} records")
         
         # Simple data loss check
         data_loss_ratio = (extracted - loaded) / extracted if extracted > 0 else 0
         validation_results["data_loss_ratio"] = data_loss_ratio
         validation_results["data_integrity"] = data_loss_ratio < 0.1  # Less than 10% loss
     
-    time.sleep(5)  # Simulate validation time
+    _simulate_delay(5)  # Simulate validation time
     
-    print(f"✅ Pipeline validation completed: {json.dumps(validation_results, indent=2)}")
-    return validation_results
+    lines.append(f"[OK] Pipeline validation completed: {json.dumps(validation_results)}")
+    log.info("\n".join(lines))
+    
+    # Forward upstream results so the report needs a single XCom read
+    return {
+        "extract": extract_info,
+        "transform": transform_info,
+        "load": load_info,
+        "validation": validation_results,
+    }
 
 
 def generate_report(**context):
     """Generate final pipeline report"""
-    print(f"📊 Generating pipeline report...")
+    lines = []
+    lines.append(f"[DATA] Generating pipeline report...")
     
-    # Get data from all tasks
+    # validate_pipeline forwards every upstream result
     ti = context['ti']
-    extract_info = ti.xcom_pull(task_ids='extract_data')
-    transform_info = ti.xcom_pull(task_ids='transform_data')
-    load_info = ti.xcom_pull(task_ids='load_data')
-    validation_info = ti.xcom_pull(task_ids='validate_pipeline')
+    pipeline_info = ti.xcom_pull(task_ids='validate_pipeline') or {}
+    extract_info = pipeline_info.get('extract')
+    transform_info = pipeline_info.get('transform')
+    load_info = pipeline_info.get('load')
+    validation_info = pipeline_info.get('validation')
     
     conf = context['dag_run'].conf or {}
     run_id = context['dag_run'].run_id
@@ -189,10 +214,11 @@ def generate_report(**context):
         "overall_status": "SUCCESS" if validation_info and validation_info.get('data_integrity') else "WARNING"
     }
     
-    print(f"📋 Final Pipeline Report:")
-    print(json.dumps(report, indent=2))
-    print(f"🎉 Pipeline execution completed!")
+    lines.append(f"[REPORT] Final Pipeline Report:")
+    lines.append(json.dumps(report))
+    lines.append(f"[DONE] Pipeline execution completed!")
     
+    log.info("\n".join(lines))
     return report
 
 
@@ -203,18 +229,10 @@ extract_task = PythonOperator(
     dag=dag,
 )
 
-setup_task = BashOperator(
+setup_task = PythonOperator(
     task_id='setup_environment',
-    bash_command="""
-    echo "🔧 Setting up processing environment..."
-    echo " Creating temporary directories..."
-    mkdir -p /tmp/svops_pipeline_{{ ds }}
-    echo "🔍 Checking disk space..."
-    df -h
-    echo "💾 Checking memory..."
-    free -h
-    echo "✅ Environment setup completed"
-    """,
+    python_callable=check_environment,
+    op_kwargs={'output_dir': '/tmp/svops_pipeline_{{ ds }}'},
     dag=dag,
 )
 
@@ -239,9 +257,9 @@ validate_task = PythonOperator(
 cleanup_task = BashOperator(
     task_id='cleanup_environment',
     bash_command="""
-    echo "🧹 Cleaning up temporary files..."
+    echo "[CLEANUP] Cleaning up temporary files..."
     rm -rf /tmp/svops_pipeline_{{ ds }}
-    echo "✅ Cleanup completed"
+    echo "[OK] Cleanup completed"
     """,
     dag=dag,
 )
@@ -253,8 +271,11 @@ report_task = PythonOperator(
 )
 
 # Define task dependencies
-setup_task >> extract_task
-extract_task >> transform_task
-transform_task >> load_task
-load_task >> validate_task
-validate_task >> [cleanup_task, report_task]
\ No newline at end of file
+chain(
+    setup_task,
+    extract_task,
+    transform_task,
+    load_task,
+    validate_task,
+    [cleanup_task, report_task],
+)
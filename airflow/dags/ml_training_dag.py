@@ -1,22 +1,57 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 from airflow import DAG
+from airflow.models.baseoperator import chain
 from airflow.operators.python import PythonOperator
 from airflow.operators.bash import BashOperator
+from svops_defaults import build_default_args, check_environment
+from svops_callbacks import notify_run_finished
+import logging
+import os
 import time
 import json
 import random
+import numpy as np
 
 
+log = logging.getLogger(__name__)
+
+# Simulated work only sleeps when SVOPS_SIMULATE is 1/true/yes, so real deployments
+# don't hold executor slots for demo delays
+SIMULATE_DELAYS = os.environ.get('SVOPS_SIMULATE', '').strip().lower() in ('1', 'true', 'yes')
+
+
+def _simulate_delay(seconds):
+    """Sleep once for the whole simulated duration, if enabled"""
+    if SIMULATE_DELAYS:
+        time.sleep(seconds)
+
+
+PREPARATION_STEPS = (
+    "Loading dataset",
+    "Cleaning data",
+    "Feature engineering",
+    "Data splitting (train/val/test)",
+    "Data normalization",
+)
+
+EVALUATION_STEPS = (
+    "Loading test dataset",
+    "Running model inference",
+    "Calculating metrics",
+    "Generating confusion matrix",
+    "Creating evaluation report",
+)
+
+ARTIFACTS = (
+    "model_weights.pkl",
+    "model_config.json",
+    "training_history.json",
+    "evaluation_report.json",
+    "model_metadata.json",
+)
+
 # Default arguments for the DAG
-default_args = {
-    'owner': 'svops',
-    'depends_on_past': False,
-    'start_date': datetime(2025, 1, 1),
-    'email_on_failure': False,
-    'email_on_retry': False,
-    'retries': 1,
-    'retry_delay': timedelta(minutes=5),
-}
+default_args = build_default_args()
 
 # Create DAG
 dag = DAG(
@@ -26,29 +61,23 @@ dag = DAG(
     schedule_interval=None,  # Manual trigger only
     catchup=False,
     tags=['ml', 'training', 'svops'],
+    on_success_callback=notify_run_finished,
+    on_failure_callback=notify_run_finished,
 )
 
 
 def prepare_training_data(**context):
     """Simulate training data preparation"""
+    lines = []
     conf = context['dag_run'].conf or {}
     dataset_id = conf.get('dataset_id', 'ml_dataset')
     
-    print(f"🔧 Preparing training data...")
-    print(f"📁 Dataset ID: {dataset_id}")
-    
-    # Simulate data preparation steps
-    preparation_steps = [
-        "Loading dataset",
-        "Cleaning data",
-        "Feature engineering", 
-        "Data splitting (train/val/test)",
-        "Data normalization"
-    ]
+    lines.append(f"[STEP] Preparing training data...")
+    lines.append(f"[DATASET] Dataset ID: {dataset_id}")
     
-    for i, step in enumerate(preparation_steps):
-        print(f"📊 Step {i+1}/{len(preparation_steps)}: {step}")
-        time.sleep(random.randint(3, 7))
+    for i, step in enumerate(PREPARATION_STEPS):
+        lines.append(f"[DATA] Step {i+1}/{len(PREPARATION_STEPS)}: {step}")
+    _simulate_delay(sum(random.randint(3, 7) for _ in PREPARATION_STEPS))
     
     # Simulate prepared data statistics
     data_stats = {
@@ -61,13 +90,15 @@ def prepare_training_data(**context):
         "preparation_time": 25
     }
     
-    print(f"✅ Data preparation completed: {json.dumps(data_stats, indent=2)}")
+    lines.append(f"[OK] Data preparation completed: {json.dumps(data_stats)}")
+    log.info("\n".join(lines))
     return data_stats
 
 
 def train_model(**context):
     """Simulate model training"""
-    print(f"🤖 Starting model training...")
+    lines = []
+    lines.append(f"[TRAIN] Starting model training...")
     
     # Get data from previous task
     ti = context['ti']
@@ -76,31 +107,43 @@ def train_model(**context):
     if data_stats:
         train_samples = data_stats.get('train_samples', 10000)
         features = data_stats.get('features', 100)
-        print(f"📊 Training with {train_samples} samples, {features} features")
+        lines.append(f"[DATA] Training with {train_samples} samples, {features} features")
     
     # Simulate training epochs
     epochs = random.randint(10, 20)
-    print(f"🔄 Training for {epochs} epochs...")
-    
-    training_metrics = []
-    for epoch in range(1, epochs + 1):
-        # Simulate training progress
-        train_loss = 1.0 - (epoch / epochs) * 0.7 + random.uniform(-0.05, 0.05)
-        val_loss = 1.0 - (epoch / epochs) * 0.6 + random.uniform(-0.08, 0.08)
-        accuracy = 0.3 + (epoch / epochs) * 0.6 + random.uniform(-0.03, 0.03)
-        
-        metrics = {
-            "epoch": epoch,
-            "train_loss": round(train_loss, 4),
-            "val_loss": round(val_loss, 4), 
-            "accuracy": round(accuracy, 4)
+    lines.append(f"[RUN] Training for {epochs} epochs...")
+    
+    # Generate the whole training curve at once rather than epoch by epoch
+    epochs_arr = np.arange(1, epochs + 1)
+    progress = epochs_arr / epochs
+    train_loss = np.round(1.0 - progress * 0.7 + np.random.uniform(-0.05, 0.05, epochs), 4)
+    val_loss = np.round(1.0 - progress * 0.6 + np.random.uniform(-0.08, 0.08, epochs), 4)
+    accuracy = np.round(0.3 + progress * 0.6 + np.random.uniform(-0.03, 0.03, epochs), 4)
+    
+    training_metrics = [
+        {
+            "epoch": int(e),
+            "train_loss": float(t),
+            "val_loss": float(v),
+            "accuracy": float(a)
         }
-        training_metrics.append(metrics)
-        
+        for e, t, v, a in zip(epochs_arr, train_loss, val_loss, accuracy)
+    ]
+    
+    for metrics in training_metrics:
+        epoch = metrics["epoch"]
         if epoch % 5 == 0 or epoch == epochs:
-            print(f"📈 Epoch {epoch}/{epochs}: Loss={train_loss:.4f}, Val_Loss={val_loss:.4f}, Acc={accuracy:.4f}")
-        
-        time.sleep(2)
+            lines.append(f"[EPOCH] Epoch {epoch}/{epochs}: Loss={metrics['train_loss']:.4f}, Val_Loss={metrics['val_loss']:.4f}, Acc={metrics['accuracy']:.4f}")
+    
+    _simulate_delay(epochs * 2)
+    
+    # Keep the per-epoch history out of XCom; downstream tasks only need the
+    # summary and can load the history from disk if required
+    output_dir = f"/tmp/ml_models_{context['ds']}"
+    os.makedirs(output_dir, exist_ok=True)
+    training_history_path = os.path.join(output_dir, "training_history.json")
+    with open(training_history_path, "w") as f:
+        json.dump(training_metrics, f)
     
     # Final model info
     model_info = {
@@ -110,39 +153,33 @@ def train_model(**context):
         "final_loss": training_metrics[-1]["train_loss"],
         "training_time_minutes": epochs * 2 / 60,
         "model_size_mb": random.randint(50, 500),
-        "training_metrics": training_metrics
+        "training_history_path": training_history_path
     }
     
-    print(f"✅ Model training completed: {json.dumps(model_info, indent=2)}")
+    lines.append(f"[OK] Model training completed: {json.dumps(model_info)}")
+    log.info("\n".join(lines))
     return model_info
 
 
 def evaluate_model(**context):
     """Simulate model evaluation"""
-    print(f"📊 Starting model evaluation...")
+    lines = []
+    lines.append(f"[DATA] Starting model evaluation...")
     
     # Get data from previous tasks
     ti = context['ti']
+    # One pull per task: a list pull skips tasks that pushed nothing
     data_stats = ti.xcom_pull(task_ids='prepare_training_data')
     model_info = ti.xcom_pull(task_ids='train_model')
     
     if data_stats and model_info:
         test_samples = data_stats.get('test_samples', 2000)
         final_accuracy = model_info.get('final_accuracy', 0.8)
-        print(f"🧪 Evaluating on {test_samples} test samples")
-    
-    # Simulate evaluation steps
-    evaluation_steps = [
-        "Loading test dataset",
-        "Running model inference",
-        "Calculating metrics",
-        "Generating confusion matrix",
-        "Creating evaluation report"
-    ]
+        lines.append(f"[EVAL] Evaluating on {test_samples} test samples")
     
-    for step in evaluation_steps:
-        print(f"🔍 {step}...")
-        time.sleep(random.randint(2, 5))
+    for step in EVALUATION_STEPS:
+        lines.append(f"[CHECK] {step}...")
+    _simulate_delay(sum(random.randint(2, 5) for _ in EVALUATION_STEPS))
     
     # Simulate evaluation results
     evaluation_results = {
@@ -155,16 +192,19 @@ def evaluate_model(**context):
         "evaluation_passed": True
     }
     
-    print(f"✅ Model evaluation completed: {json.dumps(evaluation_results, indent=2)}")
+    lines.append(f"[OK] Model evaluation completed: {json.dumps(evaluation_results)}")
+    log.info("\n".join(lines))
     return evaluation_results
 
 
 def validate_model_performance(**context):
     """Validate if model meets performance criteria"""
-    print(f"✅ Validating model performance...")
+    lines = []
+    lines.append(f"[OK] Validating model performance...")
     
-    # Get evaluation results
+    # Get training and evaluation results
     ti = context['ti']
+    model_info = ti.xcom_pull(task_ids='train_model')
     evaluation_results = ti.xcom_pull(task_ids='evaluate_model')
     
     if not evaluation_results:
@@ -177,9 +217,9 @@ def validate_model_performance(**context):
     accuracy = evaluation_results.get('test_accuracy', 0.0)
     inference_time = evaluation_results.get('inference_time_ms', 0)
     
-    print(f"📊 Performance Check:")
-    print(f"   Accuracy: {accuracy} (minimum: {min_accuracy})")
-    print(f"   Inference Time: {inference_time}ms (maximum: {max_inference_time}ms)")
+    lines.append(f"[DATA] Performance Check:")
+    lines.append(f"   Accuracy: {accuracy} (minimum: {min_accuracy})")
+    lines.append(f"   Inference Time: {inference_time}ms (maximum: {max_inference_time}ms)")
     
     # Validation checks
     validation_results = {
@@ -189,39 +229,39 @@ def validate_model_performance(**context):
     }
     
     if validation_results["overall_validation"]:
-        print("✅ Model validation PASSED - Ready for deployment")
+        lines.append("[OK] Model validation PASSED - Ready for deployment")
     else:
-        print("❌ Model validation FAILED - Requires improvement")
+        lines.append("[FAIL] Model validation FAILED - Requires improvement")
     
-    time.sleep(3)
-    return validation_results
+    _simulate_delay(3)
+    log.info("\n".join(lines))
+    
+    # Forward upstream results so artifact saving needs a single XCom read
+    return {
+        "model_info": model_info,
+        "evaluation_results": evaluation_results,
+        "validation_results": validation_results,
+    }
 
 
 def save_model_artifacts(**context):
     """Simulate saving model artifacts"""
-    print(f"💾 Saving model artifacts...")
+    lines = []
+    lines.append(f"[SAVE] Saving model artifacts...")
     
-    # Get all results
+    # validate_model_performance forwards every upstream result
     ti = context['ti']
-    model_info = ti.xcom_pull(task_ids='train_model')
-    evaluation_results = ti.xcom_pull(task_ids='evaluate_model')
-    validation_results = ti.xcom_pull(task_ids='validate_model_performance')
+    performance_info = ti.xcom_pull(task_ids='validate_model_performance') or {}
+    model_info = performance_info.get('model_info')
+    evaluation_results = performance_info.get('evaluation_results')
+    validation_results = performance_info.get('validation_results')
     
     conf = context['dag_run'].conf or {}
     run_id = context['dag_run'].run_id
     
-    # Simulate saving artifacts
-    artifacts = [
-        "model_weights.pkl",
-        "model_config.json", 
-        "training_history.json",
-        "evaluation_report.json",
-        "model_metadata.json"
-    ]
-    
-    for artifact in artifacts:
-        print(f"💾 Saving {artifact}...")
-        time.sleep(1)
+    for artifact in ARTIFACTS:
+        lines.append(f"[SAVE] Saving {artifact}...")
+    _simulate_delay(len(ARTIFACTS))
     
     # Create model registry entry
     model_registry = {
@@ -232,11 +272,12 @@ def save_model_artifacts(**context):
         "model_info": model_info,
         "evaluation_results": evaluation_results,
         "validation_results": validation_results,
-        "artifacts_saved": artifacts,
+        "artifacts_saved": ARTIFACTS,
         "ready_for_deployment": validation_results.get('overall_validation', False) if validation_results else False
     }
     
-    print(f"✅ Model artifacts saved: {json.dumps(model_registry, indent=2)}")
+    lines.append(f"[OK] Model artifacts saved: {json.dumps(model_registry)}")
+    log.info("\n".join(lines))
     return model_registry
 
 
@@ -247,18 +288,10 @@ prepare_data_task = PythonOperator(
     dag=dag,
 )
 
-setup_ml_env_task = BashOperator(
+setup_ml_env_task = PythonOperator(
     task_id='setup_ml_environment',
-    bash_command="""
-    echo "🔧 Setting up ML training environment..."
-    echo "🐍 Python version: $(python3 --version)"
-    echo "📦 Checking GPU availability..."
-    echo "💾 Checking available memory..."
-    free -h
-    echo " Creating model output directory..."
-    mkdir -p /tmp/ml_models_{{ ds }}
-    echo "✅ ML environment setup completed"
-    """,
+    python_callable=check_environment,
+    op_kwargs={'output_dir': '/tmp/ml_models_{{ ds }}'},
     dag=dag,
 )
 
@@ -289,17 +322,20 @@ save_artifacts_task = PythonOperator(
 cleanup_ml_env_task = BashOperator(
     task_id='cleanup_ml_environment',
     bash_command="""
-    echo "🧹 Cleaning up ML training environment..."
+    echo "[CLEANUP] Cleaning up ML training environment..."
     rm -rf /tmp/ml_models_{{ ds }}
-    echo "✅ ML environment cleanup completed"
+    echo "[OK] ML environment cleanup completed"
     """,
     dag=dag,
 )
 
 # Define task dependencies
-setup_ml_env_task >> prepare_data_task
-prepare_data_task >> train_model_task
-train_model_task >> evaluate_model_task
-evaluate_model_task >> validate_performance_task
-validate_performance_task >> save_artifacts_task
-save_artifacts_task >> cleanup_ml_env_task
\ No newline at end of file
+chain(
+    setup_ml_env_task,
+    prepare_data_task,
+    train_model_task,
+    evaluate_model_task,
+    validate_performance_task,
+    save_artifacts_task,
+    cleanup_ml_env_task,
+)
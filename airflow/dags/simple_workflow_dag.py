@@ -1,21 +1,38 @@
 from datetime import datetime, timedelta
 from airflow import DAG
+from airflow.models.baseoperator import BaseOperator, chain
 from airflow.operators.python import PythonOperator
-from airflow.operators.bash import BashOperator
+from airflow.triggers.temporal import TimeDeltaTrigger
+from svops_defaults import build_default_args, check_environment
+from svops_callbacks import notify_run_finished
+import logging
+import os
 import time
 import json
 
 
+log = logging.getLogger(__name__)
+
+# Simulated work only sleeps when SVOPS_SIMULATE is 1/true/yes, so real deployments
+# don't hold executor slots for demo delays
+SIMULATE_DELAYS = os.environ.get('SVOPS_SIMULATE', '').strip().lower() in ('1', 'true', 'yes')
+
+
+def _simulate_delay(seconds):
+    """Sleep once for the whole simulated duration, if enabled"""
+    if SIMULATE_DELAYS:
+        time.sleep(seconds)
+
+
+VALIDATION_STEPS = (
+    "Checking data format",
+    "Validating data integrity",
+    "Verifying data completeness",
+    "Running quality checks",
+)
+
 # Default arguments for the DAG
-default_args = {
-    'owner': 'svops',
-    'depends_on_past': False,
-    'start_date': datetime(2025, 1, 1),
-    'email_on_failure': False,
-    'email_on_retry': False,
-    'retries': 1,
-    'retry_delay': timedelta(minutes=5),
-}
+default_args = build_default_args()
 
 # Create DAG
 dag = DAG(
@@ -25,18 +42,21 @@ dag = DAG(
     schedule_interval=None,  # Manual trigger only
     catchup=False,
     tags=['example', 'svops', 'simple'],
+    on_success_callback=notify_run_finished,
+    on_failure_callback=notify_run_finished,
 )
 
 
 def print_start_message(**context):
     """Print workflow start message"""
+    lines = []
     task_id = context.get('task_id', 'unknown')
     run_id = context['dag_run'].run_id
     conf = context['dag_run'].conf or {}
     
-    print(f"🚀 Starting task: {task_id}")
-    print(f"📋 Run ID: {run_id}")
-    print(f"⚙️ Configuration: {json.dumps(conf, indent=2)}")
+    lines.append(f"[START] Starting task: {task_id}")
+    lines.append(f"[REPORT] Run ID: {run_id}")
+    lines.append(f"[CONFIG] Configuration: {json.dumps(conf)}")
     
     # Extract parameters from configuration
     dataset_id = conf.get('dataset_id')
@@ -44,43 +64,49 @@ def print_start_message(**context):
     parameters = conf.get('parameters', {})
     
     if dataset_id:
-        print(f"📁 Dataset ID: {dataset_id}")
+        lines.append(f"[DATASET] Dataset ID: {dataset_id}")
     if task_id_param:
-        print(f"🎯 Task ID: {task_id_param}")
+        lines.append(f"[TASK] Task ID: {task_id_param}")
     if parameters:
-        print(f"🔧 Additional Parameters: {json.dumps(parameters, indent=2)}")
+        lines.append(f"[STEP] Additional Parameters: {json.dumps(parameters)}")
     
-    print("✅ Workflow initialization completed")
+    lines.append("[OK] Workflow initialization completed")
+    log.info("\n".join(lines))
     return "Workflow started successfully"
 
 
-def simulate_processing(**context):
-    """Simulate some processing work"""
-    conf = context['dag_run'].conf or {}
-    processing_time = conf.get('parameters', {}).get('processing_time', 30)
-    
-    print(f"🔄 Starting processing simulation...")
-    print(f"⏱️ Processing time: {processing_time} seconds")
-    
-    # Simulate work with progress updates
-    for i in range(int(processing_time)):
-        if i % 10 == 0:
-            progress = (i / processing_time) * 100
-            print(f"📊 Progress: {progress:.1f}%")
-        time.sleep(1)
-    
-    print("✅ Processing completed successfully")
-    return f"Processing completed in {processing_time} seconds"
+class SimulatedProcessingOperator(BaseOperator):
+    """Simulate some processing work without holding a worker slot"""
+
+    def execute(self, context):
+        conf = context['dag_run'].conf or {}
+        processing_time = conf.get('parameters', {}).get('processing_time', 30)
+        
+        log.info(f"[RUN] Starting processing simulation...\n[TIME] Processing time: {processing_time} seconds")
+        
+        # Hand the wait off to the triggerer so the slot is free while we sleep
+        if SIMULATE_DELAYS and processing_time > 0:
+            self.defer(
+                trigger=TimeDeltaTrigger(timedelta(seconds=processing_time)),
+                method_name="execute_complete",
+                kwargs={"processing_time": processing_time},
+            )
+        return self.execute_complete(context, processing_time=processing_time)
+
+    def execute_complete(self, context, event=None, processing_time=0):
+        log.info("[DATA] Progress: 100.0%\n[OK] Processing completed successfully")
+        return f"Processing completed in {processing_time} seconds"
 
 
 def print_results(**context):
     """Print workflow results"""
+    lines = []
     run_id = context['dag_run'].run_id
     conf = context['dag_run'].conf or {}
     
-    print(f"📊 Workflow Results Summary")
-    print(f"🔖 Run ID: {run_id}")
-    print(f"⏰ Completion Time: {datetime.now().isoformat()}")
+    lines.append(f"[DATA] Workflow Results Summary")
+    lines.append(f"[RUN] Run ID: {run_id}")
+    lines.append(f"[TIME] Completion Time: {datetime.now().isoformat()}")
     
     # Simulate some results
     results = {
@@ -91,34 +117,29 @@ def print_results(**context):
         "task_id": conf.get('task_id')
     }
     
-    print(f"📋 Results: {json.dumps(results, indent=2)}")
-    print("🎉 Workflow completed successfully!")
+    lines.append(f"[REPORT] Results: {json.dumps(results)}")
+    lines.append("[DONE] Workflow completed successfully!")
     
+    log.info("\n".join(lines))
     return results
 
 
 def simulate_data_validation(**context):
     """Simulate data validation step"""
+    lines = []
     conf = context['dag_run'].conf or {}
     dataset_id = conf.get('dataset_id')
     
-    print(f"🔍 Starting data validation...")
+    lines.append(f"[CHECK] Starting data validation...")
     if dataset_id:
-        print(f"📁 Validating dataset: {dataset_id}")
-    
-    # Simulate validation checks
-    validation_steps = [
-        "Checking data format",
-        "Validating data integrity", 
-        "Verifying data completeness",
-        "Running quality checks"
-    ]
+        lines.append(f"[DATASET] Validating dataset: {dataset_id}")
     
-    for step in validation_steps:
-        print(f"✓ {step}")
-        time.sleep(2)
+    for step in VALIDATION_STEPS:
+        lines.append(f"[OK] {step}")
+    _simulate_delay(len(VALIDATION_STEPS) * 2)
     
-    print("✅ Data validation completed successfully")
+    lines.append("[OK] Data validation completed successfully")
+    log.info("\n".join(lines))
     return "Data validation passed"
 
 
@@ -135,24 +156,15 @@ validate_data_task = PythonOperator(
     dag=dag,
 )
 
-process_data_task = PythonOperator(
+process_data_task = SimulatedProcessingOperator(
     task_id='process_data',
-    python_callable=simulate_processing,
     dag=dag,
 )
 
-# Simple bash task for environment check
-check_environment_task = BashOperator(
+# Environment check, cached per worker host
+check_environment_task = PythonOperator(
     task_id='check_environment',
-    bash_command="""
-    echo "🔧 Environment Check"
-    echo "📅 Date: $(date)"
-    echo "💻 Hostname: $(hostname)"
-    echo "👤 User: $(whoami)"
-    echo " Working Directory: $(pwd)"
-    echo "🐍 Python Version: $(python3 --version)"
-    echo "✅ Environment check completed"
-    """,
+    python_callable=check_environment,
     dag=dag,
 )
 
@@ -163,6 +175,9 @@ finalize_task = PythonOperator(
 )
 
 # Define task dependencies
-start_task >> [validate_data_task, check_environment_task]
-[validate_data_task, check_environment_task] >> process_data_task
-process_data_task >> finalize_task
\ No newline at end of file
+chain(
+    start_task,
+    [validate_data_task, check_environment_task],
+    process_data_task,
+    finalize_task,
+)
@@ -0,0 +1,45 @@
+"""Run completion callbacks that notify the SVOps backend.
+
+Uses only the standard library so pipeline files can import it cheaply.
+"""
+import json
+import logging
+import os
+import urllib.request
+
+
+log = logging.getLogger(__name__)
+
+CALLBACK_URL = os.environ.get('SVOPS_CALLBACK_URL')
+CALLBACK_TOKEN = os.environ.get('SVOPS_CALLBACK_TOKEN')
+CALLBACK_TIMEOUT = 5  # seconds
+
+
+def notify_run_finished(context):
+    """POST the finished run's state to the backend so it doesn't have to poll"""
+    if not CALLBACK_URL:
+        return
+
+    run = context['dag_run']
+    payload = {
+        'dag_id': run.dag_id,
+        'dag_run_id': run.run_id,
+        'state': getattr(run.state, 'value', run.state),
+        'end_date': run.end_date.isoformat() if run.end_date else None,
+    }
+    headers = {'Content-Type': 'application/json'}
+    if CALLBACK_TOKEN:
+        headers['X-SVOps-Token'] = CALLBACK_TOKEN
+
+    request = urllib.request.Request(
+        CALLBACK_URL,
+        data=json.dumps(payload).encode(),
+        headers=headers,
+        method='POST',
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=CALLBACK_TIMEOUT):
+            pass
+    except Exception as e:
+        # The backend falls back to polling, so a missed callback is not fatal
+        log.warning(f"Run completion callback failed: {e}")
@@ -0,0 +1,64 @@
+"""Shared defaults for the SVOps pipelines.
+
+Kept free of operator imports so pipeline files can pull these constants
+without adding to their parse cost.
+"""
+from datetime import datetime, timedelta
+import getpass
+import logging
+import os
+import platform
+import shutil
+import socket
+import time
+
+
+log = logging.getLogger(__name__)
+
+START_DATE = datetime(2025, 1, 1)
+
+# Host facts barely change between runs; re-collect them at most this often
+ENV_CHECK_TTL = int(os.environ.get('SVOPS_ENV_CHECK_TTL', 3600))
+
+
+def build_default_args(retries=1, retry_delay=timedelta(minutes=5)):
+    """Return a fresh default_args dict for a pipeline"""
+    return {
+        'owner': 'svops',
+        'depends_on_past': False,
+        'start_date': START_DATE,
+        'email_on_failure': False,
+        'email_on_retry': False,
+        'retries': retries,
+        'retry_delay': retry_delay,
+    }
+
+
+def check_environment(output_dir=None, ttl=ENV_CHECK_TTL):
+    """Log host facts for this worker, reusing a recent report if there is one"""
+    from airflow.models import Variable
+
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    hostname = socket.gethostname()
+    cache_key = f"svops_env_check_{hostname}"
+    report = Variable.get(cache_key, default_var=None, deserialize_json=True)
+
+    if not report or time.time() - report.get('checked_at', 0) >= ttl:
+        disk = shutil.disk_usage('/tmp')
+        report = {
+            'checked_at': time.time(),
+            'hostname': hostname,
+            'user': getpass.getuser(),
+            'python_version': platform.python_version(),
+            'cpu_count': os.cpu_count(),
+            'disk_free_mb': disk.free // (1024 * 1024),
+            'memory_available_mb': (
+                os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') // (1024 * 1024)
+            ),
+        }
+        Variable.set(cache_key, report, serialize_json=True)
+
+    log.info(f"[CHECK] Environment: {report}")
+    return report
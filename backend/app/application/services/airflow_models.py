@@ -0,0 +1,40 @@
+from typing import Optional, Dict, Any, List
+
+import msgspec
+
+
+class DagRun(msgspec.Struct):
+    """DAG run as returned by the Airflow REST API"""
+
+    dag_id: str
+    dag_run_id: str
+    state: Optional[str] = None
+    execution_date: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    external_trigger: bool = False
+    conf: Optional[Dict[str, Any]] = None
+
+
+class DagRunList(msgspec.Struct):
+    dag_runs: List[DagRun] = []
+    total_entries: int = 0
+
+
+class TaskInstance(msgspec.Struct):
+    """Task instance as returned by the Airflow REST API"""
+
+    task_id: str
+    dag_id: Optional[str] = None
+    dag_run_id: Optional[str] = None
+    state: Optional[str] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    duration: Optional[float] = None
+    try_number: int = 0
+    hostname: Optional[str] = None
+
+
+class TaskInstanceList(msgspec.Struct):
+    task_instances: List[TaskInstance] = []
+    total_entries: int = 0
@@ -1,49 +1,205 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Hashable, Type
+import asyncio
+import functools
 import httpx
-import json
+import time
 from datetime import datetime, timezone
 import base64
+import msgspec
 
 from app.core.config import settings
-from app.core.retry import with_retry, EXTERNAL_SERVICE_RETRY, airflow_circuit_breaker
+from app.core.serialization import json_dumps, json_loads, JSONDecodeError
+from app.core.retry import with_retry, RetryConfig, airflow_circuit_breaker
+from app.application.services.airflow_models import DagRunList, TaskInstanceList
 from app.shared.exceptions import ExternalServiceError
 
 
+class AirflowServerError(ExternalServiceError):
+    """Airflow answered with a 5xx response"""
+
+
+# Connection failures are retried by the transport; only 5xx responses are
+# retried at this level
+AIRFLOW_SERVER_ERROR_RETRY = RetryConfig(
+    max_attempts=3,
+    delay=2.0,
+    backoff_factor=2.0,
+    max_delay=30.0,
+    exceptions=(AirflowServerError,),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _dag_url(dag_id: str) -> str:
+    return f"/dags/{dag_id}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _dag_runs_url(dag_id: str) -> str:
+    return f"/dags/{dag_id}/dagRuns"
+
+
+@functools.lru_cache(maxsize=4096)
+def _dag_run_url(dag_id: str, dag_run_id: str) -> str:
+    return f"/dags/{dag_id}/dagRuns/{dag_run_id}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _task_instances_url(dag_id: str, dag_run_id: str) -> str:
+    return f"/dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances"
+
+
 class AirflowClient:
     def __init__(self):
         self.base_url = settings.AIRFLOW_URL.rstrip("/")
         self.username = settings.AIRFLOW_USERNAME
         self.password = settings.AIRFLOW_PASSWORD
         self._auth_header = self._create_auth_header()
+        self._base_headers = {
+            "Authorization": self._auth_header,
+            "Content-Type": "application/json",
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._dag_cache_ttl = settings.AIRFLOW_DAG_CACHE_TTL
+        self._dag_cache: Dict[Hashable, Tuple[float, Dict[str, Any]]] = {}
+        self._dag_cache_locks: Dict[Hashable, asyncio.Lock] = {}
+        self._failure_cache_ttl = 1.0  # seconds
+        self._last_failure_at: Optional[float] = None
 
     def _create_auth_header(self) -> str:
         credentials = f"{self.username}:{self.password}"
         encoded_credentials = base64.b64encode(credentials.encode()).decode()
         return f"Basic {encoded_credentials}"
 
-    @with_retry(EXTERNAL_SERVICE_RETRY)
-    @airflow_circuit_breaker
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client, rebuilt if closed or bound to another event loop"""
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            self._retire_client()
+            self._client = httpx.AsyncClient(
+                base_url=f"{self.base_url}/api/v1",
+                headers=self._base_headers,
+                timeout=httpx.Timeout(10.0),
+                transport=httpx.AsyncHTTPTransport(
+                    retries=3,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=settings.AIRFLOW_MAX_CONCURRENCY,
+                        max_connections=settings.AIRFLOW_MAX_CONCURRENCY * 2,
+                    ),
+                ),
+            )
+            self._client_loop = loop
+            # Locks and semaphores are bound to the loop they first wait on
+            self._semaphore = asyncio.Semaphore(settings.AIRFLOW_MAX_CONCURRENCY)
+            self._dag_cache_locks.clear()
+        return self._client
+
+    def _retire_client(self) -> None:
+        """Close a client being replaced on the event loop its sockets belong to"""
+        old_client, old_loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        if old_client is None or old_client.is_closed or old_loop is None:
+            return
+        # A stopped loop can't run the close; its sockets go with the loop
+        if old_loop.is_running():
+            asyncio.run_coroutine_threadsafe(old_client.aclose(), old_loop)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
     async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        response_type: Optional[Type] = None,
+        **kwargs,
+    ) -> Any:
+        # Fail fast instead of walking the retry ladder while Airflow is down
+        if airflow_circuit_breaker.is_open():
+            raise ExternalServiceError("Airflow unavailable (circuit open)")
+        if (
+            self._last_failure_at is not None
+            and time.monotonic() - self._last_failure_at < self._failure_cache_ttl
+        ):
+            raise ExternalServiceError("Airflow unavailable (recent failure)")
+
+        # Encode once so retries only resend the bytes
+        payload = kwargs.pop("json", None)
+        if payload is not None:
+            kwargs["content"] = json_dumps(payload)
+
+        response = await self._send_request(method, endpoint, **kwargs)
+        try:
+            # Client errors (e.g. unknown run id) say nothing about Airflow
+            # health, so they are raised here, outside the circuit breaker
+            response.raise_for_status()
+            if response_type is not None:
+                return msgspec.json.decode(response.content, type=response_type)
+            return json_loads(response.content)
+        except httpx.HTTPStatusError as e:
+            raise ExternalServiceError(f"Airflow API error: {str(e)}")
+        except JSONDecodeError:
+            raise ExternalServiceError("Invalid JSON response from Airflow")
+        except msgspec.DecodeError as e:
+            raise ExternalServiceError(f"Unexpected response from Airflow: {str(e)}")
+
+    @with_retry(AIRFLOW_SERVER_ERROR_RETRY)
+    @airflow_circuit_breaker
+    async def _send_request(
         self, method: str, endpoint: str, **kwargs
+    ) -> httpx.Response:
+        """Send a request; only server and transport errors count as failures"""
+        client = self.client
+        try:
+            # Cap in-flight calls so bursts queue here, not in Airflow's backlog
+            async with self._semaphore:
+                response = await client.request(method, endpoint, **kwargs)
+            if response.status_code >= 500:
+                response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            self._last_failure_at = time.monotonic()
+            raise AirflowServerError(f"Airflow API error: {str(e)}")
+        except httpx.HTTPError as e:
+            self._last_failure_at = time.monotonic()
+            raise ExternalServiceError(f"Airflow API error: {str(e)}")
+        self._last_failure_at = None
+        return response
+
+    async def _cached_get(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        url = f"{self.base_url}/api/v1{endpoint}"
-        headers = {
-            "Authorization": self._auth_header,
-            "Content-Type": "application/json",
-            **kwargs.pop("headers", {}),
-        }
+        """GET with a short TTL cache; concurrent misses share one request"""
+        key = (endpoint, frozenset(params.items()) if params else None)
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.request(
-                    method=method, url=url, headers=headers, **kwargs
-                )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                raise ExternalServiceError(f"Airflow API error: {str(e)}")
-            except json.JSONDecodeError:
-                raise ExternalServiceError("Invalid JSON response from Airflow")
+        cached = self._dag_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._dag_cache_ttl:
+            return cached[1]
+
+        lock = self._dag_cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._dag_cache.get(key)
+            if cached and time.monotonic() - cached[0] < self._dag_cache_ttl:
+                return cached[1]
+
+            result = await self._make_request("GET", endpoint, params=params)
+            self._dag_cache[key] = (time.monotonic(), result)
+            return result
+
+    def clear_dag_cache(self) -> None:
+        """Drop cached DAG metadata"""
+        self._dag_cache.clear()
 
     async def trigger_dag(
         self,
@@ -57,10 +213,57 @@ class AirflowClient:
             "conf": conf or {},
         }
 
-        return await self._make_request("POST", f"/dags/{dag_id}/dagRuns", json=payload)
+        return await self._make_request("POST", _dag_runs_url(dag_id), json=payload)
 
     async def get_dag_run_status(self, dag_id: str, dag_run_id: str) -> Dict[str, Any]:
-        return await self._make_request("GET", f"/dags/{dag_id}/dagRuns/{dag_run_id}")
+        return await self._make_request("GET", _dag_run_url(dag_id, dag_run_id))
+
+    async def get_dag_runs_batch(
+        self, pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Fetch runs across any number of DAGs in one request, keyed by (dag_id, run_id)"""
+        wanted = set(pairs)
+        if not wanted:
+            return {}
+
+        response = await self._make_request(
+            "POST",
+            "/dags/~/dagRuns/list",
+            json={
+                "dag_ids": sorted({dag_id for dag_id, _ in wanted}),
+                "order_by": "-execution_date",
+                "page_limit": 100,
+            },
+        )
+        runs = {}
+        for dag_run in response.get("dag_runs", []):
+            key = (dag_run.get("dag_id"), dag_run.get("dag_run_id"))
+            if key in wanted:
+                runs[key] = dag_run
+
+        # Older runs can fall outside the first page; fetch those directly.
+        # A run that cannot be fetched is left out rather than failing the batch
+        missing = list(wanted - runs.keys())
+        fetched = await asyncio.gather(
+            *(self.get_dag_run_status(dag_id, run_id) for dag_id, run_id in missing),
+            return_exceptions=True,
+        )
+        runs.update(
+            (key, dag_run)
+            for key, dag_run in zip(missing, fetched)
+            if not isinstance(dag_run, Exception)
+        )
+
+        return runs
+
+    async def get_dag_runs_bulk(
+        self, dag_id: str, dag_run_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch several runs of one DAG in a single request, keyed by run id"""
+        runs = await self.get_dag_runs_batch(
+            [(dag_id, dag_run_id) for dag_run_id in dag_run_ids]
+        )
+        return {dag_run_id: dag_run for (_, dag_run_id), dag_run in runs.items()}
 
     async def get_dag_runs(
         self,
@@ -73,7 +276,23 @@ class AirflowClient:
         if state:
             params["state"] = state
 
-        return await self._make_request("GET", f"/dags/{dag_id}/dagRuns", params=params)
+        return await self._make_request("GET", _dag_runs_url(dag_id), params=params)
+
+    async def get_dag_runs_typed(
+        self,
+        dag_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        state: Optional[str] = None,
+    ) -> DagRunList:
+        """Like get_dag_runs, decoded straight into structs"""
+        params = {"limit": limit, "offset": offset}
+        if state:
+            params["state"] = state
+
+        return await self._make_request(
+            "GET", _dag_runs_url(dag_id), response_type=DagRunList, params=params
+        )
 
     async def patch_dag_run(
         self, dag_id: str, dag_run_id: str, state: str
@@ -81,7 +300,7 @@ class AirflowClient:
         payload = {"state": state}
 
         return await self._make_request(
-            "PATCH", f"/dags/{dag_id}/dagRuns/{dag_run_id}", json=payload
+            "PATCH", _dag_run_url(dag_id, dag_run_id), json=payload
         )
 
     async def clear_dag_run(self, dag_id: str, dag_run_id: str) -> Dict[str, Any]:
@@ -98,15 +317,34 @@ class AirflowClient:
 
     async def get_task_instances(self, dag_id: str, dag_run_id: str) -> Dict[str, Any]:
         return await self._make_request(
-            "GET", f"/dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances"
+            "GET", _task_instances_url(dag_id, dag_run_id)
+        )
+
+    async def get_task_instances_typed(
+        self, dag_id: str, dag_run_id: str
+    ) -> TaskInstanceList:
+        """Like get_task_instances, decoded straight into structs"""
+        return await self._make_request(
+            "GET",
+            _task_instances_url(dag_id, dag_run_id),
+            response_type=TaskInstanceList,
         )
 
     async def get_dag_details(self, dag_id: str) -> Dict[str, Any]:
-        return await self._make_request("GET", f"/dags/{dag_id}")
+        return await self._cached_get(_dag_url(dag_id))
 
     async def list_dags(
         self, limit: int = 100, offset: int = 0, only_active: bool = True
     ) -> Dict[str, Any]:
         params = {"limit": limit, "offset": offset, "only_active": only_active}
 
-        return await self._make_request("GET", "/dags", params=params)
+        return await self._cached_get("/dags", params=params)
+
+
+# Global Airflow client instance
+airflow_client = AirflowClient()
+
+
+def get_airflow_client() -> AirflowClient:
+    """Dependency to get Airflow client"""
+    return airflow_client
@@ -1,19 +1,47 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Union
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from typing import Optional, Union, Tuple
+import asyncio
+import hashlib
+import hmac
+import os
+import threading
+import time
+import bcrypt
+import jwt
 from fastapi import HTTPException, status
 from pydantic import BaseModel
 
 from app.core.config import settings
+from app.core.redis import get_redis
 from app.shared.exceptions import UnauthorizedError, ValidationError
 
 
+# Shared by every AuthService so extra instances don't spawn extra pools.
+# bcrypt releases the GIL, so hashing in threads runs in parallel without
+# blocking the event loop; one worker per core caps CPU use
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt"
+)
+
+
+_BEARER_PREFIXES = ("Bearer ", "bearer ")
+_BEARER_PREFIX_LEN = 7
+
+# Tokens revoked on logout are shared across workers through Redis
+_REVOKED_TOKEN_PREFIX = "revoked_token:"
+
+
 class TokenData(BaseModel):
     username: Optional[str] = None
     user_id: Optional[int] = None
     scopes: list[str] = []
 
+    class Config:
+        extra = "forbid"
+        frozen = True
+
 
 class Token(BaseModel):
     access_token: str
@@ -22,21 +50,102 @@ class Token(BaseModel):
     user_id: int
     username: str
 
+    class Config:
+        extra = "forbid"
+        frozen = True
+
 
 class AuthService:
     def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
         self.SECRET_KEY = settings.SECRET_KEY
         self.ALGORITHM = "HS256"
+        self._jwt = jwt.PyJWT()
+        self._secret_bytes = self.SECRET_KEY.encode()
+        self._algorithms = [self.ALGORITHM]
         self.ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
+        # Recent successful verifications, keyed by (hash, HMAC of password)
+        # so plaintext is never kept in memory
+        self._verify_cache: "OrderedDict[Tuple[str, bytes], float]" = OrderedDict()
+        self._verify_cache_ttl = 300.0  # seconds
+        self._verify_cache_size = 1024
+        self._verify_cache_lock = threading.Lock()
+
+        # Verified tokens, keyed by a BLAKE2b digest of the token, each kept
+        # for at most a minute and never past the token's own expiry
+        self._token_cache: "OrderedDict[bytes, Tuple[float, TokenData]]" = OrderedDict()
+        self._token_cache_ttl = 60.0  # seconds
+        self._token_cache_size = 10000
+        self._bcrypt_pool = _BCRYPT_POOL
+
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
-        return self.pwd_context.verify(plain_password, hashed_password)
+        key = (
+            hashed_password,
+            hmac.new(
+                self.SECRET_KEY.encode(), plain_password.encode(), hashlib.sha256
+            ).digest(),
+        )
+
+        verified_at = self._verify_cache.get(key)
+        if (
+            verified_at is not None
+            and time.monotonic() - verified_at < self._verify_cache_ttl
+        ):
+            return True
+
+        try:
+            verified = bcrypt.checkpw(
+                plain_password.encode(), hashed_password.encode()
+            )
+        except ValueError:
+            # Malformed or non-bcrypt hash
+            return False
+        if not verified:
+            return False
+
+        with self._verify_cache_lock:
+            self._verify_cache[key] = time.monotonic()
+            self._verify_cache.move_to_end(key)
+            while len(self._verify_cache) > self._verify_cache_size:
+                self._verify_cache.popitem(last=False)
+        return True
+
+    async def averify_password(
+        self, plain_password: str, hashed_password: str
+    ) -> bool:
+        """Verify a password on the bcrypt pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._bcrypt_pool, self.verify_password, plain_password, hashed_password
+        )
 
     def get_password_hash(self, password: str) -> str:
         """Generate password hash"""
-        return self.pwd_context.hash(password)
+        return bcrypt.hashpw(
+            password.encode(), bcrypt.gensalt(rounds=self.BCRYPT_ROUNDS)
+        ).decode()
+
+    async def aget_password_hash(self, password: str) -> str:
+        """Generate password hash on the bcrypt pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._bcrypt_pool, self.get_password_hash, password
+        )
+
+    async def warmup(self) -> None:
+        """Run one hash on the pool so the first login doesn't pay startup costs"""
+        await self.aget_password_hash("warmup")
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Check whether a hash was made with a different cost than configured"""
+        # bcrypt hashes look like $2b$NN$<salt+digest>
+        try:
+            rounds = int(hashed_password.split("$")[2])
+        except (IndexError, ValueError):
+            return True
+        return rounds != self.BCRYPT_ROUNDS
 
     def create_access_token(
         self,
@@ -45,26 +154,35 @@ class AuthService:
         scopes: list[str] = None,
     ) -> str:
         """Create JWT access token"""
-        to_encode = data.copy()
+        now = datetime.utcnow()
 
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = now + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(
-                minutes=self.ACCESS_TOKEN_EXPIRE_MINUTES
-            )
+            expire = now + timedelta(minutes=self.ACCESS_TOKEN_EXPIRE_MINUTES)
 
-        to_encode.update(
-            {"exp": expire, "iat": datetime.utcnow(), "scopes": scopes or []}
-        )
+        # Build the claims in one dict; the caller's dict is left untouched
+        to_encode = {**data, "exp": expire, "iat": now, "scopes": scopes or []}
 
-        encoded_jwt = jwt.encode(to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM)
+        encoded_jwt = self._jwt.encode(
+            to_encode, self._secret_bytes, algorithm=self.ALGORITHM
+        )
         return encoded_jwt
 
+    def _token_digest(self, token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
     def verify_token(self, token: str) -> TokenData:
-        """Verify and decode JWT token"""
+        """Verify and decode JWT token, without the revocation check"""
+        digest = self._token_digest(token)
+        cached = self._token_cache.get(digest)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
         try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = self._jwt.decode(
+                token, self._secret_bytes, algorithms=self._algorithms
+            )
             username: str = payload.get("sub")
             user_id: int = payload.get("user_id")
             scopes: list = payload.get("scopes", [])
@@ -72,11 +190,51 @@ class AuthService:
             if username is None or user_id is None:
                 raise UnauthorizedError("Invalid token payload")
 
-            return TokenData(username=username, user_id=user_id, scopes=scopes)
+            token_data = TokenData(username=username, user_id=user_id, scopes=scopes)
 
-        except JWTError:
+        except jwt.InvalidTokenError:
             raise UnauthorizedError("Invalid token")
 
+        ttl = min(self._token_cache_ttl, payload["exp"] - time.time())
+        if ttl > 0:
+            self._token_cache[digest] = (time.monotonic() + ttl, token_data)
+            self._token_cache.move_to_end(digest)
+            while len(self._token_cache) > self._token_cache_size:
+                self._token_cache.popitem(last=False)
+        return token_data
+
+    async def averify_token(self, token: str) -> TokenData:
+        """Verify a token and reject it if it was revoked by any worker"""
+        token_data = self.verify_token(token)
+        redis_client = await get_redis()
+        revoked = await redis_client.get_cache(
+            _REVOKED_TOKEN_PREFIX + self._token_digest(token).hex()
+        )
+        if revoked is not None:
+            raise UnauthorizedError("Token has been revoked")
+        return token_data
+
+    async def arevoke_token(self, token: str) -> None:
+        """Reject a token in every worker for the rest of its lifetime"""
+        digest = self._token_digest(token)
+        self._token_cache.pop(digest, None)
+
+        try:
+            payload = self._jwt.decode(
+                token, self._secret_bytes, algorithms=self._algorithms
+            )
+        except jwt.InvalidTokenError:
+            return
+
+        # The entry expires with the token, after which decode rejects it
+        ttl = int(payload["exp"] - time.time()) + 1
+        if ttl <= 0:
+            return
+        redis_client = await get_redis()
+        await redis_client.set_cache(
+            _REVOKED_TOKEN_PREFIX + digest.hex(), {"exp": payload["exp"]}, ttl=ttl
+        )
+
     def create_user_token(
         self, user_id: int, username: str, scopes: list[str] = None
     ) -> Token:
@@ -104,19 +262,30 @@ class AuthService:
 
         return True
 
+    def shutdown(self) -> None:
+        """Stop the bcrypt worker threads"""
+        self._bcrypt_pool.shutdown(wait=False)
+
     def extract_token_from_header(self, authorization: str) -> str:
         """Extract token from Authorization header"""
         if not authorization:
             raise UnauthorizedError("Authorization header missing")
 
-        try:
-            scheme, token = authorization.split()
-            if scheme.lower() != "bearer":
+        # Prefix check and slice instead of split(); the tuple form covers
+        # the usual spellings without lowercasing the header
+        if not (
+            authorization.startswith(_BEARER_PREFIXES)
+            or authorization[:_BEARER_PREFIX_LEN].lower() == "bearer "
+        ):
+            if len(authorization.split()) == 2:
                 raise UnauthorizedError("Invalid authentication scheme")
-            return token
-        except ValueError:
             raise UnauthorizedError("Invalid authorization header format")
 
+        token = authorization[_BEARER_PREFIX_LEN:].strip()
+        if not token or " " in token:
+            raise UnauthorizedError("Invalid authorization header format")
+        return token
+
 
 # Global auth service instance
 auth_service = AuthService()
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from app.core.config import settings
+from app.core.redis import RedisClient, get_redis
+from app.core.serialization import json_loads
+from app.domain.entities import Dataset
+
+logger = logging.getLogger(__name__)
+
+# Writers announce changed datasets here so every process drops its copy
+DATASET_INVALIDATION_CHANNEL = "dataset:invalidate"
+
+
+class DatasetCache:
+    """Per-process LRU of datasets by id and by name, with a short TTL"""
+
+    def __init__(self, size: int, ttl: float):
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dataset]]" = OrderedDict()
+        self._size = size
+        self._ttl = ttl
+
+    def get(self, key: Hashable) -> Optional[Dataset]:
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() >= cached[0]:
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return cached[1]
+
+    def get_by_id(self, dataset_id: int) -> Optional[Dataset]:
+        return self.get(("id", dataset_id))
+
+    def get_by_name(self, name: str) -> Optional[Dataset]:
+        return self.get(("name", name))
+
+    def put(self, dataset: Dataset) -> None:
+        """Cache a dataset under both its id and its name"""
+        expires_at = time.monotonic() + self._ttl
+        for key in (("id", dataset.id.value), ("name", dataset.name)):
+            self._entries[key] = (expires_at, dataset)
+            self._entries.move_to_end(key)
+        while len(self._entries) > self._size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, dataset_id: int) -> None:
+        """Drop every entry for a dataset, including under an old name"""
+        stale = [
+            key
+            for key, (_, dataset) in self._entries.items()
+            if dataset.id.value == dataset_id
+        ]
+        for key in stale:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+async def publish_dataset_invalidation(dataset_id: int) -> None:
+    """Drop a changed dataset here and tell other processes to do the same"""
+    dataset_cache.invalidate(dataset_id)
+    try:
+        redis_client = await get_redis()
+        await redis_client.publish(
+            DATASET_INVALIDATION_CHANNEL, {"dataset_id": dataset_id}
+        )
+    except Exception as e:
+        # Other processes fall back on the TTL
+        logger.warning(f"Failed to publish invalidation for dataset {dataset_id}: {e}")
+
+
+async def listen_for_dataset_invalidations(redis_client: RedisClient) -> None:
+    """Drop cached datasets as other processes announce changes"""
+    try:
+        pubsub = await redis_client.subscribe(DATASET_INVALIDATION_CHANNEL)
+    except Exception as e:
+        # Without the listener cached datasets only expire on their TTL
+        logger.error(f"Dataset cache invalidation listener not started: {e}")
+        return
+
+    try:
+        async for message in pubsub.listen():
+            if message["type"] != "message":
+                continue
+            try:
+                dataset_cache.invalidate(json_loads(message["data"])["dataset_id"])
+            except Exception as e:
+                logger.error(f"Invalid dataset invalidation message: {e}")
+    except asyncio.CancelledError:
+        pass
+    finally:
+        # Anything missed while unsubscribed may be stale
+        dataset_cache.clear()
+        await pubsub.unsubscribe(DATASET_INVALIDATION_CHANNEL)
+
+
+# Global dataset cache instance
+dataset_cache = DatasetCache(settings.DATASET_CACHE_SIZE, settings.DATASET_CACHE_TTL)
+
+
+def get_dataset_cache() -> DatasetCache:
+    """Dependency to get the dataset cache"""
+    return dataset_cache
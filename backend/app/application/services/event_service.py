@@ -1,13 +1,15 @@
 import asyncio
+import functools
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional, Callable, List
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, Callable, List, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 from app.core.redis import RedisClient, get_redis
 from app.core.config import settings
+from app.core.serialization import json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -34,61 +36,92 @@ class Event:
     user_id: Optional[int] = None
     timestamp: Optional[datetime] = None
     data: Dict[str, Any] = None
+    _timestamp_iso: str = field(default=None, init=False, repr=False, compare=False)
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.now()
         if self.data is None:
             self.data = {}
+        # Events are published as-is once built; format the timestamp once
+        self._timestamp_iso = self.timestamp.isoformat()
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "type": self.type.value,
-            "workflow_id": self.workflow_id,
-            "run_id": self.run_id,
-            "task_id": self.task_id,
-            "user_id": self.user_id,
-            "timestamp": self.timestamp.isoformat(),
-            "data": self.data,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "type": self.type.value,
+                "workflow_id": self.workflow_id,
+                "run_id": self.run_id,
+                "task_id": self.task_id,
+                "user_id": self.user_id,
+                "timestamp": self._timestamp_iso,
+                "data": self.data,
+            }
+        return self._dict_cache
+
+
+# Workflow, run and user ids repeat across events, so channel names are
+# built once per id
+@functools.lru_cache(maxsize=4096)
+def _workflow_channel(prefix: str, workflow_id: str, run_id: Optional[str]) -> str:
+    if run_id:
+        return f"{prefix}:workflow:{workflow_id}:run:{run_id}"
+    return f"{prefix}:workflow:{workflow_id}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _user_channel(prefix: str, user_id: int) -> str:
+    return f"{prefix}:user:{user_id}"
 
 
 class EventService:
-    def __init__(self, redis_client: RedisClient):
+    # Queued publishes are flushed in pipelines of up to BATCH_MAX messages,
+    # waiting BATCH_WAIT seconds for a burst to accumulate
+    BATCH_MAX = 100
+    BATCH_WAIT = 0.005
+
+    def __init__(self, redis_client: RedisClient, batched: bool = False):
         self.redis = redis_client
         self.subscribers: Dict[str, List[Callable]] = {}
+        self.batched = batched
+        self._prefix = settings.WEBSOCKET_CHANNEL_PREFIX
+        self._global_channel = f"{self._prefix}:global"
+        self._publish_queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
 
     def get_channel_name(self, workflow_id: str, run_id: Optional[str] = None) -> str:
         """Generate Redis channel name for workflow events"""
-        if run_id:
-            return f"{settings.WEBSOCKET_CHANNEL_PREFIX}:workflow:{workflow_id}:run:{run_id}"
-        return f"{settings.WEBSOCKET_CHANNEL_PREFIX}:workflow:{workflow_id}"
+        return _workflow_channel(self._prefix, workflow_id, run_id)
 
     def get_global_channel_name(self) -> str:
         """Get global events channel name"""
-        return f"{settings.WEBSOCKET_CHANNEL_PREFIX}:global"
+        return self._global_channel
 
     def get_user_channel_name(self, user_id: int) -> str:
         """Get user-specific events channel name"""
-        return f"{settings.WEBSOCKET_CHANNEL_PREFIX}:user:{user_id}"
+        return _user_channel(self._prefix, user_id)
 
     async def publish_event(self, event: Event) -> None:
         """Publish event to relevant channels"""
         try:
-            event_data = event.to_dict()
-
-            # Publish to workflow-specific channel
-            workflow_channel = self.get_channel_name(event.workflow_id, event.run_id)
-            await self.redis.publish(workflow_channel, event_data)
-
-            # Publish to global events channel
-            global_channel = self.get_global_channel_name()
-            await self.redis.publish(global_channel, event_data)
-
-            # Publish to user-specific channel if user_id is provided
+            # Encode once; every channel gets the same bytes
+            payload = json_dumps(event.to_dict())
+
+            # Workflow-specific and global channels, plus the user's channel
+            # if user_id is provided, all in one pipelined round-trip
+            messages = [
+                (self.get_channel_name(event.workflow_id, event.run_id), payload),
+                (self.get_global_channel_name(), payload),
+            ]
             if event.user_id:
-                user_channel = self.get_user_channel_name(event.user_id)
-                await self.redis.publish(user_channel, event_data)
+                messages.append((self.get_user_channel_name(event.user_id), payload))
+            if self.batched:
+                self._enqueue(messages)
+            else:
+                await self.redis.publish_many(messages)
 
             logger.info(
                 f"Published event {event.type} for workflow {event.workflow_id}"
@@ -98,6 +131,44 @@ class EventService:
             logger.error(f"Failed to publish event {event.type}: {e}")
             raise
 
+    def _enqueue(self, messages: List[Tuple[str, bytes]]) -> None:
+        """Hand messages to the background flusher"""
+        if self._publish_queue is None:
+            self._publish_queue = asyncio.Queue()
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flusher())
+        for message in messages:
+            self._publish_queue.put_nowait(message)
+
+    async def _flusher(self) -> None:
+        """Coalesce queued messages into pipelined publishes"""
+        queue = self._publish_queue
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(self.BATCH_WAIT)
+            while len(batch) < self.BATCH_MAX and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                await self.redis.publish_many(batch)
+            except Exception as e:
+                logger.error(f"Failed to publish batch of {len(batch)} messages: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued message has been published"""
+        if self._publish_queue is not None and self._flusher_task is not None:
+            await self._publish_queue.join()
+
+    async def close(self) -> None:
+        """Flush pending messages and stop the flusher"""
+        await self.flush()
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            self._flusher_task = None
+
     async def subscribe_to_workflow(
         self, workflow_id: str, run_id: Optional[str] = None
     ):
@@ -133,6 +204,26 @@ class EventService:
         cache_key = f"workflow_status:{workflow_id}:{run_id}"
         return await self.redis.get_cache(cache_key)
 
+    async def cache_workflow_statuses(
+        self, items: List[Tuple[str, str, Dict[str, Any]]], ttl: int = 3600
+    ):
+        """Cache several (workflow_id, run_id, status_data) entries at once"""
+        await self.redis.set_cache_many(
+            [
+                (f"workflow_status:{workflow_id}:{run_id}", status_data)
+                for workflow_id, run_id, status_data in items
+            ],
+            ttl,
+        )
+
+    async def get_cached_workflow_statuses(
+        self, keys: List[Tuple[str, str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Get cached statuses for several (workflow_id, run_id) pairs, in order"""
+        return await self.redis.get_cache_many(
+            [f"workflow_status:{workflow_id}:{run_id}" for workflow_id, run_id in keys]
+        )
+
     async def clear_workflow_cache(self, workflow_id: str, run_id: str):
         """Clear cached workflow status"""
         cache_key = f"workflow_status:{workflow_id}:{run_id}"
@@ -226,14 +317,24 @@ class WorkflowEventPublisher:
 
 
 # Global instances
+_event_service: Optional[EventService] = None
+_workflow_event_publisher: Optional[WorkflowEventPublisher] = None
+
+
 def get_event_service() -> EventService:
     """Dependency to get event service"""
-    from app.core.redis import redis_client
+    global _event_service
+    if _event_service is None:
+        from app.core.redis import redis_client
 
-    return EventService(redis_client)
+        # Shared by the whole process so concurrent publishes coalesce
+        _event_service = EventService(redis_client, batched=True)
+    return _event_service
 
 
 def get_workflow_event_publisher() -> WorkflowEventPublisher:
     """Dependency to get workflow event publisher"""
-    event_service = get_event_service()
-    return WorkflowEventPublisher(event_service)
+    global _workflow_event_publisher
+    if _workflow_event_publisher is None:
+        _workflow_event_publisher = WorkflowEventPublisher(get_event_service())
+    return _workflow_event_publisher
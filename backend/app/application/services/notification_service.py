@@ -1,13 +1,14 @@
+import asyncio
 import httpx
-import json
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, HttpUrl
 
 from app.core.config import settings
 from app.core.retry import with_retry, EXTERNAL_SERVICE_RETRY
+from app.core.serialization import json_dumps
 from app.shared.exceptions import ExternalServiceError
 
 logger = logging.getLogger(__name__)
@@ -53,11 +54,138 @@ class WebhookMessage(BaseModel):
     metadata: Dict[str, Any] = {}
 
 
+# Same shape as SlackMessage; the send path emits plain dicts
+SLACK_MESSAGE_DEFAULTS: Dict[str, Any] = {
+    "username": "SVOps Bot",
+    "icon_emoji": ":robot_face:",
+    "channel": None,
+    "attachments": [],
+    "blocks": [],
+}
+
+SEVERITY_COLORS = {"error": "danger", "warning": "warning", "info": "good"}
+
+
+def _slack_template(
+    text: str, color: str, fields: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    return {
+        **SLACK_MESSAGE_DEFAULTS,
+        "text": text,
+        "attachments": [
+            {
+                "color": color,
+                "fields": fields
+                + [{"title": "Timestamp", "value": "{timestamp}", "short": True}],
+            }
+        ],
+    }
+
+
+def _workflow_fields(status: str) -> List[Dict[str, Any]]:
+    return [
+        {"title": "Workflow ID", "value": "{workflow_id}", "short": True},
+        {"title": "Run ID", "value": "{run_id}", "short": True},
+        {"title": "Status", "value": status, "short": True},
+    ]
+
+
+# Built once at import; placeholders are filled per notification
+SLACK_TEMPLATES: Dict[NotificationType, Dict[str, Any]] = {
+    NotificationType.WORKFLOW_STARTED: _slack_template(
+        "🚀 Workflow Started", "good", _workflow_fields("Running")
+    ),
+    NotificationType.WORKFLOW_COMPLETED: _slack_template(
+        "✅ Workflow Completed Successfully", "good", _workflow_fields("Completed")
+    ),
+    NotificationType.WORKFLOW_FAILED: _slack_template(
+        "❌ Workflow Failed", "danger", _workflow_fields("Failed")
+    ),
+    NotificationType.WORKFLOW_STOPPED: _slack_template(
+        "⏹️ Workflow Stopped", "warning", _workflow_fields("Stopped")
+    ),
+    NotificationType.TASK_FAILED: _slack_template(
+        "⚠️ Task Failed",
+        "warning",
+        [
+            {"title": "Workflow ID", "value": "{workflow_id}", "short": True},
+            {"title": "Run ID", "value": "{run_id}", "short": True},
+            {"title": "Task ID", "value": "{task_id}", "short": True},
+        ],
+    ),
+    NotificationType.SYSTEM_ERROR: _slack_template(
+        "🔥 System {severity}",
+        "{color}",
+        [
+            {"title": "Message", "value": "{message}", "short": False},
+            {"title": "Severity", "value": "{severity}", "short": True},
+        ],
+    ),
+}
+
+
+def _render_template(template: Any, values: Dict[str, Any]) -> Any:
+    """Copy a template, filling placeholders in string leaves"""
+    if isinstance(template, str):
+        return template.format_map(values) if "{" in template else template
+    if isinstance(template, dict):
+        return {key: _render_template(value, values) for key, value in template.items()}
+    if isinstance(template, list):
+        return [_render_template(item, values) for item in template]
+    return template
+
+
 class NotificationService:
     def __init__(self):
         self.notification_configs: List[NotificationConfig] = []
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._senders = {
+            NotificationChannel.SLACK: self._send_slack_notification,
+            NotificationChannel.WEBHOOK: self._send_webhook_notification,
+        }
+        self._webhook_metadata_by_config: Dict[str, Dict[str, Any]] = {}
+        self._compiled_filters: Dict[str, Callable[[Dict[str, Any]], bool]] = {}
+        self._senders_by_config: Dict[str, Optional[Callable]] = {}
         self._load_configs()
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Pooled HTTP client, rebuilt if closed or bound to another event loop"""
+        loop = asyncio.get_running_loop()
+        if (
+            self._client is None
+            or self._client.is_closed
+            or self._client_loop is not loop
+        ):
+            self._retire_client()
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+            )
+            self._client_loop = loop
+        return self._client
+
+    def _retire_client(self) -> None:
+        """Close a client being replaced on the event loop its sockets belong to"""
+        old_client, old_loop = self._client, self._client_loop
+        self._client = None
+        self._client_loop = None
+        if old_client is None or old_client.is_closed or old_loop is None:
+            return
+        if old_loop.is_running():
+            asyncio.run_coroutine_threadsafe(old_client.aclose(), old_loop)
+        else:
+            # A stopped loop can't run the close; its sockets go with the loop
+            logger.debug("Dropping HTTP client bound to a stopped event loop")
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
     def _load_configs(self):
         """Load notification configurations from settings"""
         # TODO: Load from database or configuration file
@@ -67,6 +195,14 @@ class NotificationService:
     def add_config(self, config: NotificationConfig):
         """Add notification configuration"""
         self.notification_configs.append(config)
+        self._webhook_metadata_by_config[config.name] = self._build_webhook_metadata(
+            config
+        )
+        self._compiled_filters[config.name] = self._compile_filter(config)
+        self._senders_by_config[config.name] = self._senders.get(config.channel)
+
+    def _build_webhook_metadata(self, config: NotificationConfig) -> Dict[str, Any]:
+        return {"source": "svops", "version": "1.0.0", "config_name": config.name}
 
     async def send_workflow_notification(
         self,
@@ -89,20 +225,15 @@ class NotificationService:
                 "additional_data": additional_data or {},
             }
 
-            # Send to all configured channels
-            for config in self.notification_configs:
-                if not config.enabled:
-                    continue
-
-                if notification_type not in config.notification_types:
-                    continue
-
-                if not self._should_send_notification(config, notification_data):
-                    continue
-
-                await self._send_notification(
-                    config, notification_type, notification_data
-                )
+            # Send to all matching channels concurrently
+            targets = [
+                config
+                for config in self.notification_configs
+                if config.enabled
+                and notification_type in config.notification_types
+                and self._should_send_notification(config, notification_data)
+            ]
+            await self._send_to_targets(targets, notification_type, notification_data)
 
         except Exception as e:
             logger.error(f"Error sending workflow notification: {e}")
@@ -123,38 +254,70 @@ class NotificationService:
                 "additional_data": additional_data or {},
             }
 
-            for config in self.notification_configs:
-                if not config.enabled:
-                    continue
-
-                if notification_type not in config.notification_types:
-                    continue
-
-                await self._send_notification(
-                    config, notification_type, notification_data
-                )
+            targets = [
+                config
+                for config in self.notification_configs
+                if config.enabled and notification_type in config.notification_types
+            ]
+            await self._send_to_targets(targets, notification_type, notification_data)
 
         except Exception as e:
             logger.error(f"Error sending system notification: {e}")
 
+    async def _send_to_targets(
+        self,
+        targets: List[NotificationConfig],
+        notification_type: NotificationType,
+        data: Dict[str, Any],
+    ):
+        """Send to every target at once so one slow endpoint doesn't hold up the rest"""
+        results = await asyncio.gather(
+            *(
+                self._send_notification(config, notification_type, data)
+                for config in targets
+            ),
+            return_exceptions=True,
+        )
+        for config, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending notification to {config.name}: {result}")
+
     def _should_send_notification(
         self, config: NotificationConfig, data: Dict[str, Any]
     ) -> bool:
         """Check if notification should be sent based on filters"""
+        compiled = self._compiled_filters.get(config.name)
+        if compiled is None:
+            compiled = self._compiled_filters[config.name] = self._compile_filter(
+                config
+            )
+        return compiled(data)
+
+    def _compile_filter(
+        self, config: NotificationConfig
+    ) -> Callable[[Dict[str, Any]], bool]:
+        """Turn a config's filters into a single predicate over notification data"""
         if not config.filters:
-            return True
+            return lambda data: True
 
-        # Apply filters
+        # A filter only applies when its key is present in the data
+        predicates = []
         for filter_key, filter_value in config.filters.items():
-            if filter_key in data:
-                if isinstance(filter_value, list):
-                    if data[filter_key] not in filter_value:
-                        return False
-                else:
-                    if data[filter_key] != filter_value:
-                        return False
+            if isinstance(filter_value, list):
+                try:
+                    allowed = frozenset(filter_value)
+                except TypeError:
+                    allowed = tuple(filter_value)
+                predicates.append(
+                    lambda data, k=filter_key, v=allowed: k not in data or data[k] in v
+                )
+            else:
+                predicates.append(
+                    lambda data, k=filter_key, v=filter_value: k not in data
+                    or data[k] == v
+                )
 
-        return True
+        return lambda data: all(predicate(data) for predicate in predicates)
 
     async def _send_notification(
         self,
@@ -164,12 +327,15 @@ class NotificationService:
     ):
         """Send notification to specific channel"""
         try:
-            if config.channel == NotificationChannel.SLACK:
-                await self._send_slack_notification(config, notification_type, data)
-            elif config.channel == NotificationChannel.WEBHOOK:
-                await self._send_webhook_notification(config, notification_type, data)
+            if config.name in self._senders_by_config:
+                sender = self._senders_by_config[config.name]
             else:
+                sender = self._senders.get(config.channel)
+            if sender is None:
                 logger.warning(f"Unsupported notification channel: {config.channel}")
+                return
+
+            await sender(config, notification_type, data)
 
         except Exception as e:
             logger.error(f"Error sending notification to {config.name}: {e}")
@@ -182,22 +348,20 @@ class NotificationService:
         data: Dict[str, Any],
     ):
         """Send Slack notification"""
-        slack_message = self._build_slack_message(notification_type, data)
-
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                str(config.webhook_url),
-                json=slack_message.dict(),
-                headers={"Content-Type": "application/json"},
-                timeout=30.0,
-            )
+        slack_payload = self._build_slack_message(notification_type, data)
 
-            if response.status_code != 200:
-                raise ExternalServiceError(
-                    f"Slack API error: {response.status_code} - {response.text}"
-                )
+        response = await self.client.post(
+            str(config.webhook_url),
+            content=json_dumps(slack_payload),
+            headers={"Content-Type": "application/json"},
+        )
+
+        if response.status_code != 200:
+            raise ExternalServiceError(
+                f"Slack API error: {response.status_code} - {response.text}"
+            )
 
-            logger.info(f"Slack notification sent successfully to {config.name}")
+        logger.info(f"Slack notification sent successfully to {config.name}")
 
     @with_retry(EXTERNAL_SERVICE_RETRY)
     async def _send_webhook_notification(
@@ -207,201 +371,55 @@ class NotificationService:
         data: Dict[str, Any],
     ):
         """Send webhook notification"""
-        webhook_message = WebhookMessage(
-            event_type=notification_type.value,
-            timestamp=datetime.now().isoformat(),
-            data=data,
-            metadata={
-                "source": "svops",
-                "version": "1.0.0",
-                "config_name": config.name,
-            },
+        metadata = self._webhook_metadata_by_config.get(config.name)
+        if metadata is None:
+            metadata = self._webhook_metadata_by_config[config.name] = (
+                self._build_webhook_metadata(config)
+            )
+
+        # Same shape as WebhookMessage, built directly to skip model validation
+        webhook_payload = {
+            "event_type": notification_type.value,
+            "timestamp": datetime.now().isoformat(),
+            "data": data,
+            "metadata": metadata,
+        }
+
+        response = await self.client.post(
+            str(config.webhook_url),
+            content=json_dumps(webhook_payload),
+            headers={"Content-Type": "application/json"},
         )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                str(config.webhook_url),
-                json=webhook_message.dict(),
-                headers={"Content-Type": "application/json"},
-                timeout=30.0,
+        if response.status_code not in [200, 201, 202]:
+            raise ExternalServiceError(
+                f"Webhook error: {response.status_code} - {response.text}"
             )
 
-            if response.status_code not in [200, 201, 202]:
-                raise ExternalServiceError(
-                    f"Webhook error: {response.status_code} - {response.text}"
-                )
-
-            logger.info(f"Webhook notification sent successfully to {config.name}")
+        logger.info(f"Webhook notification sent successfully to {config.name}")
 
     def _build_slack_message(
         self, notification_type: NotificationType, data: Dict[str, Any]
-    ) -> SlackMessage:
-        """Build Slack message based on notification type"""
-
-        if notification_type == NotificationType.WORKFLOW_STARTED:
-            return self._build_workflow_started_slack_message(data)
-        elif notification_type == NotificationType.WORKFLOW_COMPLETED:
-            return self._build_workflow_completed_slack_message(data)
-        elif notification_type == NotificationType.WORKFLOW_FAILED:
-            return self._build_workflow_failed_slack_message(data)
-        elif notification_type == NotificationType.WORKFLOW_STOPPED:
-            return self._build_workflow_stopped_slack_message(data)
-        elif notification_type == NotificationType.TASK_FAILED:
-            return self._build_task_failed_slack_message(data)
-        elif notification_type == NotificationType.SYSTEM_ERROR:
-            return self._build_system_error_slack_message(data)
-        else:
-            return SlackMessage(text=f"Unknown notification type: {notification_type}")
-
-    def _build_workflow_started_slack_message(
-        self, data: Dict[str, Any]
-    ) -> SlackMessage:
-        workflow_id = data.get("workflow_id", "Unknown")
-        run_id = data.get("run_id", "Unknown")
-
-        return SlackMessage(
-            text=f"🚀 Workflow Started",
-            attachments=[
-                {
-                    "color": "good",
-                    "fields": [
-                        {"title": "Workflow ID", "value": workflow_id, "short": True},
-                        {"title": "Run ID", "value": run_id, "short": True},
-                        {"title": "Status", "value": "Running", "short": True},
-                        {
-                            "title": "Timestamp",
-                            "value": data.get("timestamp", ""),
-                            "short": True,
-                        },
-                    ],
-                }
-            ],
-        )
-
-    def _build_workflow_completed_slack_message(
-        self, data: Dict[str, Any]
-    ) -> SlackMessage:
-        workflow_id = data.get("workflow_id", "Unknown")
-        run_id = data.get("run_id", "Unknown")
-
-        return SlackMessage(
-            text=f"✅ Workflow Completed Successfully",
-            attachments=[
-                {
-                    "color": "good",
-                    "fields": [
-                        {"title": "Workflow ID", "value": workflow_id, "short": True},
-                        {"title": "Run ID", "value": run_id, "short": True},
-                        {"title": "Status", "value": "Completed", "short": True},
-                        {
-                            "title": "Timestamp",
-                            "value": data.get("timestamp", ""),
-                            "short": True,
-                        },
-                    ],
-                }
-            ],
-        )
-
-    def _build_workflow_failed_slack_message(
-        self, data: Dict[str, Any]
-    ) -> SlackMessage:
-        workflow_id = data.get("workflow_id", "Unknown")
-        run_id = data.get("run_id", "Unknown")
-
-        return SlackMessage(
-            text=f"❌ Workflow Failed",
-            attachments=[
-                {
-                    "color": "danger",
-                    "fields": [
-                        {"title": "Workflow ID", "value": workflow_id, "short": True},
-                        {"title": "Run ID", "value": run_id, "short": True},
-                        {"title": "Status", "value": "Failed", "short": True},
-                        {
-                            "title": "Timestamp",
-                            "value": data.get("timestamp", ""),
-                            "short": True,
-                        },
-                    ],
-                }
-            ],
-        )
-
-    def _build_workflow_stopped_slack_message(
-        self, data: Dict[str, Any]
-    ) -> SlackMessage:
-        workflow_id = data.get("workflow_id", "Unknown")
-        run_id = data.get("run_id", "Unknown")
-
-        return SlackMessage(
-            text=f"⏹️ Workflow Stopped",
-            attachments=[
-                {
-                    "color": "warning",
-                    "fields": [
-                        {"title": "Workflow ID", "value": workflow_id, "short": True},
-                        {"title": "Run ID", "value": run_id, "short": True},
-                        {"title": "Status", "value": "Stopped", "short": True},
-                        {
-                            "title": "Timestamp",
-                            "value": data.get("timestamp", ""),
-                            "short": True,
-                        },
-                    ],
-                }
-            ],
-        )
-
-    def _build_task_failed_slack_message(self, data: Dict[str, Any]) -> SlackMessage:
-        workflow_id = data.get("workflow_id", "Unknown")
-        run_id = data.get("run_id", "Unknown")
-        task_id = data.get("task_id", "Unknown")
-
-        return SlackMessage(
-            text=f"⚠️ Task Failed",
-            attachments=[
-                {
-                    "color": "warning",
-                    "fields": [
-                        {"title": "Workflow ID", "value": workflow_id, "short": True},
-                        {"title": "Run ID", "value": run_id, "short": True},
-                        {"title": "Task ID", "value": task_id, "short": True},
-                        {
-                            "title": "Timestamp",
-                            "value": data.get("timestamp", ""),
-                            "short": True,
-                        },
-                    ],
-                }
-            ],
-        )
+    ) -> Dict[str, Any]:
+        """Build Slack payload based on notification type"""
+        template = SLACK_TEMPLATES.get(notification_type)
+        if template is None:
+            return {
+                **SLACK_MESSAGE_DEFAULTS,
+                "text": f"Unknown notification type: {notification_type}",
+            }
 
-    def _build_system_error_slack_message(self, data: Dict[str, Any]) -> SlackMessage:
-        message = data.get("message", "Unknown error")
         severity = data.get("severity", "info")
-
-        color = {"error": "danger", "warning": "warning", "info": "good"}.get(
-            severity, "good"
-        )
-
-        return SlackMessage(
-            text=f"🔥 System {severity.title()}",
-            attachments=[
-                {
-                    "color": color,
-                    "fields": [
-                        {"title": "Message", "value": message, "short": False},
-                        {"title": "Severity", "value": severity.title(), "short": True},
-                        {
-                            "title": "Timestamp",
-                            "value": data.get("timestamp", ""),
-                            "short": True,
-                        },
-                    ],
-                }
-            ],
-        )
+        values = {
+            "workflow_id": data.get("workflow_id", "Unknown"),
+            "run_id": data.get("run_id", "Unknown"),
+            "task_id": data.get("task_id", "Unknown"),
+            "timestamp": data.get("timestamp", ""),
+            "message": data.get("message", "Unknown error"),
+            "severity": severity.title(),
+            "color": SEVERITY_COLORS.get(severity, "good"),
+        }
+        return _render_template(template, values)
 
 
 # Global notification service instance
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from app.core.database import AsyncSessionLocal
+from app.domain.value_objects import WorkflowRunId
+from app.infrastructure.repositories.unit_of_work import SQLAlchemyUnitOfWork
+from app.shared.types import WorkflowStatus
+
+logger = logging.getLogger(__name__)
+
+
+class StatusWriter:
+    """Coalesces WorkflowRun status updates from concurrent monitors into batched writes"""
+
+    # Queued updates are written in one statement of up to BATCH_MAX rows,
+    # waiting BATCH_WAIT seconds for other monitors to contribute
+    BATCH_MAX = 100
+    BATCH_WAIT = 0.1
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def submit(
+        self,
+        run_id: str,
+        status: WorkflowStatus,
+        start_date: Optional[datetime] = None,
+    ) -> None:
+        """Queue a status update for the background flusher"""
+        loop = asyncio.get_running_loop()
+        # Celery tasks may each run in their own loop
+        if self._loop is not loop:
+            self._queue = asyncio.Queue()
+            self._flusher_task = None
+            self._loop = loop
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flusher())
+        self._queue.put_nowait((run_id, status, start_date))
+
+    async def _flusher(self) -> None:
+        """Drain queued updates into batched UPDATEs"""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(self.BATCH_WAIT)
+            while len(batch) < self.BATCH_MAX and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            # Later updates for the same run supersede earlier ones
+            latest: Dict[str, Tuple[WorkflowStatus, Optional[datetime]]] = {}
+            for run_id, status, start_date in batch:
+                latest[run_id] = (status, start_date)
+
+            try:
+                async with AsyncSessionLocal() as db:
+                    uow = SQLAlchemyUnitOfWork(db)
+                    async with uow:
+                        await uow.workflow_runs.transition_statuses(
+                            [
+                                (WorkflowRunId(run_id), status, start_date)
+                                for run_id, (status, start_date) in latest.items()
+                            ]
+                        )
+                        await uow.commit()
+            except Exception as e:
+                logger.error(f"Failed to write batch of {len(latest)} run statuses: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued update has been written"""
+        if self._queue is not None and self._flusher_task is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush pending updates and stop the flusher"""
+        await self.flush()
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            self._flusher_task = None
+
+
+_status_writer: Optional[StatusWriter] = None
+
+
+def get_status_writer() -> StatusWriter:
+    """Get the process-wide status writer"""
+    global _status_writer
+    if _status_writer is None:
+        _status_writer = StatusWriter()
+    return _status_writer
@@ -3,12 +3,15 @@ Celery tasks for DAG chain execution monitoring and management
 """
 
 import asyncio
-from typing import List, Optional
+import random
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime
 import logging
 
-from app.core.celery_app import celery_app
-from app.application.services.airflow_service import AirflowClient
+from app.core.celery_app import celery_app, run_coroutine
+from app.application.services.airflow_service import get_airflow_client
+from app.application.services.status_writer import get_status_writer
 from app.application.use_cases.workflow_use_cases import (
     WorkflowUseCases,
     TriggerWorkflowCommand,
@@ -16,7 +19,12 @@ from app.application.use_cases.workflow_use_cases import (
 from app.application.use_cases.task_use_cases import TaskUseCases
 from app.infrastructure.repositories.unit_of_work import SQLAlchemyUnitOfWork
 from app.shared.types import WorkflowStatus, TaskStatus
+from app.core.config import settings
 from app.core.database import AsyncSessionLocal
+from app.core.redis import get_redis
+from app.core.serialization import parse_iso_datetime
+from app.domain.entities import WorkflowRun
+from app.domain.value_objects import WorkflowRunId
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +34,41 @@ DAG_EXECUTION_CHAIN = [
     "ml_training_pipeline",
     "simple_workflow_example",
 ]
+DAG_CHAIN_LEN = len(DAG_EXECUTION_CHAIN)
+# Position of each DAG in the chain
+DAG_INDEX: Dict[str, int] = {
+    dag_id: index for index, dag_id in enumerate(DAG_EXECUTION_CHAIN)
+}
+
+
+class _ChainEntry(NamedTuple):
+    dag_id: str
+    workflow_name: str
+    description: str
+    next_dag: Optional[str]
+
+
+# Per-step constants, computed once instead of on every chain transition
+DAG_CHAIN_META = tuple(
+    _ChainEntry(
+        dag_id=dag_id,
+        workflow_name=dag_id.replace("_", " ").title(),
+        description=f"Auto-created workflow for {dag_id}",
+        next_dag=(
+            DAG_EXECUTION_CHAIN[index + 1] if index + 1 < DAG_CHAIN_LEN else None
+        ),
+    )
+    for index, dag_id in enumerate(DAG_EXECUTION_CHAIN)
+)
+
+# Chain workflows are looked up by dag_id, whose row never changes once created
+_WORKFLOW_ID_CACHE: Dict[str, str] = {}
+
+# How long a chain run stays registered for the completion callback
+CHAIN_RUN_TTL = 24 * 60 * 60  # seconds
+
+# Airflow states that end a chain step
+FINISHED_DAG_RUN_STATES = ("success", "failed")
 
 
 @celery_app.task(bind=True, max_retries=3)
@@ -41,7 +84,7 @@ def monitor_dag_chain_completion(
         )
 
         # Run async monitoring in sync context
-        asyncio.run(_monitor_dag_completion_async(task_id, workflow_run_id, dag_index))
+        run_coroutine(_monitor_dag_completion_async(task_id, workflow_run_id, dag_index))
 
     except Exception as exc:
         logger.error(f"DAG chain monitoring failed: {str(exc)}")
@@ -54,129 +97,92 @@ async def _monitor_dag_completion_async(
 ):
     """Async implementation of DAG completion monitoring"""
 
-    airflow_client = AirflowClient()
-
     async with AsyncSessionLocal() as db:
         uow = SQLAlchemyUnitOfWork(db)
-        workflow_use_cases = WorkflowUseCases(uow)
-        task_use_cases = TaskUseCases(uow)
+        async with uow:
+            status = await uow.workflow_runs.get_status(WorkflowRunId(workflow_run_id))
 
-        max_wait_minutes = 60  # Maximum wait time
-        check_interval = 30  # Check every 30 seconds
-        total_checks = (max_wait_minutes * 60) // check_interval
+    if status is None:
+        logger.error(f"WorkflowRun {workflow_run_id} not found")
+        return
+    # A run already marked finished may still have its chain step to take;
+    # late or redelivered monitors stop at the first poll once it is claimed
+
+    # Only one monitor per run at a time
+    lock_key = f"dag_chain_monitor:{workflow_run_id}"
+    redis_client = await get_redis()
+    if not await redis_client.acquire_lock(
+        lock_key, ttl=settings.DAG_MONITOR_MAX_WAIT_MINUTES * 60
+    ):
+        logger.info(f"WorkflowRun {workflow_run_id} is already being monitored")
+        return
+    try:
+        await _poll_dag_run(task_id, workflow_run_id, dag_index)
+    finally:
+        await redis_client.delete_cache(lock_key)
 
-        for check_count in range(total_checks):
-            try:
-                # Get current WorkflowRun from database
-                async with uow:
-                    from app.domain.value_objects import WorkflowRunId
 
-                    workflow_run = await uow.workflow_runs.get_by_id(
-                        WorkflowRunId(workflow_run_id)
-                    )
+async def _poll_dag_run(task_id: int, workflow_run_id: str, dag_index: int):
+    """Poll Airflow for a run until it finishes or the wait limit passes"""
 
-                    if not workflow_run:
-                        logger.error(f"WorkflowRun {workflow_run_id} not found")
-                        return
+    airflow_client = get_airflow_client()
 
-                    # Get workflow to get DAG ID
-                    workflow = await uow.workflows.get_by_id(workflow_run.workflow_id)
-                    if not workflow:
-                        logger.error(
-                            f"Workflow {workflow_run.workflow_id.value} not found"
-                        )
-                        return
+    async with AsyncSessionLocal() as db:
+        uow = SQLAlchemyUnitOfWork(db)
+        task_use_cases = TaskUseCases(uow)
 
-                # Check DAG status in Airflow
-                try:
-                    dag_run_response = await airflow_client.get_dag_run_status(
-                        dag_id=workflow.dag_id, dag_run_id=workflow_run_id
-                    )
+        # dag_id never changes for a run, so read it once up front
+        async with uow:
+            workflow_run = await uow.workflow_runs.get_by_id(
+                WorkflowRunId(workflow_run_id)
+            )
 
-                    airflow_state = dag_run_response.get("state")
-                    logger.info(
-                        f"DAG {workflow.dag_id} run {workflow_run_id} state: {airflow_state}"
-                    )
+            if not workflow_run:
+                logger.error(f"WorkflowRun {workflow_run_id} not found")
+                return
 
-                    if airflow_state == "success":
-                        logger.info(f"DAG {workflow.dag_id} completed successfully!")
-
-                        # Update WorkflowRun status
-                        async with uow:
-                            workflow_run.update_status(WorkflowStatus.SUCCESS)
-                            if dag_run_response.get("end_date"):
-                                workflow_run.end_date = datetime.fromisoformat(
-                                    dag_run_response["end_date"].replace("Z", "+00:00")
-                                )
-                            await uow.workflow_runs.update(workflow_run)
-                            await uow.commit()
-
-                        # Trigger next DAG if exists
-                        next_dag_index = dag_index + 1
-                        if next_dag_index < len(DAG_EXECUTION_CHAIN):
-                            await _trigger_next_dag(
-                                task_id,
-                                next_dag_index,
-                                workflow_run.configuration.parameters,
-                            )
-                        else:
-                            # All DAGs completed - update task status
-                            logger.info(f"All DAGs completed for task {task_id}")
-                            await task_use_cases.update_task_status(
-                                task_id, TaskStatus.COMPLETED
-                            )
-
-                        return  # Exit monitoring
-
-                    elif airflow_state == "failed":
-                        logger.error(f"DAG {workflow.dag_id} failed!")
-
-                        # Update WorkflowRun and Task status to failed
-                        async with uow:
-                            workflow_run.update_status(WorkflowStatus.FAILED)
-                            await uow.workflow_runs.update(workflow_run)
-                            await uow.commit()
-
-                        await task_use_cases.update_task_status(
-                            task_id, TaskStatus.FAILED
-                        )
-                        return  # Exit monitoring
-
-                    elif airflow_state in ["running", "queued"]:
-                        # Still running, continue monitoring
-                        logger.info(
-                            f"DAG {workflow.dag_id} still {airflow_state}, continuing to monitor..."
-                        )
-
-                        # Update WorkflowRun status if needed
-                        current_status = (
-                            WorkflowStatus.RUNNING
-                            if airflow_state == "running"
-                            else WorkflowStatus.QUEUED
-                        )
-                        if workflow_run.status != current_status:
-                            async with uow:
-                                workflow_run.update_status(current_status)
-                                if airflow_state == "running" and dag_run_response.get(
-                                    "start_date"
-                                ):
-                                    workflow_run.start_date = datetime.fromisoformat(
-                                        dag_run_response["start_date"].replace(
-                                            "Z", "+00:00"
-                                        )
-                                    )
-                                await uow.workflow_runs.update(workflow_run)
-                                await uow.commit()
+            workflow = await uow.workflows.get_by_id(workflow_run.workflow_id)
+            if not workflow:
+                logger.error(f"Workflow {workflow_run.workflow_id.value} not found")
+                return
 
-                except Exception as e:
-                    logger.warning(f"Failed to get DAG status from Airflow: {str(e)}")
+        dag_id = workflow.dag_id
+        deadline = time.monotonic() + settings.DAG_MONITOR_MAX_WAIT_MINUTES * 60
+        check_count = 0
+        last_state = None
 
-                # Wait before next check
-                await asyncio.sleep(check_interval)
+        while time.monotonic() < deadline:
+            try:
+                # Check DAG status in Airflow
+                dag_run_response = await airflow_client.get_dag_run_status(
+                    dag_id=dag_id, dag_run_id=workflow_run_id
+                )
+
+                # Most ticks see no change; only act when the state moves
+                state = dag_run_response.get("state")
+                if state == last_state:
+                    logger.debug(f"DAG {dag_id} run {workflow_run_id} still {state}")
+                elif await _apply_dag_run_state(
+                    uow,
+                    task_use_cases,
+                    task_id,
+                    workflow_run,
+                    dag_id,
+                    dag_index,
+                    dag_run_response,
+                ):
+                    return  # Exit monitoring
+                else:
+                    last_state = state
 
             except Exception as e:
-                logger.error(f"Error in DAG monitoring loop: {str(e)}")
-                await asyncio.sleep(check_interval)
+                logger.warning(f"DAG status check failed: {str(e)}")
+
+            # Wait before next check
+            await asyncio.sleep(_poll_delay(check_count))
+            check_count += 1
+
+        await get_status_writer().flush()
 
         # Timeout reached
         logger.warning(
@@ -184,74 +190,420 @@ async def _monitor_dag_completion_async(
         )
 
 
-async def _trigger_next_dag(task_id: int, dag_index: int, original_parameters: dict):
-    """Trigger the next DAG in the chain"""
+def _parse_airflow_date(value: Optional[str]) -> Optional[datetime]:
+    return parse_iso_datetime(value) if value else None
 
-    if dag_index >= len(DAG_EXECUTION_CHAIN):
-        logger.warning(
-            f"Invalid DAG index {dag_index}, chain has {len(DAG_EXECUTION_CHAIN)} DAGs"
+
+async def _apply_dag_run_state(
+    uow: SQLAlchemyUnitOfWork,
+    task_use_cases: TaskUseCases,
+    task_id: int,
+    workflow_run,
+    dag_id: str,
+    dag_index: int,
+    dag_run_response: dict,
+) -> bool:
+    """Apply an Airflow DAG run state to the chain; returns True once the run is finished"""
+    airflow_state = dag_run_response.get("state")
+    run_id = workflow_run.id
+    logger.info(f"DAG {dag_id} run {run_id.value} state: {airflow_state}")
+
+    if airflow_state in FINISHED_DAG_RUN_STATES and not await _claim_chain_step(
+        run_id.value
+    ):
+        # The workflow monitor may have written the status first, so the
+        # claim, not the status update, decides who advances the chain
+        logger.info(f"Chain step for WorkflowRun {run_id.value} already handled")
+        return True
+
+    if airflow_state == "success":
+        logger.info(f"DAG {dag_id} completed successfully!")
+
+        try:
+            # Committed before Airflow is called, so no later failure can
+            # roll it back under a next DAG that is already running
+            async with uow:
+                # A no-op if another path already marked it
+                await uow.workflow_runs.transition_status(
+                    run_id,
+                    WorkflowStatus.SUCCESS,
+                    end_date=_parse_airflow_date(dag_run_response.get("end_date"))
+                    or datetime.now(),
+                )
+
+            next_dag_index = dag_index + 1
+            if next_dag_index >= DAG_CHAIN_LEN:
+                # All DAGs completed - update task status
+                logger.info(f"All DAGs completed for task {task_id}")
+                await task_use_cases.update_task_status(task_id, TaskStatus.COMPLETED)
+                return True
+        except Exception:
+            # Nothing has reached Airflow, so a later check may take the step
+            await _release_chain_step(run_id.value)
+            raise
+
+        # The claim keeps the next DAG from being triggered twice; failures
+        # from here on are recorded on the task instead
+        await _trigger_next_dag(
+            uow,
+            task_id,
+            next_dag_index,
+            workflow_run.configuration.parameters,
         )
-        return
+        return True
 
-    next_dag_id = DAG_EXECUTION_CHAIN[dag_index]
-    logger.info(
-        f"Triggering next DAG: {next_dag_id} (index {dag_index}) for task {task_id}"
+    elif airflow_state == "failed":
+        logger.error(f"DAG {dag_id} failed!")
+
+        # Update WorkflowRun and Task status to failed
+        try:
+            async with uow:
+                await uow.workflow_runs.transition_status(
+                    run_id, WorkflowStatus.FAILED, end_date=datetime.now()
+                )
+                await uow.commit()
+
+            await task_use_cases.update_task_status(task_id, TaskStatus.FAILED)
+        except Exception:
+            await _release_chain_step(run_id.value)
+            raise
+        return True
+
+    elif airflow_state in ["running", "queued"]:
+        # Still running, continue monitoring
+        logger.info(f"DAG {dag_id} still {airflow_state}, continuing to monitor...")
+
+        current_status = (
+            WorkflowStatus.RUNNING
+            if airflow_state == "running"
+            else WorkflowStatus.QUEUED
+        )
+        start_date = (
+            _parse_airflow_date(dag_run_response.get("start_date"))
+            if airflow_state == "running"
+            else None
+        )
+        # Progress updates are batched with other monitors' writes
+        get_status_writer().submit(run_id.value, current_status, start_date)
+
+    return False
+
+
+def _poll_delay(check_count: int) -> float:
+    """Exponential backoff with full jitter, so concurrent monitors spread out"""
+    delay = min(
+        settings.DAG_MONITOR_MAX_INTERVAL,
+        settings.DAG_MONITOR_BASE_INTERVAL * 2 ** min(check_count, 6),
     )
+    return random.uniform(0, delay)
+
+
+def _chain_run_key(workflow_run_id: str) -> str:
+    return f"dag_chain_run:{workflow_run_id}"
+
+
+def _chain_step_key(workflow_run_id: str) -> str:
+    return f"dag_chain_step:{workflow_run_id}"
+
+
+async def _claim_chain_step(workflow_run_id: str) -> bool:
+    """Claim a finished run's chain step; only the first caller gets it"""
+    redis_client = await get_redis()
+    return await redis_client.acquire_lock(
+        _chain_step_key(workflow_run_id), ttl=CHAIN_RUN_TTL
+    )
+
+
+async def _release_chain_step(workflow_run_id: str) -> None:
+    try:
+        redis_client = await get_redis()
+        await redis_client.delete_cache(_chain_step_key(workflow_run_id))
+    except Exception as e:
+        logger.warning(f"Failed to release chain step for {workflow_run_id}: {e}")
+
+
+async def _register_chain_run(workflow_run_id: str, task_id: int, dag_index: int):
+    """Remember which chain step a DAG run is, for the completion callback"""
+    try:
+        redis_client = await get_redis()
+        await redis_client.set_cache(
+            _chain_run_key(workflow_run_id),
+            {"task_id": task_id, "dag_index": dag_index},
+            ttl=CHAIN_RUN_TTL,
+        )
+    except Exception as e:
+        # Unregistered runs are ignored by both the callback and the scan
+        logger.warning(f"Failed to register DAG chain run {workflow_run_id}: {e}")
+
+
+@celery_app.task
+def monitor_all_active_dag_runs():
+    """
+    Periodic scan that advances every registered DAG chain run still in flight
+    """
+    processed = run_coroutine(_monitor_all_active_dag_runs_async())
+    return f"Checked {processed} DAG chain runs"
+
+
+async def _monitor_all_active_dag_runs_async() -> int:
+    """Async implementation of the DAG chain scan"""
 
     async with AsyncSessionLocal() as db:
         uow = SQLAlchemyUnitOfWork(db)
-        workflow_use_cases = WorkflowUseCases(uow)
+        task_use_cases = TaskUseCases(uow)
 
-        try:
-            # Get or create workflow for next DAG
-            workflow = await workflow_use_cases.get_or_create_workflow(
-                name=f"{next_dag_id.replace('_', ' ').title()}",
-                dag_id=next_dag_id,
-                description=f"Auto-created workflow for {next_dag_id}",
-                created_by_id=original_parameters.get("triggered_by", 1),
+        async with uow:
+            active_runs = await uow.workflow_runs.list_by_status(
+                [WorkflowStatus.QUEUED, WorkflowStatus.RUNNING]
             )
+        if not active_runs:
+            return 0
 
-            # Prepare parameters for next DAG
-            next_parameters = original_parameters.copy()
-            next_parameters.update(
-                {
-                    "dag_chain_index": dag_index,
-                    "dag_chain_total": len(DAG_EXECUTION_CHAIN),
-                    "next_dag": (
-                        DAG_EXECUTION_CHAIN[dag_index + 1]
-                        if dag_index + 1 < len(DAG_EXECUTION_CHAIN)
-                        else None
-                    ),
-                }
-            )
+        # Only runs this chain registered; the tasks API chains its own runs
+        redis_client = await get_redis()
+        chain_runs = await redis_client.get_cache_many(
+            [_chain_run_key(run.id.value) for run in active_runs]
+        )
+
+        # Group by DAG so each DAG's runs come back in one Airflow request
+        runs_by_dag: Dict[str, List[Tuple[WorkflowRun, dict]]] = {}
+        dag_ids: Dict[str, Optional[str]] = {}
+        async with uow:
+            for run, chain_run in zip(active_runs, chain_runs):
+                if not chain_run:
+                    continue
+                workflow_id = run.workflow_id.value
+                if workflow_id not in dag_ids:
+                    workflow = await uow.workflows.get_by_id(run.workflow_id)
+                    dag_ids[workflow_id] = workflow.dag_id if workflow else None
+                dag_id = dag_ids[workflow_id]
+                if dag_id:
+                    runs_by_dag.setdefault(dag_id, []).append((run, chain_run))
+
+        # The per-DAG requests are independent, so issue them together
+        airflow_client = get_airflow_client()
+        results = await asyncio.gather(
+            *(
+                airflow_client.get_dag_runs_bulk(
+                    dag_id, [run.id.value for run, _ in entries]
+                )
+                for dag_id, entries in runs_by_dag.items()
+            ),
+            return_exceptions=True,
+        )
+
+        # State changes share one session, so they are applied in turn
+        processed = 0
+        for (dag_id, entries), dag_runs in zip(runs_by_dag.items(), results):
+            if isinstance(dag_runs, Exception):
+                logger.warning(f"Failed to get DAG runs for {dag_id}: {str(dag_runs)}")
+                continue
+
+            for run, chain_run in entries:
+                dag_run_response = dag_runs.get(run.id.value)
+                # Nothing to do while Airflow reports what we already have
+                if (
+                    not dag_run_response
+                    or dag_run_response.get("state") == run.status.value
+                ):
+                    continue
+                processed += 1
+                try:
+                    await _apply_dag_run_state(
+                        uow,
+                        task_use_cases,
+                        chain_run["task_id"],
+                        run,
+                        dag_id,
+                        chain_run["dag_index"],
+                        dag_run_response,
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to apply state for DAG run {run.id.value}: {str(e)}"
+                    )
+
+    await get_status_writer().flush()
+    return processed
+
+
+@celery_app.task(bind=True, max_retries=3)
+def handle_dag_run_finished(
+    self, dag_id: str, dag_run_id: str, state: str, end_date: Optional[str] = None
+):
+    """
+    Advance the DAG chain as soon as Airflow reports a run finished
+    """
+    try:
+        logger.info(f"Airflow reported DAG {dag_id} run {dag_run_id} finished: {state}")
+        run_coroutine(
+            _handle_dag_run_finished_async(dag_id, dag_run_id, state, end_date)
+        )
 
-            # Trigger next DAG
-            command = TriggerWorkflowCommand(
-                workflow_id=workflow.id.value,
-                triggered_by=original_parameters.get("triggered_by"),
-                task_id=task_id,
-                dataset_id=original_parameters.get("dataset_id"),
-                parameters=next_parameters,
-                note=f"DAG Chain {dag_index+1}/{len(DAG_EXECUTION_CHAIN)}: {next_dag_id} - Auto-triggered from previous DAG completion",
+    except Exception as exc:
+        logger.error(f"Handling DAG run completion failed: {str(exc)}")
+        raise self.retry(exc=exc, countdown=10 * (2**self.request.retries))
+
+
+async def _handle_dag_run_finished_async(
+    dag_id: str, dag_run_id: str, state: str, end_date: Optional[str]
+):
+    """Async implementation of the DAG run completion callback"""
+
+    redis_client = await get_redis()
+    chain_run = await redis_client.get_cache(_chain_run_key(dag_run_id))
+    if not chain_run:
+        logger.debug(f"DAG run {dag_run_id} is not part of a DAG chain")
+        return
+
+    # The callback only says which run to look at; its dag_id must match
+    # the chain step that started the run
+    dag_index = chain_run["dag_index"]
+    if dag_index >= DAG_CHAIN_LEN or DAG_CHAIN_META[dag_index].dag_id != dag_id:
+        logger.warning(
+            f"Ignoring callback for DAG {dag_id} run {dag_run_id}: "
+            f"not the DAG registered for chain step {dag_index}"
+        )
+        return
+
+    async with AsyncSessionLocal() as db:
+        uow = SQLAlchemyUnitOfWork(db)
+        task_use_cases = TaskUseCases(uow)
+
+        async with uow:
+            workflow_run = await uow.workflow_runs.get_by_id(
+                WorkflowRunId(dag_run_id)
             )
 
-            workflow_run = await workflow_use_cases.trigger_workflow(command)
+        if not workflow_run:
+            logger.error(f"WorkflowRun {dag_run_id} not found")
+            return
+        # A run already marked finished may still have its chain step to
+        # take, so terminal runs are not skipped here
 
+        # Trust Airflow's own record of the run, not the reported state
+        dag_run_response = await get_airflow_client().get_dag_run_status(
+            dag_id, dag_run_id
+        )
+        if dag_run_response.get("state") != state:
             logger.info(
-                f"Successfully triggered DAG {next_dag_id}, WorkflowRun ID: {workflow_run.id.value}"
+                f"DAG {dag_id} run {dag_run_id} reported {state}, "
+                f"Airflow has {dag_run_response.get('state')}"
             )
 
-            # Schedule monitoring for the new DAG
-            monitor_dag_chain_completion.apply_async(
-                args=[task_id, workflow_run.id.value, dag_index],
-                countdown=30,  # Start monitoring after 30 seconds
-            )
+        if await _apply_dag_run_state(
+            uow,
+            task_use_cases,
+            chain_run["task_id"],
+            workflow_run,
+            dag_id,
+            dag_index,
+            dag_run_response,
+        ):
+            await redis_client.delete_cache(_chain_run_key(dag_run_id))
 
-        except Exception as e:
-            logger.error(f"Failed to trigger next DAG {next_dag_id}: {str(e)}")
-            # Update task status to failed
-            task_use_cases = TaskUseCases(uow)
-            await task_use_cases.update_task_status(task_id, TaskStatus.FAILED)
+
+async def hand_off_finished_chain_runs(runs: List[Tuple[str, str, str]]) -> None:
+    """Queue the chain handler for registered runs another monitor saw finish
+
+    Takes (dag_id, run_id, airflow_state) triples.
+    """
+    finished = [run for run in runs if run[2] in FINISHED_DAG_RUN_STATES]
+    if not finished:
+        return
+
+    redis_client = await get_redis()
+    chain_runs = await redis_client.get_cache_many(
+        [_chain_run_key(run_id) for _, run_id, _ in finished]
+    )
+    for (dag_id, run_id, state), chain_run in zip(finished, chain_runs):
+        if chain_run:
+            handle_dag_run_finished.delay(dag_id, run_id, state)
+
+
+async def _resolve_workflow_id(
+    workflow_use_cases: WorkflowUseCases, entry: _ChainEntry, created_by_id: int
+) -> str:
+    """Workflow id for a chain step, resolved from the DB only on first use"""
+    workflow_id = _WORKFLOW_ID_CACHE.get(entry.dag_id)
+    if workflow_id is None:
+        workflow = await workflow_use_cases.get_or_create_workflow(
+            name=entry.workflow_name,
+            dag_id=entry.dag_id,
+            description=entry.description,
+            created_by_id=created_by_id,
+        )
+        workflow_id = workflow.id.value
+    return workflow_id
+
+
+async def _trigger_next_dag(
+    uow: SQLAlchemyUnitOfWork,
+    task_id: int,
+    dag_index: int,
+    original_parameters: dict,
+):
+    """Trigger the next DAG in the chain; call with no transaction open on uow"""
+
+    if dag_index >= DAG_CHAIN_LEN:
+        logger.warning(
+            f"Invalid DAG index {dag_index}, chain has {DAG_CHAIN_LEN} DAGs"
+        )
+        return
+
+    entry = DAG_CHAIN_META[dag_index]
+    next_dag_id = entry.dag_id
+    logger.info(
+        f"Triggering next DAG: {next_dag_id} (index {dag_index}) for task {task_id}"
+    )
+
+    workflow_use_cases = WorkflowUseCases(uow)
+
+    try:
+        # Get or create workflow for next DAG
+        workflow_id = await _resolve_workflow_id(
+            workflow_use_cases,
+            entry,
+            created_by_id=original_parameters.get("triggered_by", 1),
+        )
+
+        # Prepare parameters for next DAG. They end up in Airflow's conf
+        # and a JSON column, so one shallow copy into a plain dict is needed
+        next_parameters = {
+            **original_parameters,
+            "dag_chain_index": dag_index,
+            "dag_chain_total": DAG_CHAIN_LEN,
+            "next_dag": entry.next_dag,
+        }
+
+        # Trigger next DAG
+        command = TriggerWorkflowCommand(
+            workflow_id=workflow_id,
+            triggered_by=original_parameters.get("triggered_by"),
+            task_id=task_id,
+            dataset_id=original_parameters.get("dataset_id"),
+            parameters=next_parameters,
+            note=f"DAG Chain {dag_index+1}/{DAG_CHAIN_LEN}: {next_dag_id} - Auto-triggered from previous DAG completion",
+        )
+
+        workflow_run = await workflow_use_cases.trigger_workflow(command)
+        # The new run has committed, so its workflow row has too
+        _WORKFLOW_ID_CACHE[entry.dag_id] = workflow_id
+
+        logger.info(
+            f"Successfully triggered DAG {next_dag_id}, WorkflowRun ID: {workflow_run.id.value}"
+        )
+
+        # Completion arrives via the Airflow callback or the periodic scan
+        await _register_chain_run(workflow_run.id.value, task_id, dag_index)
+
+    except Exception as e:
+        logger.error(f"Failed to trigger next DAG {next_dag_id}: {str(e)}")
+        # The cached workflow may be what went stale
+        _WORKFLOW_ID_CACHE.pop(next_dag_id, None)
+        # Update task status to failed
+        task_use_cases = TaskUseCases(uow)
+        await task_use_cases.update_task_status(task_id, TaskStatus.FAILED)
 
 
 @celery_app.task
@@ -262,10 +614,7 @@ def start_dag_chain_monitoring(task_id: int, workflow_run_id: str, dag_index: in
     """
     logger.info(f"Starting DAG chain monitoring for task {task_id}")
 
-    # Schedule the monitoring task to run after a delay
-    monitor_dag_chain_completion.apply_async(
-        args=[task_id, workflow_run_id, dag_index],
-        countdown=60,  # Start monitoring after 1 minute
-    )
+    # Completion arrives via the Airflow callback or the periodic scan
+    run_coroutine(_register_chain_run(workflow_run_id, task_id, dag_index))
 
     return f"DAG chain monitoring scheduled for task {task_id}"
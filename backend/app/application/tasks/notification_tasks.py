@@ -1,9 +1,11 @@
 import asyncio
+import atexit
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional
 from celery import Task
 
-from app.core.celery_app import celery_app
+from app.core.celery_app import celery_app, run_coroutine
 from app.application.services.notification_service import (
     NotificationService,
     NotificationType,
@@ -14,18 +16,20 @@ logger = logging.getLogger(__name__)
 
 
 class AsyncNotificationTask(Task):
-    """Base class for async notification tasks"""
+    """Base class for async notification tasks
 
-    def __call__(self, *args, **kwargs):
-        return asyncio.get_event_loop().run_until_complete(
-            self.run_async(*args, **kwargs)
-        )
+    The notifications worker uses the threads pool: each thread hands its
+    coroutine to the process's shared event loop, so sends overlap there.
+    """
 
-    async def run_async(self, *args, **kwargs):
-        raise NotImplementedError
+    def __call__(self, *args, **kwargs):
+        # The task body is a coroutine function; drive it on the worker loop
+        return run_coroutine(self.run(*args, **kwargs))
 
 
-@celery_app.task(bind=True, base=AsyncNotificationTask)
+@celery_app.task(
+    bind=True, base=AsyncNotificationTask, ignore_result=True, acks_late=False
+)
 async def send_workflow_started_notification(
     self,
     workflow_id: str,
@@ -53,7 +57,9 @@ async def send_workflow_started_notification(
         raise
 
 
-@celery_app.task(bind=True, base=AsyncNotificationTask)
+@celery_app.task(
+    bind=True, base=AsyncNotificationTask, ignore_result=True, acks_late=False
+)
 async def send_workflow_completed_notification(
     self,
     workflow_id: str,
@@ -89,7 +95,9 @@ async def send_workflow_completed_notification(
         raise
 
 
-@celery_app.task(bind=True, base=AsyncNotificationTask)
+@celery_app.task(
+    bind=True, base=AsyncNotificationTask, ignore_result=True, acks_late=False
+)
 async def send_workflow_stopped_notification(
     self,
     workflow_id: str,
@@ -117,7 +125,9 @@ async def send_workflow_stopped_notification(
         raise
 
 
-@celery_app.task(bind=True, base=AsyncNotificationTask)
+@celery_app.task(
+    bind=True, base=AsyncNotificationTask, ignore_result=True, acks_late=False
+)
 async def send_task_failed_notification(
     self,
     workflow_id: str,
@@ -153,7 +163,9 @@ async def send_task_failed_notification(
         raise
 
 
-@celery_app.task(bind=True, base=AsyncNotificationTask)
+@celery_app.task(
+    bind=True, base=AsyncNotificationTask, ignore_result=True, acks_late=False
+)
 async def send_system_error_notification(
     self,
     message: str,
@@ -178,24 +190,34 @@ async def send_system_error_notification(
         raise
 
 
-@celery_app.task(bind=True, base=AsyncNotificationTask)
+# Upper bound on notifications delivered at once by a bulk task
+BULK_CONCURRENCY = 50
+
+WORKFLOW_NOTIFICATION_TYPES = frozenset(
+    {
+        NotificationType.WORKFLOW_STARTED.value,
+        NotificationType.WORKFLOW_COMPLETED.value,
+        NotificationType.WORKFLOW_FAILED.value,
+        NotificationType.WORKFLOW_STOPPED.value,
+        NotificationType.TASK_FAILED.value,
+    }
+)
+
+
+@celery_app.task(
+    bind=True, base=AsyncNotificationTask, ignore_result=True, acks_late=False
+)
 async def send_bulk_notifications(self, notifications: list):
     """Send multiple notifications in bulk"""
     logger.info(f"Sending {len(notifications)} bulk notifications")
 
-    try:
-        notification_service = get_notification_service()
+    notification_service = get_notification_service()
+    semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
 
-        for notification in notifications:
-            notification_type = notification.get("type")
-
-            if notification_type in [
-                "workflow_started",
-                "workflow_completed",
-                "workflow_failed",
-                "workflow_stopped",
-                "task_failed",
-            ]:
+    async def send(notification: Dict[str, Any]) -> None:
+        notification_type = notification.get("type")
+        async with semaphore:
+            if notification_type in WORKFLOW_NOTIFICATION_TYPES:
                 await notification_service.send_workflow_notification(
                     notification_type=NotificationType(notification_type),
                     workflow_id=notification.get("workflow_id"),
@@ -204,7 +226,7 @@ async def send_bulk_notifications(self, notifications: list):
                     user_id=notification.get("user_id"),
                     additional_data=notification.get("additional_data"),
                 )
-            elif notification_type == "system_error":
+            elif notification_type == NotificationType.SYSTEM_ERROR.value:
                 await notification_service.send_system_notification(
                     notification_type=NotificationType.SYSTEM_ERROR,
                     message=notification.get("message"),
@@ -212,11 +234,88 @@ async def send_bulk_notifications(self, notifications: list):
                     additional_data=notification.get("additional_data"),
                 )
 
+    results = await asyncio.gather(
+        *(send(notification) for notification in notifications),
+        return_exceptions=True,
+    )
+
+    failed = 0
+    for notification, result in zip(notifications, results):
+        if isinstance(result, Exception):
+            failed += 1
+            logger.error(
+                f"Failed to send {notification.get('type')} notification: {result}"
+            )
+
+    if failed:
+        logger.warning(f"{failed} of {len(notifications)} bulk notifications failed")
+    else:
         logger.info(f"Bulk notifications sent successfully")
 
-    except Exception as e:
-        logger.error(f"Failed to send bulk notifications: {e}")
-        raise
+
+class _NotificationBatcher:
+    """Buffers triggered notifications and ships them as send_bulk_notifications tasks"""
+
+    # A batch is enqueued once it holds BATCH_MAX notifications, or
+    # BATCH_WAIT seconds after its first notification arrived
+    BATCH_MAX = 100
+    BATCH_WAIT = 0.05
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: List[Dict[str, Any]] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def add(self, notification: Dict[str, Any]) -> None:
+        # Unset fields are left out of the message; the bulk task reads
+        # every field with .get(), so absent and None mean the same
+        notification = {
+            key: value for key, value in notification.items() if value is not None
+        }
+        with self._lock:
+            self._pending.append(notification)
+            if len(self._pending) >= self.BATCH_MAX:
+                batch = self._take()
+            else:
+                batch = None
+                if self._timer is None:
+                    self._timer = threading.Timer(self.BATCH_WAIT, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            self._send(batch)
+
+    def flush(self) -> None:
+        """Enqueue whatever is buffered now"""
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._send(batch)
+
+    def _take(self) -> List[Dict[str, Any]]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _send(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            send_bulk_notifications.delay(batch)
+        except Exception as e:
+            logger.error(f"Failed to enqueue {len(batch)} notifications: {e}")
+
+
+_notification_batcher = _NotificationBatcher()
+# Don't drop a partially filled batch when the process exits. Prefork
+# Celery children leave via os._exit and skip atexit, so the worker
+# shutdown hook calls flush_pending_notifications() as well
+atexit.register(_notification_batcher.flush)
+
+
+def flush_pending_notifications() -> None:
+    """Enqueue notifications still waiting for their batch window"""
+    _notification_batcher.flush()
 
 
 # Convenience functions for triggering notifications
@@ -227,11 +326,15 @@ def trigger_workflow_started_notification(
     additional_data: Optional[Dict[str, Any]] = None,
 ):
     """Trigger workflow started notification"""
-    send_workflow_started_notification.delay(
-        workflow_id=workflow_id,
-        run_id=run_id,
-        user_id=user_id,
-        additional_data=additional_data,
+    _notification_batcher.add(
+        {
+            "type": NotificationType.WORKFLOW_STARTED.value,
+            "workflow_id": workflow_id,
+            "run_id": run_id,
+            "status": "running",
+            "user_id": user_id,
+            "additional_data": additional_data,
+        }
     )
 
 
@@ -243,12 +346,20 @@ def trigger_workflow_completed_notification(
     additional_data: Optional[Dict[str, Any]] = None,
 ):
     """Trigger workflow completed/failed notification"""
-    send_workflow_completed_notification.delay(
-        workflow_id=workflow_id,
-        run_id=run_id,
-        success=success,
-        user_id=user_id,
-        additional_data=additional_data,
+    notification_type = (
+        NotificationType.WORKFLOW_COMPLETED
+        if success
+        else NotificationType.WORKFLOW_FAILED
+    )
+    _notification_batcher.add(
+        {
+            "type": notification_type.value,
+            "workflow_id": workflow_id,
+            "run_id": run_id,
+            "status": "completed" if success else "failed",
+            "user_id": user_id,
+            "additional_data": additional_data,
+        }
     )
 
 
@@ -259,11 +370,15 @@ def trigger_workflow_stopped_notification(
     additional_data: Optional[Dict[str, Any]] = None,
 ):
     """Trigger workflow stopped notification"""
-    send_workflow_stopped_notification.delay(
-        workflow_id=workflow_id,
-        run_id=run_id,
-        user_id=user_id,
-        additional_data=additional_data,
+    _notification_batcher.add(
+        {
+            "type": NotificationType.WORKFLOW_STOPPED.value,
+            "workflow_id": workflow_id,
+            "run_id": run_id,
+            "status": "stopped",
+            "user_id": user_id,
+            "additional_data": additional_data,
+        }
     )
 
 
@@ -274,11 +389,14 @@ def trigger_task_failed_notification(
     additional_data: Optional[Dict[str, Any]] = None,
 ):
     """Trigger task failed notification"""
-    send_task_failed_notification.delay(
-        workflow_id=workflow_id,
-        run_id=run_id,
-        task_id=task_id,
-        additional_data=additional_data,
+    _notification_batcher.add(
+        {
+            "type": NotificationType.TASK_FAILED.value,
+            "workflow_id": workflow_id,
+            "run_id": run_id,
+            "status": "task_failed",
+            "additional_data": {**(additional_data or {}), "task_id": task_id},
+        }
     )
 
 
@@ -288,6 +406,11 @@ def trigger_system_error_notification(
     additional_data: Optional[Dict[str, Any]] = None,
 ):
     """Trigger system error notification"""
-    send_system_error_notification.delay(
-        message=message, severity=severity, additional_data=additional_data
+    _notification_batcher.add(
+        {
+            "type": NotificationType.SYSTEM_ERROR.value,
+            "message": message,
+            "severity": severity,
+            "additional_data": additional_data,
+        }
     )
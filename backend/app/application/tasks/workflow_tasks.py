@@ -1,14 +1,14 @@
 import asyncio
 import logging
+import random
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from typing import List, Dict, Any, Optional, Tuple
 
 # Conditional import of Celery
 try:
     from celery import Task
-    from app.core.celery_app import celery_app, CELERY_AVAILABLE
+    from app.core.celery_app import celery_app, CELERY_AVAILABLE, run_coroutine
 
     if not CELERY_AVAILABLE or not celery_app:
         raise ImportError("Celery not available")
@@ -17,33 +17,62 @@ except ImportError:
     Task = object
     celery_app = None
     CELERY_AVAILABLE = False
-from app.core.config import settings
-from app.application.services.airflow_service import AirflowClient
-from app.application.services.event_service import EventService, WorkflowEventPublisher
-from app.application.use_cases.workflow_use_cases import WorkflowUseCases
+from app.core.database import AsyncSessionLocal
+from app.core.serialization import parse_iso_datetime
+from app.application.services.airflow_service import get_airflow_client
+from app.application.services.event_service import (
+    EventService,
+    WorkflowEventPublisher,
+    get_event_service,
+    get_workflow_event_publisher,
+)
+from app.application.use_cases.workflow_use_cases import (
+    AIRFLOW_STATUS_MAP,
+    WorkflowUseCases,
+    TriggerWorkflowCommand,
+)
+from app.application.use_cases.task_use_cases import TaskUseCases
 from app.application.tasks.notification_tasks import (
     trigger_workflow_started_notification,
     trigger_workflow_completed_notification,
     trigger_task_failed_notification,
 )
 from app.infrastructure.repositories.unit_of_work import SQLAlchemyUnitOfWork
-from app.core.redis import RedisClient
+from app.core.redis import get_redis
 from app.shared.types import WorkflowStatus, TaskStatus
+from app.domain.entities import WorkflowRun
 from app.domain.value_objects import WorkflowId, WorkflowRunId
 
 logger = logging.getLogger(__name__)
 
-# Create async database engine for background tasks
-async_engine = create_async_engine(
-    str(settings.DATABASE_URL),
-    pool_pre_ping=True,
-    pool_recycle=300,
+ACTIVE_WORKFLOW_STATUSES = frozenset(
+    {
+        WorkflowStatus.QUEUED,
+        WorkflowStatus.RUNNING,
+        WorkflowStatus.UP_FOR_RETRY,
+        WorkflowStatus.UP_FOR_RESCHEDULE,
+        WorkflowStatus.SCHEDULED,
+    }
 )
-
-AsyncSessionLocal = sessionmaker(
-    async_engine, class_=AsyncSession, expire_on_commit=False
+TERMINAL_WORKFLOW_STATUSES = frozenset(
+    {WorkflowStatus.SUCCESS, WorkflowStatus.FAILED, WorkflowStatus.REMOVED}
 )
 
+# How long task instance states are remembered between syncs of a run
+TI_STATES_TTL = 24 * 60 * 60  # seconds
+
+# Fields of an Airflow DAG run pushed to per-run state channels
+DAG_RUN_STATE_FIELDS = ("state", "start_date", "end_date", "execution_date")
+
+MONITOR_MAX_ATTEMPTS = 1440  # Checks per run before giving up
+ERROR_BACKOFF_MAX = 300.0  # Longest pause after repeated errors
+
+# Seconds between Airflow checks while waiting on a run, by its current state;
+# runs still waiting for a slot change far less often than running ones
+POLL_INTERVALS = {"queued": 60.0, "scheduled": 60.0, "running": 15.0}
+POLL_DEFAULT_INTERVAL = 30.0
+POLL_MAX_INTERVAL = 120.0
+POLL_STABLE_AFTER = 4  # Unchanged checks before the interval starts doubling
 
 # Only define tasks if Celery is available
 if CELERY_AVAILABLE and celery_app:
@@ -52,17 +81,35 @@ if CELERY_AVAILABLE and celery_app:
         """Base class for async Celery tasks"""
 
         def __call__(self, *args, **kwargs):
-            return asyncio.get_event_loop().run_until_complete(
-                self.run_async(*args, **kwargs)
-            )
+            # The task body is a coroutine function; drive it on the worker loop
+            return run_coroutine(self.run(*args, **kwargs))
 
-        async def run_async(self, *args, **kwargs):
-            raise NotImplementedError
+    @celery_app.task(bind=True, acks_late=True, max_retries=5)
+    def monitor_workflow_run(
+        self, workflow_id: str, run_id: str, attempt: int = 0
+    ):
+        """Check a workflow run once, re-queueing the check until it finishes"""
+        # Synchronous body so retry() sees this thread's request context;
+        # inside the loop thread self.request is an empty default Context
+        try:
+            airflow_state = run_coroutine(
+                _monitor_workflow_run_impl(workflow_id, run_id)
+            )
+        except Exception as exc:
+            raise self.retry(
+                exc=exc, countdown=_error_backoff(self.request.retries + 1)
+            )
 
-    @celery_app.task(bind=True, base=AsyncTask)
-    async def monitor_workflow_run(self, workflow_id: str, run_id: str):
-        """Monitor a specific workflow run until completion"""
-        return await _monitor_workflow_run_impl(workflow_id, run_id)
+        if airflow_state is None:
+            return
+        if attempt + 1 >= MONITOR_MAX_ATTEMPTS:
+            logger.warning(f"Timeout monitoring workflow run {workflow_id}/{run_id}")
+            return
+        # The worker slot is free until the next check is due
+        monitor_workflow_run.apply_async(
+            (workflow_id, run_id, attempt + 1),
+            countdown=_poll_interval(airflow_state, 0),
+        )
 
     @celery_app.task(bind=True, base=AsyncTask)
     async def monitor_active_workflows(self):
@@ -106,136 +153,193 @@ else:
 
 
 # Implementation functions (work regardless of Celery availability)
-async def _monitor_workflow_run_impl(workflow_id: str, run_id: str):
-    """Monitor a specific workflow run until completion"""
-    logger.info(f"Starting monitoring for workflow run {workflow_id}/{run_id}")
-
-    try:
-        airflow_client = AirflowClient()
-        redis_client = RedisClient()
-        await redis_client.connect()
+async def _monitor_workflow_run_impl(workflow_id: str, run_id: str) -> Optional[str]:
+    """Check a workflow run once; returns its Airflow state, or None once finished"""
+    async with AsyncSessionLocal() as db:
+        uow = SQLAlchemyUnitOfWork(db)
+        async with uow:
+            workflow = await uow.workflows.get_by_id(WorkflowId(workflow_id))
+            current_status = await uow.workflow_runs.get_status(WorkflowRunId(run_id))
+
+    if not workflow or current_status is None:
+        logger.warning(f"Workflow run {workflow_id}/{run_id} not found")
+        return None
+    if current_status in TERMINAL_WORKFLOW_STATUSES:
+        return None
 
-        event_service = EventService(redis_client)
-        event_publisher = WorkflowEventPublisher(event_service)
+    dag_run_response = await get_airflow_client().get_dag_run_status(
+        workflow.dag_id, run_id
+    )
+    airflow_state = dag_run_response.get("state", "unknown")
+    status = _map_airflow_status(airflow_state)
+
+    # The shared poller may already have applied this state
+    if status != current_status:
+        await get_redis()  # Connects the shared client on first use
+        await _apply_airflow_state(
+            get_event_service(),
+            get_workflow_event_publisher(),
+            workflow_id,
+            run_id,
+            dag_run_response,
+        )
 
-        max_attempts = 1440  # 12 hours with 30-second intervals
-        attempt = 0
+    if status in TERMINAL_WORKFLOW_STATUSES:
+        logger.info(
+            f"Workflow run {workflow_id}/{run_id} reached terminal state: {airflow_state}"
+        )
+        return None
+    return airflow_state
+
+
+async def _apply_airflow_state(
+    event_service: EventService,
+    event_publisher: WorkflowEventPublisher,
+    workflow_id: str,
+    run_id: str,
+    dag_run_response: Dict[str, Any],
+) -> str:
+    """Persist, cache and announce a newly observed Airflow state for a run"""
+    await _update_workflow_run_statuses([(run_id, dag_run_response)])
+    return await _announce_airflow_state(
+        event_service, event_publisher, workflow_id, run_id, dag_run_response
+    )
+
+
+async def _announce_airflow_state(
+    event_service: EventService,
+    event_publisher: WorkflowEventPublisher,
+    workflow_id: str,
+    run_id: str,
+    dag_run_response: Dict[str, Any],
+) -> str:
+    """Cache an already persisted Airflow state and publish its events"""
+    airflow_state = dag_run_response.get("state", "unknown")
+
+    # Map Airflow state to our WorkflowStatus
+    status = _map_airflow_status(airflow_state)
+
+    # Cache status in Redis
+    status_data = {
+        "status": status.value,
+        "state": airflow_state,
+        "start_date": dag_run_response.get("start_date"),
+        "end_date": dag_run_response.get("end_date"),
+        "execution_date": dag_run_response.get("execution_date"),
+        "last_updated": datetime.now().isoformat(),
+    }
+    await event_service.cache_workflow_status(workflow_id, run_id, status_data)
 
-        while attempt < max_attempts:
-            try:
-                # Get status from Airflow
-                dag_run_response = await airflow_client.get_dag_run_status(
-                    workflow_id, run_id
-                )
-                airflow_state = dag_run_response.get("state", "unknown")
-
-                # Map Airflow state to our WorkflowStatus
-                status = _map_airflow_status(airflow_state)
-
-                # Update database
-                await _update_workflow_run_status(workflow_id, run_id, dag_run_response)
-
-                # Cache status in Redis
-                status_data = {
-                    "status": status.value,
-                    "state": airflow_state,
-                    "start_date": dag_run_response.get("start_date"),
-                    "end_date": dag_run_response.get("end_date"),
-                    "execution_date": dag_run_response.get("execution_date"),
-                    "last_updated": datetime.now().isoformat(),
-                }
-                await event_service.cache_workflow_status(
-                    workflow_id, run_id, status_data
-                )
+    # Publish status update events and trigger notifications
+    if airflow_state == "running":
+        await event_publisher.workflow_started(workflow_id, run_id, **status_data)
+        trigger_workflow_started_notification(workflow_id, run_id)
 
-                # Publish status update events and trigger notifications
-                if airflow_state == "running":
-                    await event_publisher.workflow_started(
-                        workflow_id, run_id, **status_data
-                    )
-                    # Trigger notification
-                    trigger_workflow_started_notification(workflow_id, run_id)
+    elif airflow_state == "success":
+        await event_publisher.workflow_completed(
+            workflow_id, run_id, success=True, **status_data
+        )
+        trigger_workflow_completed_notification(workflow_id, run_id, success=True)
 
-                elif airflow_state == "success":
-                    await event_publisher.workflow_completed(
-                        workflow_id, run_id, success=True, **status_data
-                    )
-                    # Trigger notification
-                    trigger_workflow_completed_notification(
-                        workflow_id, run_id, success=True
-                    )
-                    break
+    elif airflow_state == "failed":
+        await event_publisher.workflow_completed(
+            workflow_id, run_id, success=False, **status_data
+        )
+        trigger_workflow_completed_notification(workflow_id, run_id, success=False)
 
-                elif airflow_state == "failed":
-                    await event_publisher.workflow_completed(
-                        workflow_id, run_id, success=False, **status_data
-                    )
-                    # Trigger notification
-                    trigger_workflow_completed_notification(
-                        workflow_id, run_id, success=False
-                    )
-                    break
-
-                # Check if workflow is in terminal state
-                if status in [
-                    WorkflowStatus.SUCCESS,
-                    WorkflowStatus.FAILED,
-                    WorkflowStatus.REMOVED,
-                ]:
-                    logger.info(
-                        f"Workflow run {workflow_id}/{run_id} reached terminal state: {status}"
-                    )
-                    break
+    return airflow_state
 
-                # Wait before next check
-                await asyncio.sleep(30)
-                attempt += 1
 
-            except Exception as e:
-                logger.error(
-                    f"Error monitoring workflow run {workflow_id}/{run_id}: {e}"
-                )
-                await asyncio.sleep(60)  # Wait longer on error
-                attempt += 1
+async def _monitor_active_workflows_impl():
+    """Poll Airflow once for all active workflow runs and apply state changes"""
+    logger.info("Starting periodic monitoring of active workflows")
 
-        await redis_client.disconnect()
-        logger.info(f"Finished monitoring workflow run {workflow_id}/{run_id}")
+    try:
+        # One session serves the whole cycle; each `async with uow` block
+        # commits and hands its connection back before Airflow is called
+        async with AsyncSessionLocal() as db:
+            await _monitor_active_workflows_cycle(SQLAlchemyUnitOfWork(db))
 
     except Exception as e:
-        logger.error(f"Failed to monitor workflow run {workflow_id}/{run_id}: {e}")
+        logger.error(f"Error in periodic workflow monitoring: {e}")
         raise
 
 
-async def _monitor_active_workflows_impl():
-    """Periodic task to monitor all active workflow runs"""
-    logger.info("Starting periodic monitoring of active workflows")
+async def _monitor_active_workflows_cycle(uow: SQLAlchemyUnitOfWork):
+    """Run one monitoring cycle against a single unit of work"""
+    async with uow:
+        # Get all active workflow runs
+        active_runs = await uow.workflow_runs.list_by_status(
+            list(ACTIVE_WORKFLOW_STATUSES)
+        )
 
-    try:
-        async with AsyncSessionLocal() as db:
-            uow = SQLAlchemyUnitOfWork(db)
-            async with uow:
-                # Get all active workflow runs
-                active_runs = await uow.workflow_runs.list_by_status(
-                    [
-                        WorkflowStatus.QUEUED,
-                        WorkflowStatus.RUNNING,
-                        WorkflowStatus.UP_FOR_RETRY,
-                        WorkflowStatus.UP_FOR_RESCHEDULE,
-                        WorkflowStatus.SCHEDULED,
-                    ]
-                )
+        dag_ids: Dict[str, str] = {}
+        for workflow_id in {run.workflow_id.value for run in active_runs}:
+            workflow = await uow.workflows.get_by_id(WorkflowId(workflow_id))
+            if workflow:
+                dag_ids[workflow_id] = workflow.dag_id
+
+    logger.info(f"Found {len(active_runs)} active workflow runs")
+    if not active_runs:
+        return
+
+    # One Airflow request covers every active run across all DAGs
+    pairs: Dict[Tuple[str, str], WorkflowRun] = {}
+    for workflow_run in active_runs:
+        dag_id = dag_ids.get(workflow_run.workflow_id.value)
+        if dag_id:
+            pairs[(dag_id, workflow_run.id.value)] = workflow_run
+
+    dag_runs = await get_airflow_client().get_dag_runs_batch(list(pairs))
+
+    changed = []
+    for key, workflow_run in pairs.items():
+        dag_run = dag_runs.get(key)
+        if not dag_run:
+            continue
+        status = AIRFLOW_STATUS_MAP.get(
+            dag_run.get("state"), WorkflowStatus.QUEUED
+        )
+        if status == workflow_run.status:
+            continue
+        changed.append(
+            (
+                key[0],
+                workflow_run.workflow_id.value,
+                workflow_run.id.value,
+                {field: dag_run.get(field) for field in DAG_RUN_STATE_FIELDS},
+            )
+        )
 
-                logger.info(f"Found {len(active_runs)} active workflow runs")
+    if not changed:
+        return
 
-                # Trigger individual monitoring tasks
-                for workflow_run in active_runs:
-                    monitor_workflow_run.delay(
-                        workflow_run.workflow_id.value, workflow_run.id.value
-                    )
+    await get_redis()  # Connects the shared client on first use
+    event_service = get_event_service()
+    event_publisher = get_workflow_event_publisher()
 
-    except Exception as e:
-        logger.error(f"Error in periodic workflow monitoring: {e}")
-        raise
+    # One statement and one commit for the whole cycle
+    async with uow:
+        await _apply_workflow_run_updates(
+            uow, [(run_id, state_data) for _, _, run_id, state_data in changed]
+        )
+    for _, workflow_id, run_id, state_data in changed:
+        await _announce_airflow_state(
+            event_service, event_publisher, workflow_id, run_id, state_data
+        )
+
+    # Runs finished here leave the chain scan's view, so chain runs are
+    # handed to the chain handler to take their step
+    from app.application.tasks.dag_chain_tasks import hand_off_finished_chain_runs
+
+    await hand_off_finished_chain_runs(
+        [
+            (dag_id, run_id, state_data.get("state"))
+            for dag_id, _, run_id, state_data in changed
+        ]
+    )
+
+    logger.info(f"Applied {len(changed)} workflow run state changes")
 
 
 async def _cleanup_completed_workflows_impl():
@@ -243,8 +347,7 @@ async def _cleanup_completed_workflows_impl():
     logger.info("Starting cleanup of completed workflows")
 
     try:
-        redis_client = RedisClient()
-        await redis_client.connect()
+        redis_client = await get_redis()
 
         # Clean up workflow status cache for completed runs older than 24 hours
         cutoff_time = datetime.now() - timedelta(hours=24)
@@ -261,18 +364,19 @@ async def _cleanup_completed_workflows_impl():
                     f"Found {len(old_completed_runs)} old completed workflow runs to clean up"
                 )
 
-                for workflow_run in old_completed_runs:
-                    try:
-                        # Clear Redis cache
-                        await redis_client.delete_cache(
-                            f"workflow_status:{workflow_run.workflow_id.value}:{workflow_run.id.value}"
-                        )
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to clean cache for {workflow_run.id.value}: {e}"
-                        )
+        # Clear the Redis cache for all of them at once
+        try:
+            await redis_client.delete_cache_many(
+                [
+                    f"workflow_status:{workflow_run.workflow_id.value}:{workflow_run.id.value}"
+                    for workflow_run in old_completed_runs
+                ]
+            )
+        except Exception as e:
+            logger.warning(
+                f"Failed to clean cache for {len(old_completed_runs)} runs: {e}"
+            )
 
-        await redis_client.disconnect()
         logger.info("Finished cleanup of completed workflows")
 
     except Exception as e:
@@ -285,64 +389,84 @@ async def _sync_workflow_tasks_impl(workflow_id: str, run_id: str):
     logger.info(f"Syncing task instances for workflow run {workflow_id}/{run_id}")
 
     try:
-        airflow_client = AirflowClient()
-        redis_client = RedisClient()
-        await redis_client.connect()
+        airflow_client = get_airflow_client()
+        redis_client = await get_redis()
 
-        event_service = EventService(redis_client)
-        event_publisher = WorkflowEventPublisher(event_service)
+        event_service = get_event_service()
+        event_publisher = get_workflow_event_publisher()
 
         # Get task instances from Airflow
-        task_instances_response = await airflow_client.get_task_instances(
+        task_instances_response = await airflow_client.get_task_instances_typed(
             workflow_id, run_id
         )
-        task_instances = task_instances_response.get("task_instances", [])
-
-        # Process each task instance
-        for task_instance in task_instances:
-            task_id = task_instance.get("task_id")
-            state = task_instance.get("state")
-
-            # Publish task events
-            if state == "running":
-                await event_publisher.task_started(
-                    workflow_id=workflow_id,
-                    run_id=run_id,
-                    task_id=task_id,
-                    start_date=task_instance.get("start_date"),
-                    hostname=task_instance.get("hostname"),
-                )
-            elif state == "success":
-                await event_publisher.task_completed(
-                    workflow_id=workflow_id,
-                    run_id=run_id,
-                    task_id=task_id,
-                    success=True,
-                    end_date=task_instance.get("end_date"),
-                    duration=task_instance.get("duration"),
-                )
-            elif state == "failed":
-                await event_publisher.task_completed(
-                    workflow_id=workflow_id,
-                    run_id=run_id,
-                    task_id=task_id,
-                    success=False,
-                    end_date=task_instance.get("end_date"),
-                    duration=task_instance.get("duration"),
-                )
-                # Trigger task failed notification
-                trigger_task_failed_notification(
-                    workflow_id=workflow_id,
-                    run_id=run_id,
-                    task_id=task_id,
-                    additional_data={
-                        "end_date": task_instance.get("end_date"),
-                        "duration": task_instance.get("duration"),
-                        "hostname": task_instance.get("hostname"),
-                    },
-                )
+        task_instances = task_instances_response.task_instances
+
+        # Airflow sends no ETags, so diff against the states seen last sync
+        # and only publish task instances that moved
+        states_key = f"ti_states:{workflow_id}:{run_id}"
+        seen_states = await redis_client.get_hash(states_key)
+        changed_states = {
+            task_instance.task_id: task_instance.state
+            for task_instance in task_instances
+            if task_instance.state
+            and seen_states.get(task_instance.task_id) != task_instance.state
+        }
+        if not changed_states:
+            logger.debug(f"No task instance changes for {workflow_id}/{run_id}")
+            return
+
+        try:
+            # Process each changed task instance; events are queued and
+            # published together in pipelines by the shared event service
+            for task_instance in task_instances:
+                task_id = task_instance.task_id
+                if task_id not in changed_states:
+                    continue
+                state = task_instance.state
+
+                # Publish task events
+                if state == "running":
+                    await event_publisher.task_started(
+                        workflow_id=workflow_id,
+                        run_id=run_id,
+                        task_id=task_id,
+                        start_date=task_instance.start_date,
+                        hostname=task_instance.hostname,
+                    )
+                elif state == "success":
+                    await event_publisher.task_completed(
+                        workflow_id=workflow_id,
+                        run_id=run_id,
+                        task_id=task_id,
+                        success=True,
+                        end_date=task_instance.end_date,
+                        duration=task_instance.duration,
+                    )
+                elif state == "failed":
+                    await event_publisher.task_completed(
+                        workflow_id=workflow_id,
+                        run_id=run_id,
+                        task_id=task_id,
+                        success=False,
+                        end_date=task_instance.end_date,
+                        duration=task_instance.duration,
+                    )
+                    # Trigger task failed notification
+                    trigger_task_failed_notification(
+                        workflow_id=workflow_id,
+                        run_id=run_id,
+                        task_id=task_id,
+                        additional_data={
+                            "end_date": task_instance.end_date,
+                            "duration": task_instance.duration,
+                            "hostname": task_instance.hostname,
+                        },
+                    )
+        finally:
+            await event_service.flush()
+
+        await redis_client.set_hash(states_key, changed_states, ttl=TI_STATES_TTL)
 
-        await redis_client.disconnect()
         logger.info(
             f"Finished syncing task instances for workflow run {workflow_id}/{run_id}"
         )
@@ -352,58 +476,70 @@ async def _sync_workflow_tasks_impl(workflow_id: str, run_id: str):
         raise
 
 
-async def _update_workflow_run_status(
-    workflow_id: str, run_id: str, dag_run_data: Dict[str, Any]
-):
-    """Update workflow run status in database"""
+async def _update_workflow_run_statuses(updates: List[Tuple[str, Dict[str, Any]]]):
+    """Write observed Airflow states for several runs in their own session"""
+    if not updates:
+        return
+
     try:
         async with AsyncSessionLocal() as db:
             uow = SQLAlchemyUnitOfWork(db)
             async with uow:
-                workflow_run = await uow.workflow_runs.get_by_id(WorkflowRunId(run_id))
-                if workflow_run:
-                    # Update status
-                    airflow_state = dag_run_data.get("state", "unknown")
-                    status = _map_airflow_status(airflow_state)
-                    workflow_run.update_status(status)
-
-                    # Update timestamps
-                    if dag_run_data.get("start_date"):
-                        workflow_run.start_date = datetime.fromisoformat(
-                            dag_run_data["start_date"].replace("Z", "+00:00")
-                        )
+                await _apply_workflow_run_updates(uow, updates)
 
-                    if dag_run_data.get("end_date"):
-                        workflow_run.end_date = datetime.fromisoformat(
-                            dag_run_data["end_date"].replace("Z", "+00:00")
-                        )
+    except Exception as e:
+        logger.error(f"Error updating {len(updates)} workflow run statuses: {e}")
 
-                    await uow.workflow_runs.update(workflow_run)
-                    await uow.commit()
 
-    except Exception as e:
-        logger.error(f"Error updating workflow run status: {e}")
+async def _apply_workflow_run_updates(
+    uow: SQLAlchemyUnitOfWork, updates: List[Tuple[str, Dict[str, Any]]]
+):
+    """Write observed Airflow states for several runs in one statement and commit"""
+    rows = []
+    for run_id, dag_run_data in updates:
+        status = AIRFLOW_STATUS_MAP.get(
+            dag_run_data.get("state"), WorkflowStatus.QUEUED
+        )
+        start_date = dag_run_data.get("start_date")
+        end_date = dag_run_data.get("end_date")
+        end_date = parse_iso_datetime(end_date) if end_date else None
+        if end_date is None and status in TERMINAL_WORKFLOW_STATUSES:
+            end_date = datetime.now()
+        rows.append(
+            (
+                WorkflowRunId(run_id),
+                status,
+                parse_iso_datetime(start_date) if start_date else None,
+                end_date,
+            )
+        )
+
+    await uow.workflow_runs.bulk_update_status(rows)
+    await uow.commit()
+
+
+def _poll_interval(airflow_state: Optional[str], unchanged_polls: int) -> float:
+    """Tiered poll interval that stretches while a run's state holds steady"""
+    interval = POLL_INTERVALS.get(airflow_state, POLL_DEFAULT_INTERVAL)
+    doublings = min(unchanged_polls // POLL_STABLE_AFTER, 3)
+    return min(POLL_MAX_INTERVAL, interval * 2**doublings)
+
+
+def _error_backoff(error_attempt: int) -> float:
+    """Exponential backoff with full jitter, so monitors hit by one outage spread out"""
+    return random.uniform(0, min(ERROR_BACKOFF_MAX, 2 ** min(error_attempt, 9)))
 
 
 def _map_airflow_status(airflow_state: str) -> WorkflowStatus:
     """Map Airflow state to WorkflowStatus"""
-    mapping = {
-        "queued": WorkflowStatus.QUEUED,
-        "running": WorkflowStatus.RUNNING,
-        "success": WorkflowStatus.SUCCESS,
-        "failed": WorkflowStatus.FAILED,
-        "up_for_retry": WorkflowStatus.UP_FOR_RETRY,
-        "up_for_reschedule": WorkflowStatus.UP_FOR_RESCHEDULE,
-        "upstream_failed": WorkflowStatus.UPSTREAM_FAILED,
-        "skipped": WorkflowStatus.SKIPPED,
-        "removed": WorkflowStatus.REMOVED,
-        "scheduled": WorkflowStatus.SCHEDULED,
-    }
-    return mapping.get(airflow_state, WorkflowStatus.QUEUED)
+    return AIRFLOW_STATUS_MAP.get(airflow_state, WorkflowStatus.QUEUED)
 
 
 # Simple DAG chaining task
 if CELERY_AVAILABLE and celery_app:
+    # dag_chain_tasks needs Celery at import time, so it is only loaded here
+    from app.application.tasks.dag_chain_tasks import DAG_EXECUTION_CHAIN, DAG_INDEX
+
     @celery_app.task(bind=True)
     def trigger_next_dag_after_completion(
         self, 
@@ -416,17 +552,9 @@ if CELERY_AVAILABLE and celery_app:
         note: str
     ):
         """Monitor current DAG and trigger next DAG when it completes successfully"""
-        # Use asyncio to run the async implementation
-        import asyncio
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(_trigger_next_dag_impl(
-                current_dag_id, current_run_id, next_dag_id, task_id, triggered_by, parameters, note
-            ))
-            return result
-        finally:
-            loop.close()
+        return run_coroutine(_trigger_next_dag_impl(
+            current_dag_id, current_run_id, next_dag_id, task_id, triggered_by, parameters, note
+        ))
 else:
     def trigger_next_dag_after_completion(*args, **kwargs):
         logger.warning("Celery not available - DAG chaining disabled")
@@ -457,11 +585,14 @@ async def _trigger_next_dag_impl(
     logger.info(f"Starting monitoring DAG {current_dag_id}/{current_run_id} to trigger {next_dag_id}")
     
     try:
-        airflow_client = AirflowClient()
+        airflow_client = get_airflow_client()
         max_wait_minutes = 30  # Wait up to 30 minutes
-        check_interval = 10  # Check every 10 seconds
+        deadline = time.monotonic() + max_wait_minutes * 60
+        error_attempt = 0
+        last_state = None
+        unchanged_polls = 0
         
-        for _ in range((max_wait_minutes * 60) // check_interval):
+        while time.monotonic() < deadline:
             try:
                 # Check current DAG status
                 dag_run_response = await airflow_client.get_dag_run_status(
@@ -474,71 +605,62 @@ async def _trigger_next_dag_impl(
                 if state == "success":
                     logger.info(f"DAG {current_dag_id} completed successfully, triggering {next_dag_id}")
                     
-                    # Import here to avoid circular imports
-                    from app.application.use_cases.workflow_use_cases import (
-                        WorkflowUseCases, 
-                        TriggerWorkflowCommand
-                    )
-                    
                     async with AsyncSessionLocal() as db:
                         uow = SQLAlchemyUnitOfWork(db)
                         workflow_use_cases = WorkflowUseCases(uow)
+                        task_use_cases = TaskUseCases(uow)
                         
-                        # Get or create workflow for next DAG
-                        workflow = await workflow_use_cases.get_or_create_workflow(
-                            name=f"{next_dag_id.replace('_', ' ').title()}",
-                            dag_id=next_dag_id,
-                            description=f"Auto-created workflow for {next_dag_id}",
-                            created_by_id=triggered_by
-                        )
-                        
-                        # Trigger next DAG
-                        command = TriggerWorkflowCommand(
-                            workflow_id=workflow.id.value,
-                            triggered_by=triggered_by,
-                            task_id=task_id,
-                            dataset_id=None,
-                            parameters=parameters,
-                            note=note
-                        )
-                        
-                        workflow_run = await workflow_use_cases.trigger_workflow(command)
-                        logger.info(f"Successfully triggered {next_dag_id}, run_id: {workflow_run.id.value}")
-                        
-                        # Check if there are more DAGs in the chain
-                        from app.application.tasks.dag_chain_tasks import DAG_EXECUTION_CHAIN
-                        current_dag_index = None
-                        for i, dag_id in enumerate(DAG_EXECUTION_CHAIN):
-                            if dag_id == next_dag_id:
-                                current_dag_index = i
-                                break
-                        
-                        if current_dag_index is not None and current_dag_index + 1 < len(DAG_EXECUTION_CHAIN):
-                            # There's another DAG after the one we just triggered
-                            next_next_dag_id = DAG_EXECUTION_CHAIN[current_dag_index + 1]
-                            logger.info(f"Scheduling monitoring for {next_dag_id} to trigger {next_next_dag_id}")
+                        # The new run and, at the end of the chain, the task
+                        # status are written in one transaction
+                        async with uow:
+                            # Get or create workflow for next DAG
+                            workflow = await workflow_use_cases.get_or_create_workflow(
+                                name=f"{next_dag_id.replace('_', ' ').title()}",
+                                dag_id=next_dag_id,
+                                description=f"Auto-created workflow for {next_dag_id}",
+                                created_by_id=triggered_by
+                            )
                             
-                            # Schedule next monitoring task
-                            trigger_next_dag_after_completion.delay(
-                                current_dag_id=next_dag_id,
-                                current_run_id=workflow_run.id.value,
-                                next_dag_id=next_next_dag_id,
-                                task_id=task_id,
+                            # Trigger next DAG
+                            command = TriggerWorkflowCommand(
+                                workflow_id=workflow.id.value,
                                 triggered_by=triggered_by,
+                                task_id=task_id,
+                                dataset_id=None,
                                 parameters=parameters,
-                                note=f"DAG {current_dag_index + 2}/{len(DAG_EXECUTION_CHAIN)}: {next_next_dag_id} - Auto-triggered from previous DAG completion"
+                                note=note
                             )
-                        else:
-                            logger.info(f"No more DAGs in chain after {next_dag_id}")
-                            logger.info(f"All DAGs completed successfully! Updating task {task_id} status to COMPLETED")
                             
-                            # Update task status to completed - all DAGs in chain are done
-                            from app.application.use_cases.task_use_cases import TaskUseCases
-                            async with AsyncSessionLocal() as db:
-                                uow = SQLAlchemyUnitOfWork(db)
-                                task_use_cases = TaskUseCases(uow)
+                            workflow_run = await workflow_use_cases.trigger_workflow(command)
+                            logger.info(f"Successfully triggered {next_dag_id}, run_id: {workflow_run.id.value}")
+                            
+                            # Check if there are more DAGs in the chain
+                            current_dag_index = DAG_INDEX.get(next_dag_id)
+                            has_next = current_dag_index is not None and current_dag_index + 1 < len(DAG_EXECUTION_CHAIN)
+                            if not has_next:
+                                logger.info(f"No more DAGs in chain after {next_dag_id}")
+                                logger.info(f"All DAGs completed successfully! Updating task {task_id} status to COMPLETED")
+                                
+                                # Update task status to completed - all DAGs in chain are done
                                 await task_use_cases.update_task_status(task_id, TaskStatus.COMPLETED)
                                 logger.info(f"Task {task_id} status updated to COMPLETED")
+                    
+                    if has_next:
+                        # There's another DAG after the one we just triggered;
+                        # scheduled only once the new run is committed
+                        next_next_dag_id = DAG_EXECUTION_CHAIN[current_dag_index + 1]
+                        logger.info(f"Scheduling monitoring for {next_dag_id} to trigger {next_next_dag_id}")
+                        
+                        # Schedule next monitoring task
+                        trigger_next_dag_after_completion.delay(
+                            current_dag_id=next_dag_id,
+                            current_run_id=workflow_run.id.value,
+                            next_dag_id=next_next_dag_id,
+                            task_id=task_id,
+                            triggered_by=triggered_by,
+                            parameters=parameters,
+                            note=f"DAG {current_dag_index + 2}/{len(DAG_EXECUTION_CHAIN)}: {next_next_dag_id} - Auto-triggered from previous DAG completion"
+                        )
                         
                     return f"Successfully triggered {next_dag_id}"
                     
@@ -546,7 +668,6 @@ async def _trigger_next_dag_impl(
                     logger.error(f"DAG {current_dag_id} failed with state: {state}")
                     
                     # Update task status to failed
-                    from app.application.use_cases.task_use_cases import TaskUseCases
                     async with AsyncSessionLocal() as db:
                         uow = SQLAlchemyUnitOfWork(db)
                         task_use_cases = TaskUseCases(uow)
@@ -555,11 +676,15 @@ async def _trigger_next_dag_impl(
                     return f"DAG chain stopped - {current_dag_id} failed"
                     
                 # Still running, continue monitoring
-                await asyncio.sleep(check_interval)
+                error_attempt = 0
+                unchanged_polls = unchanged_polls + 1 if state == last_state else 0
+                last_state = state
+                await asyncio.sleep(_poll_interval(state, unchanged_polls))
                 
             except Exception as e:
                 logger.warning(f"Error checking DAG status: {e}")
-                await asyncio.sleep(check_interval)
+                error_attempt += 1
+                await asyncio.sleep(_error_backoff(error_attempt))
         
         logger.warning(f"Timeout waiting for DAG {current_dag_id} to complete")
         return f"Timeout monitoring {current_dag_id}"
@@ -1,11 +1,15 @@
-from typing import List, Optional
+from typing import Optional
 from dataclasses import dataclass
 
+from app.application.services.dataset_cache import (
+    get_dataset_cache,
+    publish_dataset_invalidation,
+)
 from app.domain.entities import Dataset
 from app.domain.repositories import UnitOfWork
 from app.domain.value_objects import DatasetId, UserId, DatasetPath
-from app.shared.exceptions import EntityNotFound, EntityAlreadyExists
-from app.shared.types import RecordingType
+from app.shared.exceptions import EntityNotFound
+from app.shared.types import PaginatedResult, RecordingType
 
 
 @dataclass
@@ -34,11 +38,6 @@ class DatasetUseCases:
     
     async def create_dataset(self, command: CreateDatasetCommand) -> Dataset:
         async with self.uow:
-            # Check if dataset name already exists
-            existing_dataset = await self.uow.datasets.get_by_name(command.name)
-            if existing_dataset:
-                raise EntityAlreadyExists("Dataset", "name", command.name)
-            
             # Validate creator exists if provided
             creator_id = None
             if command.created_by_id:
@@ -56,20 +55,35 @@ class DatasetUseCases:
                 created_by=creator_id,
             )
             
+            # A taken name is rejected by the unique constraint on insert
             created_dataset = await self.uow.datasets.create(dataset)
             await self.uow.commit()
             return created_dataset
     
     async def get_dataset_by_id(self, dataset_id: int) -> Dataset:
+        cache = get_dataset_cache()
+        dataset = cache.get_by_id(dataset_id)
+        if dataset:
+            return dataset
+        
         async with self.uow:
             dataset = await self.uow.datasets.get_by_id(DatasetId(dataset_id))
             if not dataset:
                 raise EntityNotFound("Dataset", str(dataset_id))
-            return dataset
+        cache.put(dataset)
+        return dataset
     
     async def get_dataset_by_name(self, name: str) -> Optional[Dataset]:
+        cache = get_dataset_cache()
+        dataset = cache.get_by_name(name)
+        if dataset:
+            return dataset
+        
         async with self.uow:
-            return await self.uow.datasets.get_by_name(name)
+            dataset = await self.uow.datasets.get_by_name(name)
+        if dataset:
+            cache.put(dataset)
+        return dataset
     
     async def update_dataset(self, command: UpdateDatasetCommand) -> Dataset:
         async with self.uow:
@@ -77,11 +91,8 @@ class DatasetUseCases:
             if not dataset:
                 raise EntityNotFound("Dataset", str(command.dataset_id))
             
-            # Check for name conflicts if name is being changed
+            # Name conflicts are rejected by the unique constraint on update
             if command.name and command.name != dataset.name:
-                existing_dataset = await self.uow.datasets.get_by_name(command.name)
-                if existing_dataset:
-                    raise EntityAlreadyExists("Dataset", "name", command.name)
                 dataset.name = command.name
             
             if command.description is not None:
@@ -97,7 +108,9 @@ class DatasetUseCases:
             
             updated_dataset = await self.uow.datasets.update(dataset)
             await self.uow.commit()
-            return updated_dataset
+        
+        await publish_dataset_invalidation(command.dataset_id)
+        return updated_dataset
     
     async def delete_dataset(self, dataset_id: int) -> bool:
         async with self.uow:
@@ -107,16 +120,21 @@ class DatasetUseCases:
             
             result = await self.uow.datasets.delete(DatasetId(dataset_id))
             await self.uow.commit()
-            return result
+        
+        await publish_dataset_invalidation(dataset_id)
+        return result
     
-    async def list_datasets(self, skip: int = 0, limit: int = 100) -> List[Dataset]:
+    async def list_datasets(self, skip: int = 0, limit: int = 100) -> PaginatedResult[Dataset]:
         async with self.uow:
-            return await self.uow.datasets.list_all(skip=skip, limit=limit)
+            items, total = await self.uow.datasets.list_all(skip=skip, limit=limit)
+        return PaginatedResult(items=items, total=total, skip=skip, limit=limit)
     
-    async def list_datasets_by_type(self, data_type: RecordingType, skip: int = 0, limit: int = 100) -> List[Dataset]:
+    async def list_datasets_by_type(self, data_type: RecordingType, skip: int = 0, limit: int = 100) -> PaginatedResult[Dataset]:
         async with self.uow:
-            return await self.uow.datasets.list_by_type(data_type, skip=skip, limit=limit)
+            items, total = await self.uow.datasets.list_by_type(data_type, skip=skip, limit=limit)
+        return PaginatedResult(items=items, total=total, skip=skip, limit=limit)
     
-    async def list_datasets_by_creator(self, creator_id: int, skip: int = 0, limit: int = 100) -> List[Dataset]:
+    async def list_datasets_by_creator(self, creator_id: int, skip: int = 0, limit: int = 100) -> PaginatedResult[Dataset]:
         async with self.uow:
-            return await self.uow.datasets.list_by_creator(UserId(creator_id), skip=skip, limit=limit)
\ No newline at end of file
+            items, total = await self.uow.datasets.list_by_creator(UserId(creator_id), skip=skip, limit=limit)
+        return PaginatedResult(items=items, total=total, skip=skip, limit=limit)
\ No newline at end of file
@@ -1,10 +1,10 @@
-from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional, Dict, Any
+from dataclasses import dataclass, replace
 
 from app.domain.entities import Task, Dataset
 from app.domain.repositories import UnitOfWork
 from app.domain.value_objects import TaskId, UserId, DatasetId, TaskConfiguration, VideoOutput
-from app.shared.exceptions import EntityNotFound, EntityAlreadyExists
+from app.shared.exceptions import EntityNotFound
 from app.shared.types import TaskStatus
 
 
@@ -61,11 +61,6 @@ class TaskUseCases:
     
     async def create_task(self, command: CreateTaskCommand) -> Task:
         async with self.uow:
-            # Check if task name already exists
-            existing_task = await self.uow.tasks.get_by_name(command.name)
-            if existing_task:
-                raise EntityAlreadyExists("Task", "name", command.name)
-            
             # Validate creator exists if provided
             creator_id = None
             if command.created_by_id:
@@ -131,11 +126,8 @@ class TaskUseCases:
             if not task:
                 raise EntityNotFound("Task", str(command.task_id))
             
-            # Check for name conflicts if name is being changed
-            if command.name and command.name != task.name:
-                existing_task = await self.uow.tasks.get_by_name(command.name)
-                if existing_task:
-                    raise EntityAlreadyExists("Task", "name", command.name)
+            # The unique name constraint rejects a rename onto an existing task
+            if command.name:
                 task.name = command.name
             
             # Update basic fields
@@ -148,20 +140,21 @@ class TaskUseCases:
             if command.log_out_path:
                 task.log_out_path = command.log_out_path
             
-            # Update build configuration
-            if any([command.branch_name is not None, command.commit_id is not None, 
-                   command.build_config is not None, command.build_config_customized is not None,
-                   command.build_config_custom_conf is not None, command.build_config_custom_ini is not None]):
-                
-                new_config = TaskConfiguration(
-                    branch_name=command.branch_name if command.branch_name is not None else task.configuration.branch_name,
-                    commit_id=command.commit_id if command.commit_id is not None else task.configuration.commit_id,
-                    build_config=command.build_config if command.build_config is not None else task.configuration.build_config,
-                    is_customized=command.build_config_customized if command.build_config_customized is not None else task.configuration.is_customized,
-                    custom_conf=command.build_config_custom_conf if command.build_config_custom_conf is not None else task.configuration.custom_conf,
-                    custom_ini=command.build_config_custom_ini if command.build_config_custom_ini is not None else task.configuration.custom_ini
+            # Update build configuration, keeping fields the command leaves unset
+            config_changes = {
+                field: value
+                for field, value in (
+                    ("branch_name", command.branch_name),
+                    ("commit_id", command.commit_id),
+                    ("build_config", command.build_config),
+                    ("is_customized", command.build_config_customized),
+                    ("custom_conf", command.build_config_custom_conf),
+                    ("custom_ini", command.build_config_custom_ini),
                 )
-                task.configuration = new_config
+                if value is not None
+            }
+            if config_changes:
+                task.configuration = replace(task.configuration, **config_changes)
             
             # Update dataset if provided
             if command.dataset_id is not None:
@@ -227,4 +220,25 @@ class TaskUseCases:
     
     async def list_tasks_by_dataset(self, dataset_id: int, skip: int = 0, limit: int = 100) -> List[Task]:
         async with self.uow:
-            return await self.uow.tasks.list_by_dataset(DatasetId(dataset_id), skip=skip, limit=limit)
\ No newline at end of file
+            return await self.uow.tasks.list_by_dataset(DatasetId(dataset_id), skip=skip, limit=limit)
+    
+    async def stream_tasks(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[TaskStatus] = None,
+        customer: Optional[str] = None,
+        creator_id: Optional[int] = None,
+        dataset_id: Optional[int] = None,
+    ) -> AsyncIterator[Task]:
+        """Yield tasks one at a time instead of building the whole page"""
+        async with self.uow:
+            async for task in self.uow.tasks.stream(
+                skip=skip,
+                limit=limit,
+                status=status,
+                customer=customer,
+                creator_id=UserId(creator_id) if creator_id else None,
+                dataset_id=DatasetId(dataset_id) if dataset_id else None,
+            ):
+                yield task
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from app.domain.entities import User
 from app.domain.repositories import UnitOfWork
 from app.domain.value_objects import UserId
-from app.shared.exceptions import EntityNotFound, EntityAlreadyExists, ValidationError
+from app.shared.exceptions import EntityNotFound, ValidationError
 
 
 @dataclass
@@ -32,16 +32,7 @@ class UserUseCases:
     
     async def create_user(self, command: CreateUserCommand) -> User:
         async with self.uow:
-            # Check if username already exists
-            existing_user = await self.uow.users.get_by_username(command.username)
-            if existing_user:
-                raise EntityAlreadyExists("User", "username", command.username)
-            
-            # Check if email already exists
-            existing_email = await self.uow.users.get_by_email(command.email)
-            if existing_email:
-                raise EntityAlreadyExists("User", "email", command.email)
-            
+            # Unique username and email constraints reject duplicates
             user = User(
                 id=None,
                 username=command.username,
@@ -73,18 +64,10 @@ class UserUseCases:
             if not user:
                 raise EntityNotFound("User", str(command.user_id))
             
-            # Check for username conflicts if username is being changed
-            if command.username and command.username != user.username:
-                existing_user = await self.uow.users.get_by_username(command.username)
-                if existing_user:
-                    raise EntityAlreadyExists("User", "username", command.username)
+            # Unique username and email constraints reject conflicting changes
+            if command.username:
                 user.username = command.username
-            
-            # Check for email conflicts if email is being changed
-            if command.email and command.email != user.email:
-                existing_email = await self.uow.users.get_by_email(command.email)
-                if existing_email:
-                    raise EntityAlreadyExists("User", "email", command.email)
+            if command.email:
                 user.email = command.email
             
             if command.name is not None:
@@ -96,6 +79,18 @@ class UserUseCases:
             await self.uow.commit()
             return updated_user
     
+    async def update_user_password(self, user_id: int, hashed_password: str) -> User:
+        async with self.uow:
+            user = await self.uow.users.get_by_id(UserId(user_id))
+            if not user:
+                raise EntityNotFound("User", str(user_id))
+            
+            user.hashed_password = hashed_password
+            
+            updated_user = await self.uow.users.update(user)
+            await self.uow.commit()
+            return updated_user
+    
     async def delete_user(self, user_id: int) -> bool:
         async with self.uow:
             user = await self.uow.users.get_by_id(UserId(user_id))
@@ -1,15 +1,41 @@
+import secrets
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from datetime import datetime
+from types import MappingProxyType
 
-from app.domain.entities import Workflow, WorkflowRun
-from app.domain.value_objects import WorkflowId, WorkflowRunId, UserId, WorkflowConfiguration
+from app.domain.entities import Dataset, Task, Workflow, WorkflowRun
+from app.domain.value_objects import (
+    DatasetId,
+    TaskId,
+    WorkflowId,
+    WorkflowRunId,
+    UserId,
+    WorkflowConfiguration,
+)
 from app.shared.types import WorkflowStatus, WorkflowTriggerType
 from app.shared.exceptions import EntityNotFound, ExternalServiceError
-from app.application.services.airflow_service import AirflowClient
+from app.application.services.airflow_service import get_airflow_client
+from app.core.serialization import parse_iso_datetime
 from app.application.services.event_service import WorkflowEventPublisher
 from app.infrastructure.repositories.unit_of_work import UnitOfWork
 
+# Airflow DAG run state -> WorkflowStatus; unknown states read as queued
+AIRFLOW_STATUS_MAP: Mapping[str, WorkflowStatus] = MappingProxyType(
+    {
+        "queued": WorkflowStatus.QUEUED,
+        "running": WorkflowStatus.RUNNING,
+        "success": WorkflowStatus.SUCCESS,
+        "failed": WorkflowStatus.FAILED,
+        "up_for_retry": WorkflowStatus.UP_FOR_RETRY,
+        "up_for_reschedule": WorkflowStatus.UP_FOR_RESCHEDULE,
+        "upstream_failed": WorkflowStatus.UPSTREAM_FAILED,
+        "skipped": WorkflowStatus.SKIPPED,
+        "removed": WorkflowStatus.REMOVED,
+        "scheduled": WorkflowStatus.SCHEDULED,
+    }
+)
+
 
 @dataclass
 class TriggerWorkflowCommand:
@@ -32,7 +58,7 @@ class CreateWorkflowCommand:
 class WorkflowUseCases:
     def __init__(self, uow: UnitOfWork, event_publisher: Optional[WorkflowEventPublisher] = None):
         self.uow = uow
-        self.airflow_client = AirflowClient()
+        self.airflow_client = get_airflow_client()
         self.event_publisher = event_publisher
 
     async def create_workflow(self, command: CreateWorkflowCommand) -> Workflow:
@@ -57,30 +83,14 @@ class WorkflowUseCases:
         workflow_id = WorkflowId(str(command.workflow_id))
         triggered_by = UserId(command.triggered_by) if command.triggered_by else None
         
-        # Get workflow and task data
-        async with self.uow:
-            workflow = await self.uow.workflows.get_by_id(workflow_id)
-            if not workflow:
-                raise EntityNotFound("Workflow", command.workflow_id)
-            
-            # Get task with full configuration
-            task = None
-            if command.task_id:
-                from app.domain.value_objects import TaskId
-                task = await self.uow.tasks.get_by_id(TaskId(command.task_id))
-                if not task:
-                    raise EntityNotFound("Task", str(command.task_id))
-            
-            # Get dataset information
-            dataset = None
-            if command.dataset_id:
-                from app.domain.value_objects import DatasetId
-                dataset = await self.uow.datasets.get_by_id(DatasetId(command.dataset_id))
-                if not dataset:
-                    raise EntityNotFound("Dataset", str(command.dataset_id))
+        # Get workflow, task and dataset data
+        workflow, task, dataset = await self._load_trigger_context(
+            workflow_id, command
+        )
         
-        # Generate DAG run ID
-        run_id = f"api_trigger_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Generate DAG run ID; the random suffix keeps triggers in the same
+        # second (e.g. a DAG chain stepping along) from colliding
+        run_id = f"api_trigger_{datetime.now():%Y%m%d_%H%M%S}_{secrets.token_hex(3)}"
         
         # Prepare comprehensive configuration for Airflow
         airflow_conf = {
@@ -90,40 +100,14 @@ class WorkflowUseCases:
             "triggered_by": command.triggered_by,
             "note": command.note
         }
-        
-        # Add task configuration if task exists
         if task:
-            airflow_conf["task_config"] = {
-                "name": task.name,
-                "description": task.description,
-                "customer": task.customer,
-                "status": task.status.value,
-                "log_out_path": task.log_out_path,
-                "build_config": {
-                    "branch_name": task.configuration.branch_name,
-                    "commit_id": task.configuration.commit_id,
-                    "build_config": task.configuration.build_config,
-                    "is_customized": task.configuration.is_customized,
-                    "custom_conf": task.configuration.custom_conf,
-                    "custom_ini": task.configuration.custom_ini
-                },
-                "video_output": {
-                    "enabled": task.video_output.enabled,
-                    "path": task.video_output.path if task.video_output.enabled else None
-                }
-            }
-        
-        # Add dataset configuration if dataset exists
+            airflow_conf["task_config"] = task.to_airflow_conf()
         if dataset:
-            airflow_conf["dataset_config"] = {
-                "name": dataset.name,
-                "description": dataset.description,
-                "path": dataset.paths.path,
-                "data_type": dataset.data_type.value,
-                "gt_path": dataset.paths.gt_path,
-                "created_at": dataset.created_at.isoformat() if dataset.created_at else None
-            }
+            airflow_conf["dataset_config"] = dataset.to_airflow_conf()
         
+        # The reads above have committed, so no transaction or pooled
+        # connection is held while Airflow is called; the session is
+        # reused for the single insert below
         try:
             # Trigger DAG in Airflow
             dag_run_response = await self.airflow_client.trigger_dag(
@@ -146,7 +130,7 @@ class WorkflowUseCases:
                 triggered_by=triggered_by,
                 external_trigger_id=dag_run_response["dag_run_id"],
                 note=command.note,
-                execution_date=datetime.fromisoformat(dag_run_response["execution_date"].replace('Z', '+00:00'))
+                execution_date=parse_iso_datetime(dag_run_response["execution_date"])
             )
             
             async with self.uow:
@@ -169,6 +153,31 @@ class WorkflowUseCases:
         except Exception as e:
             raise ExternalServiceError(f"Failed to trigger workflow: {str(e)}", "airflow")
 
+    async def _load_trigger_context(
+        self, workflow_id: WorkflowId, command: TriggerWorkflowCommand
+    ) -> Tuple[Workflow, Optional[Task], Optional[Dataset]]:
+        """Look up the workflow, task and dataset a trigger needs"""
+        # Sequential on the injected unit of work: a caller's enclosing
+        # transaction may hold a workflow it has not committed yet
+        async with self.uow:
+            workflow = await self.uow.workflows.get_by_id(workflow_id)
+            if not workflow:
+                raise EntityNotFound("Workflow", command.workflow_id)
+            
+            task = None
+            if command.task_id:
+                task = await self.uow.tasks.get_by_id(TaskId(command.task_id))
+                if not task:
+                    raise EntityNotFound("Task", str(command.task_id))
+            
+            dataset = None
+            if command.dataset_id:
+                dataset = await self.uow.datasets.get_by_id(DatasetId(command.dataset_id))
+                if not dataset:
+                    raise EntityNotFound("Dataset", str(command.dataset_id))
+        
+        return workflow, task, dataset
+
     async def get_workflow_run_status(self, workflow_id: str, run_id: str) -> WorkflowRun:
         workflow_run_id = WorkflowRunId(run_id)
         
@@ -195,17 +204,20 @@ class WorkflowUseCases:
                 workflow_run.update_status(airflow_status)
                 
                 if dag_run_response.get("start_date"):
-                    workflow_run.start_date = datetime.fromisoformat(
-                        dag_run_response["start_date"].replace('Z', '+00:00')
-                    )
+                    workflow_run.start_date = parse_iso_datetime(dag_run_response["start_date"])
                 
                 if dag_run_response.get("end_date"):
-                    workflow_run.end_date = datetime.fromisoformat(
-                        dag_run_response["end_date"].replace('Z', '+00:00')
-                    )
+                    workflow_run.end_date = parse_iso_datetime(dag_run_response["end_date"])
                 
+                # One guarded UPDATE on the same session; a no-op if a
+                # monitor already recorded this status
                 async with self.uow:
-                    await self.uow.workflow_runs.update(workflow_run)
+                    await self.uow.workflow_runs.transition_status(
+                        workflow_run_id,
+                        airflow_status,
+                        start_date=workflow_run.start_date,
+                        end_date=workflow_run.end_date,
+                    )
                     await self.uow.commit()
             
             return workflow_run
@@ -213,6 +225,64 @@ class WorkflowUseCases:
         except Exception as e:
             raise ExternalServiceError(f"Failed to get workflow status: {str(e)}", "airflow")
 
+    async def get_workflow_run_statuses(
+        self, workflow_id: str, run_ids: List[str]
+    ) -> List[WorkflowRun]:
+        """Refresh several runs with one Airflow request and one bulk UPDATE"""
+        async with self.uow:
+            workflow = await self.uow.workflows.get_by_id(WorkflowId(workflow_id))
+            if not workflow:
+                raise EntityNotFound("Workflow", workflow_id)
+            
+            workflow_runs = await self.uow.workflow_runs.get_by_ids(
+                WorkflowId(workflow_id), [WorkflowRunId(run_id) for run_id in run_ids]
+            )
+        
+        if not workflow_runs:
+            return []
+        
+        try:
+            dag_runs = await self.airflow_client.get_dag_runs_bulk(
+                workflow.dag_id, [run.id.value for run in workflow_runs]
+            )
+        except Exception as e:
+            raise ExternalServiceError(f"Failed to get workflow statuses: {str(e)}", "airflow")
+        
+        # Compute the deltas here and write them all in one statement
+        changes = []
+        for workflow_run in workflow_runs:
+            dag_run_response = dag_runs.get(workflow_run.id.value)
+            if not dag_run_response:
+                continue
+            
+            airflow_status = self._map_airflow_status(dag_run_response.get("state"))
+            if workflow_run.status == airflow_status:
+                continue
+            
+            workflow_run.update_status(airflow_status)
+            if dag_run_response.get("start_date"):
+                workflow_run.start_date = parse_iso_datetime(dag_run_response["start_date"])
+            if dag_run_response.get("end_date"):
+                workflow_run.end_date = parse_iso_datetime(dag_run_response["end_date"])
+            
+            changes.append(
+                (
+                    workflow_run.id,
+                    workflow_run.status,
+                    workflow_run.start_date,
+                    workflow_run.end_date,
+                )
+            )
+        
+        if changes:
+            async with self.uow:
+                await self.uow.workflow_runs.bulk_update_status(changes)
+                await self.uow.commit()
+        
+        # Answer in the order the runs were asked for
+        by_id = {run.id.value: run for run in workflow_runs}
+        return [by_id[run_id] for run_id in run_ids if run_id in by_id]
+
     async def list_workflow_runs(
         self, 
         workflow_id: str,
@@ -310,17 +380,6 @@ class WorkflowUseCases:
             )
             return await self.create_workflow(command)
 
-    def _map_airflow_status(self, airflow_state: str) -> WorkflowStatus:
-        mapping = {
-            "queued": WorkflowStatus.QUEUED,
-            "running": WorkflowStatus.RUNNING,
-            "success": WorkflowStatus.SUCCESS,
-            "failed": WorkflowStatus.FAILED,
-            "up_for_retry": WorkflowStatus.UP_FOR_RETRY,
-            "up_for_reschedule": WorkflowStatus.UP_FOR_RESCHEDULE,
-            "upstream_failed": WorkflowStatus.UPSTREAM_FAILED,
-            "skipped": WorkflowStatus.SKIPPED,
-            "removed": WorkflowStatus.REMOVED,
-            "scheduled": WorkflowStatus.SCHEDULED
-        }
-        return mapping.get(airflow_state, WorkflowStatus.QUEUED)
\ No newline at end of file
+    @staticmethod
+    def _map_airflow_status(airflow_state: str) -> WorkflowStatus:
+        return AIRFLOW_STATUS_MAP.get(airflow_state, WorkflowStatus.QUEUED)
@@ -1,5 +1,10 @@
+import asyncio
 import logging
+import threading
+from typing import Any, Coroutine, Optional
+
 from app.core.config import settings
+from app.core.serialization import ORJSON_AVAILABLE, json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +28,49 @@ except ImportError:
     celery_app = None
     CELERY_AVAILABLE = False
 
+# Task messages use orjson when it's installed; plain JSON payloads from
+# older producers are still accepted
+CELERY_SERIALIZER = "json"
+CELERY_ACCEPT_CONTENT = ["json"]
+if CELERY_AVAILABLE and ORJSON_AVAILABLE:
+    from kombu.serialization import register
+
+    register(
+        "orjson",
+        json_dumps,
+        json_loads,
+        content_type="application/x-orjson",
+        content_encoding="utf-8",
+    )
+    CELERY_SERIALIZER = "orjson"
+    # Only a registered serializer may be accepted, or the worker won't start
+    CELERY_ACCEPT_CONTENT = ["orjson", "json"]
+
+
+# Each worker process runs its coroutines on one long-lived event loop, so
+# loop-bound resources (HTTP pools, DB connections) survive across tasks
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_loop_lock = threading.Lock()
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Start the worker's event loop thread on first use"""
+    global _worker_loop
+    with _worker_loop_lock:
+        if _worker_loop is None or _worker_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="celery-event-loop", daemon=True
+            ).start()
+            _worker_loop = loop
+        return _worker_loop
+
+
+def run_coroutine(coro: Coroutine) -> Any:
+    """Run a coroutine to completion on the worker's event loop"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_worker_loop()).result()
+
+
 # Configuration (only if Celery is available)
 if CELERY_AVAILABLE and celery_app:
     celery_app.conf.update(
@@ -33,9 +81,9 @@ if CELERY_AVAILABLE and celery_app:
             "app.application.tasks.notification_tasks.*": {"queue": "notifications"},
         },
         # Task settings
-        task_serializer="json",
-        accept_content=["json"],
-        result_serializer="json",
+        task_serializer=CELERY_SERIALIZER,
+        accept_content=CELERY_ACCEPT_CONTENT,
+        result_serializer=CELERY_SERIALIZER,
         timezone="UTC",
         enable_utc=True,
         # Worker settings
@@ -48,6 +96,10 @@ if CELERY_AVAILABLE and celery_app:
                 "task": "app.application.tasks.workflow_tasks.monitor_active_workflows",
                 "schedule": 30.0,  # Run every 30 seconds
             },
+            "monitor-dag-chain-runs": {
+                "task": "app.application.tasks.dag_chain_tasks.monitor_all_active_dag_runs",
+                "schedule": 15.0,  # Run every 15 seconds
+            },
             "cleanup-completed-workflows": {
                 "task": "app.application.tasks.workflow_tasks.cleanup_completed_workflows",
                 "schedule": 300.0,  # Run every 5 minutes
@@ -84,6 +136,60 @@ if CELERY_AVAILABLE:
         # Fallback if signals are not available
         pass
 
+    try:
+        from celery.signals import worker_process_init, worker_process_shutdown
+
+        @worker_process_init.connect
+        def start_worker_loop(*args, **kwargs):
+            """Start the event loop after fork and connect Redis on it once"""
+            from app.core.redis import get_redis
+
+            _get_worker_loop()
+            try:
+                run_coroutine(get_redis())
+            except Exception as e:
+                # Tasks retry the connection through get_redis() on first use
+                logger.warning(f"Failed to connect Redis at worker start: {e}")
+
+        @worker_process_shutdown.connect
+        def close_worker_loop(*args, **kwargs):
+            """Flush buffered work, close the shared clients and stop the event loop"""
+            from app.application.services.airflow_service import get_airflow_client
+            from app.application.services.event_service import get_event_service
+            from app.application.services.status_writer import get_status_writer
+            from app.application.tasks.notification_tasks import (
+                flush_pending_notifications,
+            )
+            from app.core.redis import redis_client
+
+            # Children exit via os._exit, so atexit handlers never run here
+            try:
+                flush_pending_notifications()
+            except Exception as e:
+                logger.warning(f"Failed to flush pending notifications: {e}")
+
+            if _worker_loop is None:
+                return
+            try:
+                # Write queued status updates while the DB pool is still up
+                run_coroutine(get_status_writer().close())
+            except Exception as e:
+                logger.warning(f"Failed to flush status writer: {e}")
+            try:
+                run_coroutine(get_airflow_client().aclose())
+            except Exception as e:
+                logger.warning(f"Failed to close Airflow client: {e}")
+            try:
+                # Publish anything still queued before Redis goes away
+                run_coroutine(get_event_service().close())
+                run_coroutine(redis_client.disconnect())
+            except Exception as e:
+                logger.warning(f"Failed to close Redis client: {e}")
+            _worker_loop.call_soon_threadsafe(_worker_loop.stop)
+
+    except ImportError:
+        pass
+
 
 if __name__ == "__main__" and CELERY_AVAILABLE and celery_app:
     celery_app.start()
@@ -53,14 +53,33 @@ class Settings(BaseSettings):
             path=f"{values.get('POSTGRES_DB') or ''}",
         ).unicode_string()
 
+    # Connection pool, per process. Celery prefork children run one task
+    # at a time, so the defaults suit both the API and the workers.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 10.0  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds
+    DB_POOL_PRE_PING: bool = False
+
     # Security
     SECRET_KEY: str = "change-me-in-production"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
+    BCRYPT_ROUNDS: int = 10
 
     # Airflow
     AIRFLOW_URL: str = "http://localhost:8080"
     AIRFLOW_USERNAME: str = "admin"
     AIRFLOW_PASSWORD: str = "admin"
+    AIRFLOW_DAG_CACHE_TTL: float = 10.0  # seconds
+    AIRFLOW_MAX_CONCURRENCY: int = 16
+    AIRFLOW_CALLBACK_TOKEN: Optional[str] = None
+    DAG_MONITOR_BASE_INTERVAL: float = 2.0  # seconds
+    DAG_MONITOR_MAX_INTERVAL: float = 60.0  # seconds
+    DAG_MONITOR_MAX_WAIT_MINUTES: int = 60
+
+    # Datasets
+    DATASET_CACHE_SIZE: int = 1024
+    DATASET_CACHE_TTL: float = 60.0  # seconds
 
     # Redis
     REDIS_HOST: str = "localhost"
@@ -24,7 +24,7 @@ async def get_current_user_token(
 ) -> TokenData:
     """Extract and verify JWT token from Authorization header"""
     try:
-        token_data = auth_service.verify_token(credentials.credentials)
+        token_data = await auth_service.averify_token(credentials.credentials)
         return token_data
     except UnauthorizedError:
         raise HTTPException(
@@ -120,7 +120,7 @@ async def get_optional_current_user(
         return None
 
     try:
-        token_data = auth_service.verify_token(credentials.credentials)
+        token_data = await auth_service.averify_token(credentials.credentials)
         uow = SQLAlchemyUnitOfWork(db)
         async with uow:
             user = await uow.users.get_by_id(UserId(token_data.user_id))
@@ -142,7 +142,7 @@ def create_websocket_auth_dependency():
             return None
 
         try:
-            token_data = auth_service.verify_token(token)
+            token_data = await auth_service.averify_token(token)
             uow = SQLAlchemyUnitOfWork(db)
             async with uow:
                 user = await uow.users.get_by_id(UserId(token_data.user_id))
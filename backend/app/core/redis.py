@@ -1,9 +1,9 @@
 import redis.asyncio as redis
-from typing import Optional
-import json
+from typing import Dict, Optional, List, Tuple, Union
 import logging
 
 from app.core.config import settings
+from app.core.serialization import json_dumps, json_loads
 from app.core.retry import with_retry, REDIS_RETRY, redis_circuit_breaker
 
 logger = logging.getLogger(__name__)
@@ -49,16 +49,36 @@ class RedisClient:
 
     @with_retry(REDIS_RETRY)
     @redis_circuit_breaker
-    async def publish(self, channel: str, message: dict) -> None:
-        """Publish message to Redis channel"""
+    async def publish(self, channel: str, message: Union[dict, bytes]) -> None:
+        """Publish message to Redis channel; bytes are sent as already-encoded JSON"""
         try:
-            message_str = json.dumps(message)
-            await self.redis.publish(channel, message_str)
+            payload = message if isinstance(message, bytes) else json_dumps(message)
+            await self.redis.publish(channel, payload)
             logger.debug(f"Published to {channel}: {message}")
         except Exception as e:
             logger.error(f"Failed to publish to {channel}: {e}")
             raise
 
+    @with_retry(REDIS_RETRY)
+    @redis_circuit_breaker
+    async def publish_many(
+        self, messages: List[Tuple[str, Union[dict, bytes]]]
+    ) -> List[int]:
+        """Publish several messages in one pipelined round-trip; returns receiver counts"""
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for channel, message in messages:
+                    payload = (
+                        message if isinstance(message, bytes) else json_dumps(message)
+                    )
+                    pipe.publish(channel, payload)
+                receivers = await pipe.execute()
+            logger.debug(f"Published {len(messages)} messages")
+            return receivers
+        except Exception as e:
+            logger.error(f"Failed to publish {len(messages)} messages: {e}")
+            raise
+
     async def subscribe(self, channel: str):
         """Subscribe to Redis channel"""
         try:
@@ -73,7 +93,7 @@ class RedisClient:
     async def set_cache(self, key: str, value: dict, ttl: int = 3600) -> None:
         """Set cached value with TTL"""
         try:
-            value_str = json.dumps(value)
+            value_str = json_dumps(value)
             await self.redis.setex(key, ttl, value_str)
         except Exception as e:
             logger.error(f"Failed to set cache {key}: {e}")
@@ -84,12 +104,65 @@ class RedisClient:
         try:
             value_str = await self.redis.get(key)
             if value_str:
-                return json.loads(value_str)
+                return json_loads(value_str)
             return None
         except Exception as e:
             logger.error(f"Failed to get cache {key}: {e}")
             return None
 
+    async def set_cache_many(
+        self, items: List[Tuple[str, dict]], ttl: int = 3600
+    ) -> None:
+        """Set several cached values with TTL in one pipelined round-trip"""
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in items:
+                    pipe.setex(key, ttl, json_dumps(value))
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to set {len(items)} cache entries: {e}")
+            raise
+
+    async def get_cache_many(self, keys: List[str]) -> List[Optional[dict]]:
+        """Get several cached values with a single MGET"""
+        if not keys:
+            return []
+        try:
+            values = await self.redis.mget(keys)
+            return [json_loads(value) if value else None for value in values]
+        except Exception as e:
+            logger.error(f"Failed to get {len(keys)} cache entries: {e}")
+            return [None] * len(keys)
+
+    async def get_hash(self, key: str) -> Dict[str, str]:
+        """Get every field of a hash"""
+        try:
+            return await self.redis.hgetall(key)
+        except Exception as e:
+            logger.error(f"Failed to get hash {key}: {e}")
+            return {}
+
+    async def set_hash(self, key: str, mapping: Dict[str, str], ttl: int = 3600) -> None:
+        """Set hash fields and refresh the hash's TTL in one pipelined round-trip"""
+        if not mapping:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping=mapping)
+                pipe.expire(key, ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to set hash {key}: {e}")
+            raise
+
+    async def acquire_lock(self, key: str, ttl: int) -> bool:
+        """Take a best-effort lock with SET NX; False if someone holds it"""
+        try:
+            return bool(await self.redis.set(key, b"1", nx=True, ex=ttl))
+        except Exception as e:
+            logger.error(f"Failed to acquire lock {key}: {e}")
+            raise
+
     async def delete_cache(self, key: str) -> None:
         """Delete cached value"""
         try:
@@ -98,11 +171,26 @@ class RedisClient:
             logger.error(f"Failed to delete cache {key}: {e}")
             raise
 
+    async def delete_cache_many(self, keys: List[str], chunk_size: int = 1000) -> None:
+        """Delete several cached values with pipelined multi-key DELs"""
+        if not keys:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for start in range(0, len(keys), chunk_size):
+                    pipe.delete(*keys[start : start + chunk_size])
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to delete {len(keys)} cache entries: {e}")
+            raise
+
 
 # Global Redis client instance
 redis_client = RedisClient()
 
 
 async def get_redis() -> RedisClient:
-    """Dependency to get Redis client"""
+    """Dependency to get Redis client, connecting it on first use"""
+    if redis_client._redis is None:
+        await redis_client.connect()
     return redis_client
@@ -211,6 +211,10 @@ class CircuitBreaker:
 
         return wrapper
 
+    def is_open(self) -> bool:
+        """True while the breaker is rejecting calls"""
+        return self.state == "OPEN" and not self._should_attempt_reset()
+
     def _should_attempt_reset(self) -> bool:
         return (
             self.last_failure_time
@@ -0,0 +1,64 @@
+import json
+import sys
+from datetime import datetime
+from typing import Any
+
+# orjson is optional; fall back to the stdlib encoder when it isn't installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# ciso8601 is optional too; Python 3.9's fromisoformat can't read a "Z" suffix
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+
+    CISO8601_AVAILABLE = True
+except ImportError:
+    _parse_datetime = None
+    CISO8601_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+JSONDecodeError = json.JSONDecodeError
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode datetimes the way orjson does, for the stdlib fallback"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize obj to compact JSON bytes; datetimes become ISO 8601 strings"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+
+
+def json_loads(data: Any) -> Any:
+    """Deserialize JSON from bytes or str"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _fromisoformat_z(value: str) -> datetime:
+    """fromisoformat for Pythons before 3.11, which reject a "Z" suffix"""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+# parse_iso_datetime(value) parses an ISO 8601 timestamp, including
+# Airflow's "Z" UTC suffix. The parser is picked once at import rather than
+# on every timestamp.
+if CISO8601_AVAILABLE:
+    parse_iso_datetime = _parse_datetime
+elif sys.version_info >= (3, 11):
+    parse_iso_datetime = datetime.fromisoformat
+else:
+    parse_iso_datetime = _fromisoformat_z
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 from abc import ABC
 
 from app.shared.types import (
@@ -59,6 +59,18 @@ class Dataset(Entity):
         if not self.name or len(self.name.strip()) < 1:
             raise ValueError("Dataset name is required")
 
+    def to_airflow_conf(self) -> Dict[str, Any]:
+        """The dataset_config section of a DAG run conf"""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "path": self.paths.path,
+            "data_type": self.data_type.value,
+            "gt_path": self.paths.gt_path,
+            # Left as a datetime; the JSON encoder writes it as ISO 8601
+            "created_at": self.created_at,
+        }
+
 
 @dataclass
 class Task(Entity):
@@ -99,6 +111,30 @@ class Task(Entity):
     def disable_video_output(self) -> None:
         self.video_output = VideoOutput(False)
 
+    def to_airflow_conf(self) -> Dict[str, Any]:
+        """The task_config section of a DAG run conf"""
+        configuration = self.configuration
+        video_output = self.video_output
+        return {
+            "name": self.name,
+            "description": self.description,
+            "customer": self.customer,
+            "status": self.status.value,
+            "log_out_path": self.log_out_path,
+            "build_config": {
+                "branch_name": configuration.branch_name,
+                "commit_id": configuration.commit_id,
+                "build_config": configuration.build_config,
+                "is_customized": configuration.is_customized,
+                "custom_conf": configuration.custom_conf,
+                "custom_ini": configuration.custom_ini,
+            },
+            "video_output": {
+                "enabled": video_output.enabled,
+                "path": video_output.path if video_output.enabled else None,
+            },
+        }
+
 
 @dataclass
 class Workflow(Entity):
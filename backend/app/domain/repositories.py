@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Protocol
+from datetime import datetime
+from typing import AsyncIterator, Optional, List, Protocol, Tuple
 
 from app.domain.entities import User, Dataset, Task, Workflow, WorkflowRun
 from app.domain.value_objects import (
@@ -56,19 +57,21 @@ class DatasetRepository(ABC):
         pass
 
     @abstractmethod
-    async def list_all(self, skip: int = 0, limit: int = 100) -> List[Dataset]:
+    async def list_all(
+        self, skip: int = 0, limit: int = 100
+    ) -> Tuple[List[Dataset], int]:
         pass
 
     @abstractmethod
     async def list_by_type(
         self, data_type: RecordingType, skip: int = 0, limit: int = 100
-    ) -> List[Dataset]:
+    ) -> Tuple[List[Dataset], int]:
         pass
 
     @abstractmethod
     async def list_by_creator(
         self, creator_id: UserId, skip: int = 0, limit: int = 100
-    ) -> List[Dataset]:
+    ) -> Tuple[List[Dataset], int]:
         pass
 
     @abstractmethod
@@ -121,6 +124,18 @@ class TaskRepository(ABC):
     ) -> List[Task]:
         pass
 
+    @abstractmethod
+    def stream(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[TaskStatus] = None,
+        customer: Optional[str] = None,
+        creator_id: Optional[UserId] = None,
+        dataset_id: Optional[DatasetId] = None,
+    ) -> AsyncIterator[Task]:
+        pass
+
     @abstractmethod
     async def update(self, task: Task) -> Task:
         pass
@@ -165,16 +180,30 @@ class WorkflowRunRepository(ABC):
     async def get_by_id(self, run_id: WorkflowRunId) -> Optional[WorkflowRun]:
         pass
 
+    @abstractmethod
+    async def get_status(self, run_id: WorkflowRunId) -> Optional[WorkflowStatus]:
+        pass
+
     @abstractmethod
     async def get_by_workflow_id(
         self, workflow_id: WorkflowId, limit: int = 100, skip: int = 0
     ) -> List[WorkflowRun]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(
+        self, workflow_id: WorkflowId, run_ids: List[WorkflowRunId]
+    ) -> List[WorkflowRun]:
+        pass
+
     @abstractmethod
     async def list_by_status(self, statuses: List[WorkflowStatus]) -> List[WorkflowRun]:
         pass
 
+    @abstractmethod
+    async def list_completed_before(self, cutoff: datetime) -> List[WorkflowRun]:
+        pass
+
     @abstractmethod
     async def get_by_task_id(
         self, task_id: int, limit: int = 100, skip: int = 0
@@ -185,6 +214,32 @@ class WorkflowRunRepository(ABC):
     async def update(self, workflow_run: WorkflowRun) -> WorkflowRun:
         pass
 
+    @abstractmethod
+    async def transition_status(
+        self,
+        run_id: WorkflowRunId,
+        new_status: WorkflowStatus,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def transition_statuses(
+        self,
+        transitions: List[Tuple[WorkflowRunId, WorkflowStatus, Optional[datetime]]],
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def bulk_update_status(
+        self,
+        updates: List[
+            Tuple[WorkflowRunId, WorkflowStatus, Optional[datetime], Optional[datetime]]
+        ],
+    ) -> None:
+        pass
+
     @abstractmethod
     async def delete(self, run_id: WorkflowRunId) -> None:
         pass
@@ -0,0 +1,20 @@
+from sqlalchemy.exc import IntegrityError
+
+# SQLSTATE for unique_violation
+UNIQUE_VIOLATION = "23505"
+
+
+def is_unique_violation(error: IntegrityError) -> bool:
+    """Whether an IntegrityError came from a unique constraint or index"""
+    orig = error.orig
+    code = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    return code == UNIQUE_VIOLATION
+
+
+def is_unique_violation_on(error: IntegrityError, column: str) -> bool:
+    """Whether a unique violation was raised for the given column
+
+    Postgres names the duplicate key in the error detail, as in
+    'Key (email)=(...) already exists'.
+    """
+    return is_unique_violation(error) and f"({column})" in str(error.orig)
@@ -41,7 +41,7 @@ class DatasetModel(Base):
     __tablename__ = "datasets"
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(255), index=True, nullable=False)
+    name = Column(String(255), unique=True, index=True, nullable=False)
     description = Column(Text, nullable=True)
     path = Column(String(255), nullable=False)
     data_type = Column(String(50), nullable=False)  # RecordingType enum values
@@ -63,7 +63,7 @@ class TaskModel(Base):
     __tablename__ = "tasks"
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(255), index=True, nullable=False)
+    name = Column(String(255), unique=True, index=True, nullable=False)
     description = Column(Text, nullable=True)
     status = Column(String(64), index=True, nullable=False)  # TaskStatus enum values
     customer = Column(String(32), index=True, nullable=False)
@@ -1,12 +1,14 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 
 from app.domain.entities import Dataset
 from app.domain.repositories import DatasetRepository
 from app.domain.value_objects import DatasetId, UserId, DatasetPath
+from app.infrastructure.database.errors import is_unique_violation
 from app.infrastructure.database.models import DatasetModel
-from app.shared.exceptions import EntityNotFound
+from app.shared.exceptions import EntityAlreadyExists, EntityNotFound
 from app.shared.types import RecordingType
 
 
@@ -26,25 +28,29 @@ class SQLAlchemyDatasetRepository(DatasetRepository):
             created_by=UserId(model.created_by_id) if model.created_by_id else None,
         )
 
-    def _to_model(self, domain: Dataset) -> DatasetModel:
-        model = DatasetModel(
-            name=domain.name,
-            description=domain.description,
-            path=domain.paths.path,
-            gt_path=domain.paths.gt_path,
-            data_type=domain.data_type.value,
-            created_by_id=domain.created_by.value if domain.created_by else None,
-        )
-        if domain.id:
-            model.id = domain.id.value
-        return model
+    def _to_values(self, domain: Dataset) -> dict:
+        return {
+            "name": domain.name,
+            "description": domain.description,
+            "path": domain.paths.path,
+            "gt_path": domain.paths.gt_path,
+            "data_type": domain.data_type.value,
+        }
 
     async def create(self, dataset: Dataset) -> Dataset:
-        model = self._to_model(dataset)
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return self._to_domain(model)
+        """Insert a dataset; the unique name constraint rejects duplicates"""
+        values = self._to_values(dataset)
+        values["created_by_id"] = (
+            dataset.created_by.value if dataset.created_by else None
+        )
+        stmt = insert(DatasetModel).values(**values).returning(DatasetModel)
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError as e:
+            if is_unique_violation(e):
+                raise EntityAlreadyExists("Dataset", "name", dataset.name)
+            raise
+        return self._to_domain(result.scalar_one())
 
     async def get_by_id(self, dataset_id: DatasetId) -> Optional[Dataset]:
         result = await self.session.execute(
@@ -60,61 +66,68 @@ class SQLAlchemyDatasetRepository(DatasetRepository):
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
 
-    async def list_all(self, skip: int = 0, limit: int = 100) -> List[Dataset]:
+    async def _list_page(
+        self, condition, skip: int, limit: int
+    ) -> Tuple[List[Dataset], int]:
+        """Fetch a page and the total match count in one windowed query"""
+        stmt = select(DatasetModel, func.count().over().label("total"))
+        if condition is not None:
+            stmt = stmt.where(condition)
         result = await self.session.execute(
-            select(DatasetModel)
-            .offset(skip)
-            .limit(limit)
-            .order_by(DatasetModel.created_at.desc())
+            stmt.order_by(DatasetModel.created_at.desc()).offset(skip).limit(limit)
         )
-        models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
+        rows = result.all()
+        if rows:
+            return [self._to_domain(row[0]) for row in rows], rows[0].total
+
+        # A page past the end carries no window value; count separately
+        if skip == 0:
+            return [], 0
+        count_stmt = select(func.count()).select_from(DatasetModel)
+        if condition is not None:
+            count_stmt = count_stmt.where(condition)
+        return [], await self.session.scalar(count_stmt)
+
+    async def list_all(
+        self, skip: int = 0, limit: int = 100
+    ) -> Tuple[List[Dataset], int]:
+        return await self._list_page(None, skip, limit)
 
     async def list_by_type(
         self, data_type: RecordingType, skip: int = 0, limit: int = 100
-    ) -> List[Dataset]:
-        result = await self.session.execute(
-            select(DatasetModel)
-            .where(DatasetModel.data_type == data_type.value)
-            .offset(skip)
-            .limit(limit)
-            .order_by(DatasetModel.created_at.desc())
+    ) -> Tuple[List[Dataset], int]:
+        return await self._list_page(
+            DatasetModel.data_type == data_type.value, skip, limit
         )
-        models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
 
     async def list_by_creator(
         self, creator_id: UserId, skip: int = 0, limit: int = 100
-    ) -> List[Dataset]:
-        result = await self.session.execute(
-            select(DatasetModel)
-            .where(DatasetModel.created_by_id == creator_id.value)
-            .offset(skip)
-            .limit(limit)
-            .order_by(DatasetModel.created_at.desc())
+    ) -> Tuple[List[Dataset], int]:
+        return await self._list_page(
+            DatasetModel.created_by_id == creator_id.value, skip, limit
         )
-        models = result.scalars().all()
-        return [self._to_domain(model) for model in models]
 
     async def update(self, dataset: Dataset) -> Dataset:
+        """Update a dataset in one UPDATE ... RETURNING"""
         if not dataset.id:
             raise ValueError("Cannot update dataset without ID")
 
-        result = await self.session.execute(
-            select(DatasetModel).where(DatasetModel.id == dataset.id.value)
+        stmt = (
+            update(DatasetModel)
+            .where(DatasetModel.id == dataset.id.value)
+            .values(**self._to_values(dataset))
+            .returning(DatasetModel)
         )
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError as e:
+            if is_unique_violation(e):
+                raise EntityAlreadyExists("Dataset", "name", dataset.name)
+            raise
+
         model = result.scalar_one_or_none()
         if not model:
             raise EntityNotFound("Dataset", str(dataset.id.value))
-
-        model.name = dataset.name
-        model.description = dataset.description
-        model.path = dataset.paths.path
-        model.gt_path = dataset.paths.gt_path
-        model.data_type = dataset.data_type.value
-
-        await self.session.flush()
-        await self.session.refresh(model)
         return self._to_domain(model)
 
     async def delete(self, dataset_id: DatasetId) -> bool:
@@ -1,9 +1,10 @@
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 
-from app.domain.entities import Task
+from app.domain.entities import Dataset, Task
 from app.domain.repositories import TaskRepository
 from app.domain.value_objects import (
     TaskId,
@@ -12,16 +13,34 @@ from app.domain.value_objects import (
     TaskConfiguration,
     VideoOutput,
 )
+from app.infrastructure.database.errors import is_unique_violation
 from app.infrastructure.database.models import TaskModel, DatasetModel
-from app.shared.exceptions import EntityNotFound
+from app.shared.exceptions import EntityAlreadyExists, EntityNotFound
 from app.shared.types import TaskStatus
 
+# Rows fetched per round-trip when streaming, and per selectinload batch
+STREAM_BATCH_SIZE = 100
+
 
 class SQLAlchemyTaskRepository(TaskRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
     def _to_domain(self, model: TaskModel) -> Task:
+        dataset = None
+        if model.dataset:
+            from app.infrastructure.repositories.dataset_repository import (
+                SQLAlchemyDatasetRepository,
+            )
+
+            dataset_repo = SQLAlchemyDatasetRepository(self.session)
+            dataset = dataset_repo._to_domain(model.dataset)
+
+        return self._to_domain_with_dataset(model, dataset)
+
+    def _to_domain_with_dataset(
+        self, model: TaskModel, dataset: Optional[Dataset]
+    ) -> Task:
         configuration = TaskConfiguration(
             branch_name=model.branch_name,
             commit_id=model.commit_id,
@@ -35,15 +54,6 @@ class SQLAlchemyTaskRepository(TaskRepository):
             enabled=model.video_out_enabled, path=model.video_out_path
         )
 
-        dataset = None
-        if model.dataset:
-            from app.infrastructure.repositories.dataset_repository import (
-                SQLAlchemyDatasetRepository,
-            )
-
-            dataset_repo = SQLAlchemyDatasetRepository(self.session)
-            dataset = dataset_repo._to_domain(model.dataset)
-
         return Task(
             id=TaskId(model.id) if model.id else None,
             name=model.name,
@@ -58,38 +68,41 @@ class SQLAlchemyTaskRepository(TaskRepository):
             created_by=UserId(model.created_by_id) if model.created_by_id else None,
         )
 
-    def _to_model(self, domain: Task) -> TaskModel:
-        model = TaskModel(
-            name=domain.name,
-            description=domain.description,
-            status=domain.status.value,
-            customer=domain.customer,
-            branch_name=domain.configuration.branch_name,
-            commit_id=domain.configuration.commit_id,
-            build_config=domain.configuration.build_config,
-            build_config_customized=domain.configuration.is_customized,
-            build_config_custom_conf=domain.configuration.custom_conf,
-            build_config_custom_ini=domain.configuration.custom_ini,
-            dataset_id=(
+    def _to_values(self, domain: Task) -> dict:
+        return {
+            "name": domain.name,
+            "description": domain.description,
+            "status": domain.status.value,
+            "customer": domain.customer,
+            "branch_name": domain.configuration.branch_name,
+            "commit_id": domain.configuration.commit_id,
+            "build_config": domain.configuration.build_config,
+            "build_config_customized": domain.configuration.is_customized,
+            "build_config_custom_conf": domain.configuration.custom_conf,
+            "build_config_custom_ini": domain.configuration.custom_ini,
+            "dataset_id": (
                 domain.dataset.id.value
                 if domain.dataset and domain.dataset.id
                 else None
             ),
-            log_out_path=domain.log_out_path,
-            video_out_enabled=domain.video_output.enabled,
-            video_out_path=domain.video_output.path,
-            created_by_id=domain.created_by.value if domain.created_by else None,
-        )
-        if domain.id:
-            model.id = domain.id.value
-        return model
+            "log_out_path": domain.log_out_path,
+            "video_out_enabled": domain.video_output.enabled,
+            "video_out_path": domain.video_output.path,
+        }
 
     async def create(self, task: Task) -> Task:
-        model = self._to_model(task)
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model, ["dataset"])
-        return self._to_domain(model)
+        """Insert a task; the unique name constraint rejects duplicates"""
+        values = self._to_values(task)
+        values["created_by_id"] = task.created_by.value if task.created_by else None
+        stmt = insert(TaskModel).values(**values).returning(TaskModel)
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError as e:
+            if is_unique_violation(e):
+                raise EntityAlreadyExists("Task", "name", task.name)
+            raise
+        # The caller already holds the dataset the row now points at
+        return self._to_domain_with_dataset(result.scalar_one(), task.dataset)
 
     async def get_by_id(self, task_id: TaskId) -> Optional[Task]:
         result = await self.session.execute(
@@ -176,39 +189,58 @@ class SQLAlchemyTaskRepository(TaskRepository):
         models = result.scalars().all()
         return [self._to_domain(model) for model in models]
 
+    async def stream(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[TaskStatus] = None,
+        customer: Optional[str] = None,
+        creator_id: Optional[UserId] = None,
+        dataset_id: Optional[DatasetId] = None,
+    ) -> AsyncIterator[Task]:
+        """Yield matching tasks as rows arrive over a server-side cursor"""
+        stmt = select(TaskModel).options(selectinload(TaskModel.dataset))
+        if status:
+            stmt = stmt.where(TaskModel.status == status.value)
+        if customer:
+            stmt = stmt.where(TaskModel.customer == customer)
+        if creator_id:
+            stmt = stmt.where(TaskModel.created_by_id == creator_id.value)
+        if dataset_id:
+            stmt = stmt.where(TaskModel.dataset_id == dataset_id.value)
+        stmt = (
+            stmt.offset(skip)
+            .limit(limit)
+            .order_by(TaskModel.created_at.desc())
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+
+        result = await self.session.stream_scalars(stmt)
+        async for model in result:
+            yield self._to_domain(model)
+
     async def update(self, task: Task) -> Task:
+        """Update a task in one UPDATE ... RETURNING"""
         if not task.id:
             raise ValueError("Cannot update task without ID")
 
-        result = await self.session.execute(
-            select(TaskModel)
-            .options(selectinload(TaskModel.dataset))
+        stmt = (
+            update(TaskModel)
             .where(TaskModel.id == task.id.value)
+            .values(**self._to_values(task))
+            .returning(TaskModel)
         )
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError as e:
+            if is_unique_violation(e):
+                raise EntityAlreadyExists("Task", "name", task.name)
+            raise
+
         model = result.scalar_one_or_none()
         if not model:
             raise EntityNotFound("Task", str(task.id.value))
-
-        model.name = task.name
-        model.description = task.description
-        model.status = task.status.value
-        model.customer = task.customer
-        model.branch_name = task.configuration.branch_name
-        model.commit_id = task.configuration.commit_id
-        model.build_config = task.configuration.build_config
-        model.build_config_customized = task.configuration.is_customized
-        model.build_config_custom_conf = task.configuration.custom_conf
-        model.build_config_custom_ini = task.configuration.custom_ini
-        model.dataset_id = (
-            task.dataset.id.value if task.dataset and task.dataset.id else None
-        )
-        model.log_out_path = task.log_out_path
-        model.video_out_enabled = task.video_output.enabled
-        model.video_out_path = task.video_output.path
-
-        await self.session.flush()
-        await self.session.refresh(model, ["dataset"])
-        return self._to_domain(model)
+        return self._to_domain_with_dataset(model, task.dataset)
 
     async def delete(self, task_id: TaskId) -> bool:
         result = await self.session.execute(
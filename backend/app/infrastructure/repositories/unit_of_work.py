@@ -21,6 +21,8 @@ class SQLAlchemyUnitOfWork:
         self._tasks: Optional[SQLAlchemyTaskRepository] = None
         self._workflows: Optional[SQLAlchemyWorkflowRepository] = None
         self._workflow_runs: Optional[SQLAlchemyWorkflowRunRepository] = None
+        # Nested `async with uow` blocks join the outermost transaction
+        self._depth = 0
 
     @property
     def users(self) -> SQLAlchemyUserRepository:
@@ -53,15 +55,22 @@ class SQLAlchemyUnitOfWork:
         return self._workflow_runs
 
     async def __aenter__(self):
+        self._depth += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._depth -= 1
+        if self._depth:
+            return
         if exc_type is not None:
             await self.rollback()
         else:
             await self.commit()
 
     async def commit(self):
+        # Inside a nested block the outermost block commits
+        if self._depth > 1:
+            return
         await self.session.commit()
 
     async def rollback(self):
@@ -1,13 +1,17 @@
 from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
 
 from app.domain.entities import User
 from app.domain.repositories import UserRepository
 from app.domain.value_objects import UserId
+from app.infrastructure.database.errors import (
+    is_unique_violation,
+    is_unique_violation_on,
+)
 from app.infrastructure.database.models import UserModel
-from app.shared.exceptions import EntityNotFound
+from app.shared.exceptions import EntityAlreadyExists, EntityNotFound
 
 
 class SQLAlchemyUserRepository(UserRepository):
@@ -26,25 +30,32 @@ class SQLAlchemyUserRepository(UserRepository):
             created_at=model.created_at,
         )
 
-    def _to_model(self, domain: User) -> UserModel:
-        model = UserModel(
-            username=domain.username,
-            email=domain.email,
-            name=domain.name,
-            password_hash=domain.hashed_password,
-            is_active=domain.is_active,
-            is_superuser=domain.is_superuser,
-        )
-        if domain.id:
-            model.id = domain.id.value
-        return model
+    def _to_values(self, domain: User) -> dict:
+        return {
+            "username": domain.username,
+            "email": domain.email,
+            "name": domain.name,
+            "password_hash": domain.hashed_password,
+            "is_active": domain.is_active,
+            "is_superuser": domain.is_superuser,
+        }
+
+    def _already_exists(self, error: IntegrityError, user: User) -> Exception:
+        """Map a unique violation to the field it was raised for"""
+        if is_unique_violation_on(error, "email"):
+            return EntityAlreadyExists("User", "email", user.email)
+        if is_unique_violation(error):
+            return EntityAlreadyExists("User", "username", user.username)
+        return error
 
     async def create(self, user: User) -> User:
-        model = self._to_model(user)
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return self._to_domain(model)
+        """Insert a user; unique username and email constraints reject duplicates"""
+        stmt = insert(UserModel).values(**self._to_values(user)).returning(UserModel)
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError as e:
+            raise self._already_exists(e, user)
+        return self._to_domain(result.scalar_one())
 
     async def get_by_id(self, user_id: UserId) -> Optional[User]:
         result = await self.session.execute(
@@ -68,24 +79,24 @@ class SQLAlchemyUserRepository(UserRepository):
         return self._to_domain(model) if model else None
 
     async def update(self, user: User) -> User:
+        """Update a user in one UPDATE ... RETURNING"""
         if not user.id:
             raise ValueError("Cannot update user without ID")
 
-        result = await self.session.execute(
-            select(UserModel).where(UserModel.id == user.id.value)
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user.id.value)
+            .values(**self._to_values(user))
+            .returning(UserModel)
         )
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError as e:
+            raise self._already_exists(e, user)
+
         model = result.scalar_one_or_none()
         if not model:
             raise EntityNotFound("User", str(user.id.value))
-
-        model.username = user.username
-        model.email = user.email
-        model.name = user.name
-        model.is_active = user.is_active
-        model.is_superuser = user.is_superuser
-
-        await self.session.flush()
-        await self.session.refresh(model)
         return self._to_domain(model)
 
     async def delete(self, user_id: UserId) -> bool:
@@ -1,6 +1,7 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.orm import selectinload
 
 from app.domain.entities import Workflow, WorkflowRun
@@ -144,6 +145,15 @@ class SQLAlchemyWorkflowRunRepository(WorkflowRunRepository):
         model = result.scalar_one_or_none()
         return self._to_domain(model) if model else None
 
+    async def get_status(self, run_id: WorkflowRunId) -> Optional[WorkflowStatus]:
+        """Read only the status column, without loading the run"""
+        stmt = select(WorkflowRunModel.status).where(
+            WorkflowRunModel.id == run_id.value
+        )
+        result = await self.session.execute(stmt)
+        status = result.scalar_one_or_none()
+        return WorkflowStatus(status) if status else None
+
     async def get_by_workflow_id(
         self, workflow_id: WorkflowId, limit: int = 100, skip: int = 0
     ) -> List[WorkflowRun]:
@@ -158,6 +168,20 @@ class SQLAlchemyWorkflowRunRepository(WorkflowRunRepository):
         models = result.scalars().all()
         return [self._to_domain(model) for model in models]
 
+    async def get_by_ids(
+        self, workflow_id: WorkflowId, run_ids: List[WorkflowRunId]
+    ) -> List[WorkflowRun]:
+        """Get the given runs of one workflow in a single query"""
+        if not run_ids:
+            return []
+        stmt = select(WorkflowRunModel).where(
+            WorkflowRunModel.workflow_id == int(workflow_id.value),
+            WorkflowRunModel.id.in_([run_id.value for run_id in run_ids]),
+        )
+        result = await self.session.execute(stmt)
+        models = result.scalars().all()
+        return [self._to_domain(model) for model in models]
+
     async def list_by_status(self, statuses: List[WorkflowStatus]) -> List[WorkflowRun]:
         status_values = [status.value for status in statuses]
         stmt = select(WorkflowRunModel).where(
@@ -167,6 +191,22 @@ class SQLAlchemyWorkflowRunRepository(WorkflowRunRepository):
         models = result.scalars().all()
         return [self._to_domain(model) for model in models]
 
+    async def list_completed_before(self, cutoff: datetime) -> List[WorkflowRun]:
+        """Get finished workflow runs that ended before cutoff"""
+        stmt = select(WorkflowRunModel).where(
+            WorkflowRunModel.status.in_(
+                [
+                    WorkflowStatus.SUCCESS.value,
+                    WorkflowStatus.FAILED.value,
+                    WorkflowStatus.REMOVED.value,
+                ]
+            ),
+            WorkflowRunModel.end_date < cutoff,
+        )
+        result = await self.session.execute(stmt)
+        models = result.scalars().all()
+        return [self._to_domain(model) for model in models]
+
     async def get_by_task_id(
         self, task_id: int, limit: int = 100, skip: int = 0
     ) -> List[WorkflowRun]:
@@ -204,6 +244,115 @@ class SQLAlchemyWorkflowRunRepository(WorkflowRunRepository):
         await self.session.execute(stmt)
         return workflow_run
 
+    async def transition_status(
+        self,
+        run_id: WorkflowRunId,
+        new_status: WorkflowStatus,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> bool:
+        """Move a run to new_status in one UPDATE; False if it was already there"""
+        values = {"status": new_status.value}
+        if start_date:
+            values["start_date"] = func.coalesce(WorkflowRunModel.start_date, start_date)
+        if end_date:
+            values["end_date"] = end_date
+
+        stmt = (
+            update(WorkflowRunModel)
+            .where(
+                WorkflowRunModel.id == run_id.value,
+                WorkflowRunModel.status != new_status.value,
+            )
+            .values(**values)
+            .returning(WorkflowRunModel.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def transition_statuses(
+        self,
+        transitions: List[Tuple[WorkflowRunId, WorkflowStatus, Optional[datetime]]],
+    ) -> None:
+        """Apply many non-terminal status updates with a single executemany"""
+        if not transitions:
+            return
+
+        table = WorkflowRunModel.__table__
+        stmt = (
+            update(table)
+            .where(
+                table.c.id == bindparam("run_id"),
+                table.c.status != bindparam("new_status"),
+                # A late progress update must never reopen a finished run
+                table.c.status.notin_(
+                    [WorkflowStatus.SUCCESS.value, WorkflowStatus.FAILED.value]
+                ),
+            )
+            .values(
+                status=bindparam("new_status"),
+                start_date=func.coalesce(
+                    table.c.start_date,
+                    bindparam("new_start_date", type_=table.c.start_date.type),
+                ),
+            )
+        )
+        # Core-level execute so SQLAlchemy runs a plain executemany rather
+        # than an ORM bulk update by primary key
+        connection = await self.session.connection()
+        await connection.execute(
+            stmt,
+            [
+                {
+                    "run_id": run_id.value,
+                    "new_status": status.value,
+                    "new_start_date": start_date,
+                }
+                for run_id, status, start_date in transitions
+            ],
+        )
+
+    async def bulk_update_status(
+        self,
+        updates: List[
+            Tuple[WorkflowRunId, WorkflowStatus, Optional[datetime], Optional[datetime]]
+        ],
+    ) -> None:
+        """Write (run_id, status, start_date, end_date) rows with a single executemany"""
+        if not updates:
+            return
+
+        table = WorkflowRunModel.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("run_id"))
+            .values(
+                status=bindparam("new_status"),
+                # Dates Airflow has not reported yet keep their stored value
+                start_date=func.coalesce(
+                    bindparam("new_start_date", type_=table.c.start_date.type),
+                    table.c.start_date,
+                ),
+                end_date=func.coalesce(
+                    bindparam("new_end_date", type_=table.c.end_date.type),
+                    table.c.end_date,
+                ),
+            )
+        )
+        connection = await self.session.connection()
+        await connection.execute(
+            stmt,
+            [
+                {
+                    "run_id": run_id.value,
+                    "new_status": status.value,
+                    "new_start_date": start_date,
+                    "new_end_date": end_date,
+                }
+                for run_id, status, start_date, end_date in updates
+            ],
+        )
+
     async def delete(self, run_id: WorkflowRunId) -> None:
         stmt = select(WorkflowRunModel).where(WorkflowRunModel.id == run_id.value)
         result = await self.session.execute(stmt)
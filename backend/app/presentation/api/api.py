@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.presentation.api import users, datasets, tasks, workflows, auth, notifications
+from app.presentation.api import users, datasets, tasks, workflows, auth, notifications, internal
 from app.presentation.websocket import endpoints as websocket_endpoints
 
 api_router = APIRouter()
@@ -11,6 +11,7 @@ api_router.include_router(datasets.router)
 api_router.include_router(tasks.router)
 api_router.include_router(workflows.router)
 api_router.include_router(notifications.router)
+api_router.include_router(internal.router)
 api_router.include_router(websocket_endpoints.router)
 
 
@@ -1,11 +1,11 @@
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.security import OAuth2PasswordRequestForm, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, EmailStr, Field
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user, get_current_active_user
+from app.core.dependencies import get_current_user, get_current_active_user, security
 from app.core.rate_limit import auth_rate_limit, api_rate_limit
 from app.application.services.auth_service import AuthService, Token, get_auth_service
 from app.application.use_cases.user_use_cases import UserUseCases, CreateUserCommand
@@ -72,7 +72,9 @@ async def login(
         user = await use_cases.get_user_by_username(login_data.username)
 
         # Verify password
-        if not auth_service.verify_password(login_data.password, user.hashed_password):
+        if not await auth_service.averify_password(
+            login_data.password, user.hashed_password
+        ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password",
@@ -87,6 +89,13 @@ async def login(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        # Upgrade hashes made with a different bcrypt cost
+        if auth_service.needs_rehash(user.hashed_password):
+            new_hashed_password = await auth_service.aget_password_hash(
+                login_data.password
+            )
+            await use_cases.update_user_password(user.id.value, new_hashed_password)
+
         # Generate scopes based on user permissions
         scopes = ["user:read"]
         if user.is_superuser:
@@ -130,7 +139,9 @@ async def login_oauth2(
         user = await use_cases.get_user_by_username(form_data.username)
 
         # Verify password
-        if not auth_service.verify_password(form_data.password, user.hashed_password):
+        if not await auth_service.averify_password(
+            form_data.password, user.hashed_password
+        ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password",
@@ -145,6 +156,13 @@ async def login_oauth2(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        # Upgrade hashes made with a different bcrypt cost
+        if auth_service.needs_rehash(user.hashed_password):
+            new_hashed_password = await auth_service.aget_password_hash(
+                form_data.password
+            )
+            await use_cases.update_user_password(user.id.value, new_hashed_password)
+
         # Generate scopes
         scopes = form_data.scopes or ["user:read"]
         if user.is_superuser:
@@ -199,7 +217,7 @@ async def register(
         auth_service.validate_password_strength(register_data.password)
 
         # Hash password
-        hashed_password = auth_service.get_password_hash(register_data.password)
+        hashed_password = await auth_service.aget_password_hash(register_data.password)
 
         # Create user
         command = CreateUserCommand(
@@ -249,7 +267,7 @@ async def change_password(
     """Change user password"""
     try:
         # Verify current password
-        if not auth_service.verify_password(
+        if not await auth_service.averify_password(
             password_data.current_password, current_user.hashed_password
         ):
             raise HTTPException(
@@ -261,7 +279,9 @@ async def change_password(
         auth_service.validate_password_strength(password_data.new_password)
 
         # Hash new password
-        new_hashed_password = auth_service.get_password_hash(password_data.new_password)
+        new_hashed_password = await auth_service.aget_password_hash(
+            password_data.new_password
+        )
 
         # Update password
         await use_cases.update_user_password(current_user.id.value, new_hashed_password)
@@ -301,8 +321,13 @@ async def refresh_token(
 
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_active_user)):
-    """Logout user (client should discard token)"""
+async def logout(
+    current_user: User = Depends(get_current_active_user),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    auth_service: AuthService = Depends(get_auth_service),
+):
+    """Logout user; the token is rejected by every worker until it expires"""
+    await auth_service.arevoke_token(credentials.credentials)
     return {"message": "Successfully logged out"}
 
 
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -135,6 +135,7 @@ async def delete_dataset(
 
 @router.get("/", response_model=List[DatasetResponse])
 async def list_datasets(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     data_type: Optional[RecordingType] = None,
@@ -142,15 +143,18 @@ async def list_datasets(
     use_cases: DatasetUseCases = Depends(get_dataset_use_cases),
 ):
     if data_type:
-        datasets = await use_cases.list_datasets_by_type(
+        page = await use_cases.list_datasets_by_type(
             data_type, skip=skip, limit=limit
         )
     elif creator_id:
-        datasets = await use_cases.list_datasets_by_creator(
+        page = await use_cases.list_datasets_by_creator(
             creator_id, skip=skip, limit=limit
         )
     else:
-        datasets = await use_cases.list_datasets(skip=skip, limit=limit)
+        page = await use_cases.list_datasets(skip=skip, limit=limit)
+
+    # Keep the body a plain list for existing clients; the total rides along
+    response.headers["X-Total-Count"] = str(page.total)
 
     return [
         DatasetResponse(
@@ -164,5 +168,5 @@ async def list_datasets(
             updated_at=dataset.updated_at,
             created_by_id=dataset.created_by.value if dataset.created_by else None,
         )
-        for dataset in datasets
+        for dataset in page.items
     ]
@@ -0,0 +1,43 @@
+import secrets
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException, status
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+router = APIRouter(prefix="/internal/airflow", tags=["internal"])
+
+
+class DagRunFinished(BaseModel):
+    dag_id: str
+    dag_run_id: str
+    state: str
+    end_date: Optional[str] = None
+
+
+@router.post("/dagrun-finished", status_code=status.HTTP_202_ACCEPTED)
+async def dag_run_finished(
+    payload: DagRunFinished,
+    x_svops_token: Optional[str] = Header(None),
+):
+    """Completion callback from Airflow DAG runs"""
+    # Fail closed: without a configured token nobody may call this
+    if not settings.AIRFLOW_CALLBACK_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Airflow callbacks are not configured",
+        )
+    if not x_svops_token or not secrets.compare_digest(
+        x_svops_token.encode(), settings.AIRFLOW_CALLBACK_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid callback token",
+        )
+
+    from app.application.tasks.dag_chain_tasks import handle_dag_run_finished
+
+    handle_dag_run_finished.delay(
+        payload.dag_id, payload.dag_run_id, payload.state, payload.end_date
+    )
+    return {"status": "accepted"}
@@ -1,12 +1,13 @@
 import logging
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from typing import AsyncIterator, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
-from app.core.database import get_db
+from app.core.database import AsyncSessionLocal, get_db
 from app.application.use_cases.task_use_cases import (
     TaskUseCases,
     CreateTaskCommand,
@@ -33,6 +34,9 @@ from app.domain.entities import User
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+# Clients that send this in Accept get task lists streamed one JSON per line
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 # Import DAG chain from central location
 from app.application.tasks.dag_chain_tasks import DAG_EXECUTION_CHAIN
 
@@ -49,6 +53,16 @@ class TaskExecutionResponse(BaseModel):
     message: str
 
 
+async def _stream_tasks_ndjson(**kwargs) -> AsyncIterator[bytes]:
+    """Encode tasks as NDJSON lines while later rows are still being fetched"""
+    # The request's session is closed before a streamed body is sent, so
+    # the stream reads through a session of its own
+    async with AsyncSessionLocal() as db:
+        use_cases = TaskUseCases(SQLAlchemyUnitOfWork(db))
+        async for task in use_cases.stream_tasks(**kwargs):
+            yield _task_to_response(task).model_dump_json().encode() + b"\n"
+
+
 def get_task_use_cases(db: AsyncSession = Depends(get_db)) -> TaskUseCases:
     uow = SQLAlchemyUnitOfWork(db)
     return TaskUseCases(uow)
@@ -200,6 +214,7 @@ async def delete_task(
 
 @router.get("/", response_model=List[TaskResponse])
 async def list_tasks(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status_filter: Optional[TaskStatus] = Query(None, alias="status"),
@@ -208,6 +223,22 @@ async def list_tasks(
     dataset_id: Optional[int] = None,
     use_cases: TaskUseCases = Depends(get_task_use_cases),
 ):
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        # Only the first filter applies, as in the list branches below
+        filters = {}
+        if status_filter:
+            filters["status"] = status_filter
+        elif customer:
+            filters["customer"] = customer
+        elif creator_id:
+            filters["creator_id"] = creator_id
+        elif dataset_id:
+            filters["dataset_id"] = dataset_id
+        return StreamingResponse(
+            _stream_tasks_ndjson(skip=skip, limit=limit, **filters),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
+
     if status_filter:
         tasks = await use_cases.list_tasks_by_status(
             status_filter, skip=skip, limit=limit
@@ -34,7 +34,7 @@ async def create_user(
 ):
     try:
         # Hash the password using auth service
-        hashed_password = auth_service.get_password_hash(user_data.password)
+        hashed_password = await auth_service.aget_password_hash(user_data.password)
 
         command = CreateUserCommand(
             username=user_data.username,
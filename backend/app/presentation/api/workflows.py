@@ -179,6 +179,27 @@ async def list_workflow_runs(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.get("/{workflow_id}/runs/status", response_model=List[WorkflowRunResponse])
+async def get_workflow_run_statuses(
+    workflow_id: str,
+    run_id: List[str] = Query(..., min_length=1, max_length=100),
+    current_user: User = Depends(get_current_active_user),
+    use_cases: WorkflowUseCases = Depends(get_workflow_use_cases),
+    _: None = Depends(require_workflow_read),
+):
+    """Refresh several runs at once; pass run_id once per run"""
+    try:
+        workflow_runs = await use_cases.get_workflow_run_statuses(workflow_id, run_id)
+        return [_workflow_run_to_response(run) for run in workflow_runs]
+
+    except EntityNotFound:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Workflow not found"
+        )
+    except ExternalServiceError as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(e))
+
+
 @router.get("/{workflow_id}/runs/{run_id}", response_model=WorkflowRunResponse)
 async def get_workflow_run(
     workflow_id: str,
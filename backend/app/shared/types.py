@@ -1,7 +1,19 @@
-from typing import TypeVar
+from dataclasses import dataclass
+from typing import Generic, List, TypeVar
 from enum import Enum
 
 EntityId = TypeVar("EntityId")
+T = TypeVar("T")
+
+
+@dataclass
+class PaginatedResult(Generic[T]):
+    """One page of items together with the total number of matches"""
+
+    items: List[T]
+    total: int
+    skip: int
+    limit: int
 
 
 class RecordingType(str, Enum):
@@ -10,9 +10,40 @@ from pathlib import Path
 # Add the app directory to Python path
 sys.path.append(str(Path(__file__).parent))
 
+from sqlalchemy import text
+
 from app.core.database import engine
 from app.infrastructure.database.models import Base
 
+# create_all never changes an existing table, so indexes the models made
+# unique after a database was first created are rebuilt here
+UNIQUE_INDEXES = {
+    "ix_datasets_name": ("datasets", "name"),
+    "ix_tasks_name": ("tasks", "name"),
+}
+
+
+async def ensure_unique_indexes(conn):
+    """Rebuild model-declared unique indexes that an older schema left non-unique"""
+    for index_name, (table, column) in UNIQUE_INDEXES.items():
+        is_unique = await conn.scalar(
+            text(
+                "SELECT i.indisunique FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :name"
+            ),
+            {"name": index_name},
+        )
+        if is_unique:
+            continue
+
+        # Fails, rolling back the drop, while duplicate values remain
+        print(f"Making {index_name} unique...")
+        await conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+        await conn.execute(
+            text(f"CREATE UNIQUE INDEX {index_name} ON {table} ({column})")
+        )
+
 
 async def create_tables():
     """Create all database tables"""
@@ -22,6 +53,7 @@ async def create_tables():
         # Create all tables
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await ensure_unique_indexes(conn)
         
         print("✅ Database tables created successfully!")
         
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
@@ -5,6 +7,11 @@ from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.core.database import engine
 from app.core.redis import redis_client
+from app.application.services.airflow_service import airflow_client
+from app.application.services.auth_service import auth_service
+from app.application.services.dataset_cache import listen_for_dataset_invalidations
+from app.application.services.event_service import get_event_service
+from app.application.services.notification_service import notification_service
 from app.core.error_handlers import setup_exception_handlers
 from app.core.rate_limit import setup_rate_limiting
 from app.presentation.api.api import api_router
@@ -20,16 +27,43 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"Failed to connect to Redis: {e}")
 
+    await auth_service.warmup()
+
+    invalidation_listener = asyncio.create_task(
+        listen_for_dataset_invalidations(redis_client)
+    )
+
     yield
 
     # Shutdown
     print("Shutting down...")
+    invalidation_listener.cancel()
+    try:
+        await get_event_service().close()
+        print("Pending events flushed")
+    except Exception as e:
+        print(f"Failed to flush pending events: {e}")
+
     try:
         await redis_client.disconnect()
         print("Redis disconnected")
     except Exception as e:
         print(f"Failed to disconnect from Redis: {e}")
 
+    try:
+        await airflow_client.aclose()
+        print("Airflow client closed")
+    except Exception as e:
+        print(f"Failed to close Airflow client: {e}")
+
+    try:
+        await notification_service.aclose()
+        print("Notification client closed")
+    except Exception as e:
+        print(f"Failed to close notification client: {e}")
+
+    auth_service.shutdown()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -45,6 +79,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count"],
 )
 
 # Set up exception handlers
@@ -72,23 +72,7 @@ fi
 
 # Run database migrations/initialization if needed
 echo "📊 Ensuring database schema is up to date..."
-docker-compose run --rm backend python -c "
-import asyncio
-from app.core.database import engine
-from app.infrastructure.database.models import Base
-
-async def ensure_tables():
-    try:
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        print('✅ Database schema updated')
-    except Exception as e:
-        print(f'❌ Error updating schema: {e}')
-    finally:
-        await engine.dispose()
-
-asyncio.run(ensure_tables())
-"
+docker-compose run --rm backend python create_tables.py
 
 # Start application services
 echo "🚀 Starting application services..."